@@ -1,12 +1,12 @@
-from controller import Robot, Motor, Keyboard
 from rover_api import RoverAPI
-import time
+from robot_backend import create_robot
+from controller_telemetry import TelemetryWorker, StepJitter
 import math
 
 class RovXController:
-    def __init__(self):
-        # Initialize the Webots robot
-        self.robot = Robot()
+    def __init__(self, robot=None, api=None, telemetry_interval=1.0):
+        # Initialize the Webots robot (or an injected stand-in such as HeadlessRobot)
+        self.robot = robot if robot else create_robot()
         self.timestep = int(self.robot.getBasicTimeStep())
         
         # Initialize keyboard
@@ -31,8 +31,11 @@ class RovXController:
         self.left_back.setVelocity(0)
         self.right_back.setVelocity(0)
         
-        # Initialize the API
-        self.api = RoverAPI()
+        # Initialize the API; polling and commands run off the step loop
+        self.api = api if api else RoverAPI()
+        self.telemetry = TelemetryWorker(self.api, interval=telemetry_interval)
+        self.outbox = self.api.outbox  # Moves coalesce; stops jump ahead of them
+        self.step_jitter = StepJitter(self.timestep)
         
         # Motor speed constants
         self.MAX_SPEED = 6.28  # Maximum motor speed in rad/s
@@ -41,7 +44,7 @@ class RovXController:
         # Position tracking
         self.position = [0, 0]  # [x, z]
         self.battery = 100
-        self.last_update = time.time()
+        self.last_update = self.robot.getTime()  # Simulated seconds, so headless runs drain too
         
         # Battery and recharge settings
         self.is_recharging = False
@@ -104,6 +107,9 @@ class RovXController:
         elif direction == 'stop':
             self.stop()
             
+        if direction in ('forward', 'backward', 'left', 'right') and not self.is_recharging and self.battery > 0:
+            self.api.queue_move_command(direction)
+            
         # Update position and battery
         self.update_status(direction)
             
@@ -111,6 +117,7 @@ class RovXController:
         """Stop all motors"""
         self.set_speeds(0, 0)
         self.current_direction = None
+        self.api.queue_stop_command()
         
     def update_battery(self, time_delta):
         """Update battery level and handle recharging"""
@@ -133,7 +140,7 @@ class RovXController:
         
     def update_status(self, direction):
         """Update position and battery based on movement"""
-        current_time = time.time()
+        current_time = self.robot.getTime()
         time_delta = current_time - self.last_update
         
         # Update battery
@@ -159,13 +166,28 @@ class RovXController:
         print(f"Battery: {self.battery:.1f}%")
         print(f"Position: [{self.position[0]:.1f}, {self.position[1]:.1f}]")
         print(f"Status: {'Recharging' if self.is_recharging else 'Moving ' + self.current_direction if self.current_direction else 'idle'}")
+        status, age = self.telemetry.latest()
+        if status:
+            print(f"Backend: {status['status']}, battery {status['battery']}% ({age:.1f}s ago)")
+        print(self.step_jitter.report())
         
     def run(self):
         """Main control loop"""
         print("RovX controller starting...")
         self.print_menu()
-        
+        self.telemetry.start()
+        try:
+            self.control_loop()
+        finally:
+            self.telemetry.stop()
+            self.outbox.close()
+            print(self.step_jitter.report())
+            
+    def control_loop(self):
+        """Handle key presses, once per robot step"""
         while self.robot.step(self.timestep) != -1:
+            self.step_jitter.mark()
+            
             # Get keyboard input
             key = self.keyboard.getKey()
             
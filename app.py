@@ -1,302 +1,61 @@
 import os
 import json
-import time
-from datetime import datetime
+import math
+import atexit
+import asyncio
 import random
 import threading
-from flask import Flask, render_template, request, jsonify, send_from_directory
+import hashlib
+import re
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 from flask_socketio import SocketIO
-import requests
 from rover_simulation import RoverSimulation
-
-# Base URL for the API
-BASE_URL = "https://roverdata2-production.up.railway.app"
+from async_rover_simulation import AsyncRoverSimulation
+from rover_mission import RoverMission, AsyncRoverMission, API_FIELDS
+from fleet_manager import RoverFleet
+from rover_transport import get_transport
+from response_cache import VersionedResponseCache
+from telemetry_store import TelemetryStore, EVENT_KINDS
+from mission_replay import MissionReplay
+from config import TELEMETRY_DB, FLEET_MAX_ROVERS
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'roverx-secret-key'
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Accept any namespace so each fleet rover can use /rover/<rover_id>
+socketio = SocketIO(app, cors_allowed_origins="*", namespaces="*")
 
 # Global variables
-rover_simulation = None
 simulation_thread = None
-simulation_running = False
-is_delivering_aid = False
-aid_delivery_start_time = 0
-
-# Rover data structure
-rover_data = {
-    "status": "idle",
-    "battery": 0,
-    "position": {"x": 0, "y": 0},
-    "sensor_data": None,
-    "movement_history": [],
-    "log_entries": [],
-    "path_history": [],
-    "survivors_found": []
-}
-
-def add_log_entry(message, level="info"):
-    """Add a log entry with timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    entry = {
-        "timestamp": timestamp,
-        "message": message,
-        "level": level  # info, success, warning, error
-    }
-    rover_data["log_entries"].append(entry)
-    socketio.emit('log_update', entry)
-
-def simulation_loop():
-    """Autonomous rover simulation loop"""
-    global simulation_running, rover_simulation, rover_data, is_delivering_aid, aid_delivery_start_time
-    
-    try:
-        # Start a session
-        if not rover_simulation.start_session():
-            add_log_entry("Failed to start session. Exiting.", "error")
-            simulation_running = False
-            return
-        
-        # Store session ID in rover_data
-        rover_data["session_id"] = rover_simulation.session_id
-        add_log_entry(f"Session started with ID: {rover_simulation.session_id}", "success")
-        
-        # Initial status update
-        update_rover_status()
-        update_sensor_data()
-        
-        # Battery thresholds
-        RECHARGE_START = 5  # Start recharging at 5%
-        RECHARGE_STOP = 80  # Stop recharging at 80%
-        COMMS_LOSS = 10  # Communication lost below 10%
-        
-        while simulation_running:
-            # Update rover status and sensor data
-            update_rover_status()
-            update_sensor_data()
-            
-            # Handle aid delivery
-            current_time = time.time()
-            if is_delivering_aid and (current_time - aid_delivery_start_time) >= 5:
-                # Aid delivery complete after 5 seconds
-                is_delivering_aid = False
-                add_log_entry("Aid delivery complete. Resuming exploration.", "success")
-                rover_data["status"] = "Aid Delivered"
-                socketio.emit('status_update', rover_data)
-                time.sleep(1)  # Brief pause before resuming
-                
-            # Handle battery management
-            if rover_data["battery"] <= RECHARGE_START and rover_simulation.status.lower() != "charging":
-                # Battery critically low, start charging
-                add_log_entry(f"Battery critically low ({rover_data['battery']}%). Starting recharge...", "warning")
-                rover_simulation.charge_rover()
-                rover_simulation.stop_rover()  # Ensure the rover stops moving
-                rover_data["status"] = "Charging"  # Update status immediately
-                socketio.emit('status_update', rover_data)  # Send immediate update to UI
-                add_log_entry("Rover stopped for charging. Will resume at 80%.", "info")
-                time.sleep(1)  # Give time for charging to start
-            
-            # Handle communication loss at low battery
-            elif rover_data["battery"] <= COMMS_LOSS and rover_data["battery"] > RECHARGE_START and rover_simulation.status.lower() != "charging":
-                # Battery low, communication degrading
-                add_log_entry(f"Warning: Battery at {rover_data['battery']}%. Connection lost.", "warning")
-                rover_data["status"] = "Connection Lost - Low Battery"
-                socketio.emit('status_update', rover_data)
-                
-                # Stop the rover
-                rover_simulation.stop_rover()
-                add_log_entry("Rover stopped due to connection loss.", "warning")
-                
-                # Start charging immediately
-                rover_simulation.charge_rover()
-                rover_data["status"] = "Recharging"
-                socketio.emit('status_update', rover_data)
-                add_log_entry("Emergency recharge initiated.", "info")
-            
-            # If charging and battery is above threshold, stop charging by moving
-            if rover_simulation.status.lower() == "charging" and rover_data["battery"] >= RECHARGE_STOP:
-                # Set battery to exactly 80% when done charging
-                rover_data["battery"] = 80
-                add_log_entry(f"Battery charged to {rover_data['battery']}%. Resuming operation.", "success")
-                rover_data["status"] = "Fully Charged"
-                socketio.emit('status_update', rover_data)
-                
-                # Move to indicate we're no longer charging
-                move_rover()
-            
-            # If not charging and battery is above minimum, move randomly
-            if rover_simulation.status.lower() != "charging" and rover_data["battery"] > COMMS_LOSS and not is_delivering_aid:
-                # Move in a random direction
-                move_rover()
-            elif rover_simulation.status.lower() == "charging":
-                # If charging, emit a status update to show charging progress
-                if rover_data["status"] != "Charging" and rover_data["status"] != "Recharging":
-                    rover_data["status"] = "Charging"
-                socketio.emit('status_update', rover_data)
-                add_log_entry(f"Charging: Battery at {rover_data['battery']}%", "info")
-            
-            # Sleep to simulate real-time operation
-            time.sleep(2)
-            
-    except Exception as e:
-        add_log_entry(f"Simulation error: {str(e)}", "error")
-    finally:
-        # Stop the rover before exiting
-        if rover_simulation:
-            rover_simulation.stop_rover()
-        simulation_running = False
-        add_log_entry("Simulation stopped", "warning")
-
-def update_rover_status():
-    """Update rover status from the simulation"""
-    global rover_data, rover_simulation
-    
-    if not rover_simulation:
-        add_log_entry("No active simulation.", "error")
-        return False
-    
-    try:
-        # Update the rover status in the simulation
-        rover_simulation.update_status()
-        
-        # Copy data from simulation to our data structure
-        rover_data["status"] = rover_simulation.status
-        rover_data["battery"] = rover_simulation.battery
-        rover_data["position"] = rover_simulation.position
-        
-        # Update path history if position changed
-        current_pos = [rover_simulation.position["x"], rover_simulation.position["y"]]
-        if not rover_data["path_history"] or rover_data["path_history"][-1] != current_pos:
-            rover_data["path_history"].append(current_pos)
-        
-        # Emit the updated data
-        socketio.emit('status_update', rover_data)
-        return True
-    except Exception as e:
-        add_log_entry(f"Error updating rover status: {str(e)}", "error")
-        return False
-
-def update_sensor_data():
-    """Update sensor data from the simulation"""
-    global rover_data, rover_simulation, is_delivering_aid, aid_delivery_start_time
-    
-    if not rover_simulation:
-        add_log_entry("No active simulation.", "error")
-        return False
-    
-    try:
-        # Update the sensor data in the simulation
-        rover_simulation.update_sensor_data()
-        
-        # Get the latest sensor data from the API
-        if not rover_simulation.session_id:
-            return False
-        
-        url = f"{BASE_URL}/api/rover/sensor-data"
-        params = {"session_id": rover_simulation.session_id}
-        
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            rover_data["sensor_data"] = data
-            
-            # Update position and battery from sensor data
-            pos = data.get("position", {"x": 0, "y": 0})
-            rover_data["position"] = {"x": pos["x"], "y": pos["y"]}
-            
-            # Ensure battery level doesn't exceed 100%
-            battery_level = data.get("battery_level", 0)
-            if battery_level > 100:
-                battery_level = 100
-            rover_data["battery"] = battery_level
-            
-            # Check for RFID tag detection (simulating survivor found)
-            rfid = data.get("rfid", {"tag_detected": False})
-            if rfid.get("tag_detected", False):
-                # Simulate finding a survivor at current position
-                current_pos = [pos["x"], pos["y"]]
-                if current_pos not in rover_data["survivors_found"] and not is_delivering_aid:
-                    rover_data["survivors_found"].append(current_pos)
-                    add_log_entry(f"Survivor found at position X={pos['x']}, Y={pos['y']}!", "success")
-                    
-                    # Start aid delivery process
-                    rover_simulation.stop_rover()  # Stop the rover
-                    rover_data["status"] = "Delivering Aid"
-                    socketio.emit('status_update', rover_data)
-                    add_log_entry("Rover stopped. Delivering aid to survivor...", "info")
-                    
-                    # Set aid delivery flags
-                    is_delivering_aid = True
-                    aid_delivery_start_time = time.time()
-            
-            # Update path history if position changed
-            current_pos = [pos["x"], pos["y"]]
-            if not rover_data["path_history"] or rover_data["path_history"][-1] != current_pos:
-                rover_data["path_history"].append(current_pos)
-                # For debugging
-                add_log_entry(f"Position updated: X={pos['x']}, Y={pos['y']}", "info")
-            
-            # Emit the updated data
-            socketio.emit('sensor_update', data)
-            
-            # Send map update with current position, path history, and survivors
-            map_data = {
-                "position": current_pos,
-                "path": rover_data["path_history"],
-                "survivors": rover_data["survivors_found"]
-            }
-            socketio.emit('map_update', map_data)
-            
-            # For debugging
-            print(f"Map update sent: Position={current_pos}, Path length={len(rover_data['path_history'])}, Survivors={len(rover_data['survivors_found'])}")
-            
-            return True
-        else:
-            add_log_entry(f"Failed to get sensor data. Status code: {response.status_code}", "error")
-            return False
-    except Exception as e:
-        add_log_entry(f"Error updating sensor data: {str(e)}", "error")
-        return False
-
-def move_rover(direction=None):
-    """Move the rover in a specified or random direction"""
-    global rover_data, rover_simulation
-    
-    if not rover_simulation:
-        add_log_entry("No active simulation.", "error")
-        return False
-    
-    try:
-        # Move the rover in the simulation
-        result = rover_simulation.move_rover(direction)
-        
-        if result:
-            # Add to movement history
-            rover_data["movement_history"].append({
-                "direction": rover_simulation.last_direction,
-                "timestamp": datetime.now().strftime("%H:%M:%S")
-            })
-            
-            # Emit movement update
-            socketio.emit('movement_update', {
-                "direction": rover_simulation.last_direction,
-                "history": rover_data["movement_history"]
-            })
-            
-            # Update map with new direction
-            map_data = {
-                "position": [rover_data["position"]["x"], rover_data["position"]["y"]],
-                "path": rover_data["path_history"],
-                "survivors": rover_data["survivors_found"],
-                "direction": rover_simulation.last_direction
-            }
-            socketio.emit('map_update', map_data)
-            
-            return True
-        return False
-    except Exception as e:
-        add_log_entry(f"Error moving rover: {str(e)}", "error")
-        return False
+lifecycle_lock = threading.Lock()  # Serializes start/stop so a restart can't race a dying thread
+STOP_TIMEOUT = 5  # Seconds to wait for a stopping simulation to go idle
+stop_latencies = []  # Stop-to-idle seconds of recent stops, newest last
+
+# Append-only audit trail of every mission's telemetry
+telemetry_store = TelemetryStore(TELEMETRY_DB) if TELEMETRY_DB else None
+if telemetry_store is not None:
+    atexit.register(telemetry_store.close)  # Write out queued events on exit
+
+# The single dashboard rover (default namespace)
+mission = RoverMission(None, socketio)
+
+# Fleet of rovers sharing one worker pool
+fleet = RoverFleet(socketio, max_workers=int(os.environ.get("FLEET_WORKERS", 8)), recorder=telemetry_store)
+
+# Replay of a recorded mission, shown on the dashboard instead of the live rover
+replay = None
+
+# /api/rover-data bodies, serialized once per mission version and query
+rover_data_cache = VersionedResponseCache()
+
+def dashboard_mission():
+    """The mission the dashboard shows: the replay's while one is active, else the live one"""
+    if replay is not None:
+        return replay.mission
+    return mission
+
+def run_async_simulation(async_mission):
+    """Thread target that runs an async mission on its own event loop"""
+    asyncio.run(async_mission.run())
 
 @app.route('/')
 def index():
@@ -308,23 +67,35 @@ def serve_static(path):
 
 @app.route('/api/start-simulation', methods=['POST'])
 def api_start_simulation():
-    global simulation_thread, simulation_running, rover_simulation, rover_data
+    with lifecycle_lock:
+        return start_simulation()
+
+def start_simulation():
+    global simulation_thread, mission
     
-    if simulation_running:
+    if mission.running:
         return jsonify({"status": "error", "message": "Simulation already running"})
+    if replay is not None:
+        return jsonify({"status": "error", "message": "Stop the replay first"})
+    # A previous simulation may still be shutting down; never run two at once
+    if simulation_thread is not None and simulation_thread.is_alive():
+        mission.request_stop()
+        simulation_thread.join(STOP_TIMEOUT)
+        if simulation_thread.is_alive():
+            return jsonify({"status": "error", "message": "Previous simulation is still stopping"})
     
-    # Reset rover data
-    rover_data["movement_history"] = []
-    rover_data["log_entries"] = []
-    rover_data["path_history"] = []
-    rover_data["survivors_found"] = []
-    
-    # Create a new rover simulation
-    rover_simulation = RoverSimulation()
+    # Create a new rover simulation ("async" mode drives it with AsyncRoverAPI)
+    mode = request.args.get("mode", "sync")
+    if mode == "async":
+        mission = AsyncRoverMission(AsyncRoverSimulation(), socketio, recorder=telemetry_store)
+        target, args = run_async_simulation, (mission,)
+    else:
+        mission = RoverMission(RoverSimulation(), socketio, recorder=telemetry_store)
+        target, args = mission.run, ()
     
     # Start simulation in a separate thread
-    simulation_running = True
-    simulation_thread = threading.Thread(target=simulation_loop)
+    mission.running = True
+    simulation_thread = threading.Thread(target=target, args=args)
     simulation_thread.daemon = True
     simulation_thread.start()
     
@@ -332,19 +103,287 @@ def api_start_simulation():
 
 @app.route('/api/stop-simulation', methods=['POST'])
 def api_stop_simulation():
-    global simulation_running
-    
-    if not simulation_running:
-        return jsonify({"status": "error", "message": "No simulation running"})
-    
-    simulation_running = False
-    add_log_entry("Simulation stopped by user", "warning")
+    with lifecycle_lock:
+        if not mission.running:
+            return jsonify({"status": "error", "message": "No simulation running"})
+        
+        stopping = mission
+        stopping.add_log_entry("Simulation stopped by user", "warning")
+        stopping.request_stop()
+        if not stopping.wait_idle(STOP_TIMEOUT):
+            return jsonify({"status": "error", "message": "Simulation did not stop in time"}), 504
+        
+        stop_latencies.append(stopping.stop_latency)
+        del stop_latencies[:-100]
+        return jsonify({"status": "success", "message": "Simulation stopped",
+                        "stop_latency_ms": round(stopping.stop_latency * 1000, 2)})
+
+@app.route('/api/simulation-stats', methods=['GET'])
+def api_simulation_stats():
+    """Whether a simulation is running, and stop-to-idle latency of recent stops"""
+    latencies = sorted(stop_latencies)
+    stats = {"running": mission.running, "stops": len(latencies)}
+    if latencies:
+        stats["last_stop_latency_ms"] = stop_latencies[-1] * 1000
+        stats["p50_stop_latency_ms"] = latencies[len(latencies) // 2] * 1000
+        stats["max_stop_latency_ms"] = latencies[-1] * 1000
+    return jsonify(stats)
+
+def path_options():
+    """Parse ?full=1 and ?tolerance= for endpoints that return a path"""
+    full = request.args.get("full", "").lower() in ("1", "true", "yes")
+    tolerance = request.args.get("tolerance", type=float)
+    if tolerance is not None and tolerance < 0:
+        tolerance = None
+    return full, tolerance
+
+def rover_data_response(target_mission):
+    """Serve rover data from the cache, with ETag revalidation and ?fields= projection"""
+    full, tolerance = path_options()
+    fields = request.args.get("fields")
+    if fields:
+        fields = tuple(sorted({field.strip() for field in fields.split(",") if field.strip()}))
+        unknown = [field for field in fields if field not in API_FIELDS]
+        if unknown:
+            return jsonify({"status": "error", "message": f"Unknown fields: {', '.join(unknown)}"}), 400
+    else:
+        fields = None
     
-    return jsonify({"status": "success", "message": "Simulation stopped"})
+    # The ETag only depends on the mission version and the query, so a match needs no serialization
+    snapshot = target_mission.snapshot
+    version = snapshot.version
+    key = (target_mission.map_epoch, fields, full, tolerance)
+    etag = hashlib.blake2b(repr((key, version)).encode(), digest_size=12).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        body = rover_data_cache.get(key, version, lambda: json.dumps(target_mission.serialize(full, tolerance, fields, snapshot)))
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/api/rover-data', methods=['GET'])
 def api_rover_data():
-    return jsonify(rover_data)
+    return rover_data_response(dashboard_mission())
+
+@app.route('/api/map-state', methods=['GET'])
+def api_map_state():
+    # Full map for clients that missed a map_update delta
+    return jsonify(dashboard_mission().map_state(*path_options()))
+
+@app.route('/api/survivors/near', methods=['GET'])
+def api_survivors_near():
+    return survivors_near(dashboard_mission())
+
+def survivors_near(target_mission):
+    """Survivors within r of (x, y) for a mission, nearest first"""
+    try:
+        x = float(request.args["x"])
+        y = float(request.args["y"])
+        r = float(request.args.get("r", target_mission.survivor_index.radius))
+    except (KeyError, ValueError):
+        return jsonify({"status": "error", "message": "x and y are required; x, y and r must be numbers"}), 400
+    if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(r)):
+        return jsonify({"status": "error", "message": "x, y and r must be finite"}), 400
+    if r < 0:
+        return jsonify({"status": "error", "message": "r must not be negative"}), 400
+    
+    survivors = target_mission.survivor_index.near(x, y, r)
+    return jsonify({"status": "success", "count": len(survivors), "survivors": survivors})
+
+@app.route('/api/coverage', methods=['GET'])
+def api_coverage():
+    return jsonify(coverage_report(dashboard_mission()))
+
+def coverage_report(target_mission):
+    count = request.args.get("hotspots", 5, type=int)
+    return dict(target_mission.coverage.summary(), hotspots=target_mission.coverage.hotspots(count))
+
+@app.route('/api/telemetry/missions', methods=['GET'])
+def api_telemetry_missions():
+    if telemetry_store is None:
+        return jsonify({"status": "error", "message": "Telemetry recording is disabled"}), 404
+    return jsonify({"status": "success", "missions": telemetry_store.missions()})
+
+@app.route('/api/telemetry', methods=['GET'])
+def api_telemetry():
+    # Recorded events of one mission (or all) in [start, end), filtered by ?kind=status,log,...
+    if telemetry_store is None:
+        return jsonify({"status": "error", "message": "Telemetry recording is disabled"}), 404
+    kinds = [kind for kind in request.args.get("kind", "").split(",") if kind]
+    unknown = [kind for kind in kinds if kind not in EVENT_KINDS]
+    if unknown:
+        return jsonify({"status": "error", "message": f"Unknown kinds: {', '.join(unknown)}"}), 400
+    limit = max(1, min(request.args.get("limit", 1000, type=int), 10000))
+    events = telemetry_store.read(
+        mission=request.args.get("mission"),
+        start=request.args.get("start", type=float),
+        end=request.args.get("end", type=float),
+        kinds=kinds,
+        limit=limit
+    )
+    return jsonify({"status": "success", "count": len(events), "events": events})
+
+@app.route('/api/replay', methods=['GET'])
+def api_replay_status():
+    if replay is None:
+        return jsonify({"status": "success", "replay": None})
+    return jsonify({"status": "success", "replay": replay.status()})
+
+def replay_offset(payload):
+    offset = float(payload.get("offset") or 0)
+    if not math.isfinite(offset):
+        raise ValueError("offset must be finite")
+    return offset
+
+@app.route('/api/replay/start', methods=['POST'])
+def api_replay_start():
+    with lifecycle_lock:
+        return start_replay()
+
+def start_replay():
+    global replay
+    if telemetry_store is None:
+        return jsonify({"status": "error", "message": "Telemetry recording is disabled"}), 404
+    if mission.running:
+        return jsonify({"status": "error", "message": "Stop the simulation first"})
+    
+    payload = request.get_json(silent=True) or {}
+    try:
+        offset = replay_offset(payload)
+        new_replay = MissionReplay(telemetry_store, payload.get("mission"), socketio,
+                                   speed=float(payload.get("speed", 10)))
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    
+    if replay is not None:
+        replay.stop()
+    replay = new_replay
+    if offset:
+        replay.seek(offset)
+    replay.start()
+    return jsonify({"status": "success", "replay": replay.status()})
+
+@app.route('/api/replay/<action>', methods=['POST'])
+def api_replay_control(action):
+    with lifecycle_lock:
+        return control_replay(action)
+
+def control_replay(action):
+    global replay
+    if replay is None:
+        return jsonify({"status": "error", "message": "No replay running"})
+    
+    payload = request.get_json(silent=True) or {}
+    try:
+        if action == "seek":
+            replay.seek(replay_offset(payload))
+        elif action == "speed":
+            replay.set_speed(float(payload.get("speed", 10)))
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    
+    if action == "pause":
+        replay.pause()
+    elif action == "resume":
+        replay.resume()
+    elif action in ("seek", "speed"):
+        pass
+    elif action == "stop":
+        replay.stop()
+        replay = None
+        return jsonify({"status": "success", "replay": None})
+    else:
+        return jsonify({"status": "error", "message": f"Unknown replay action {action}"}), 404
+    return jsonify({"status": "success", "replay": replay.status()})
+
+@app.route('/api/transport-stats', methods=['GET'])
+def api_transport_stats():
+    return jsonify(get_transport().connection_stats())
+
+@app.route('/api/command-stats', methods=['GET'])
+def api_command_stats():
+    """Command counts and enqueue-to-ack latency of the running mission's rover"""
+    simulation = mission.rover_simulation
+    if simulation is None:
+        return jsonify({})
+    return jsonify(simulation.outbox.stats())
+
+@app.route('/api/fleet', methods=['GET'])
+def api_fleet_list():
+    return jsonify({"status": "success", "rovers": fleet.list_rovers()})
+
+# Fleet rover IDs become part of their Socket.IO namespace (/rover/<rover_id>)
+ROVER_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+@app.route('/api/fleet/start', methods=['POST'])
+def api_fleet_start():
+    payload = request.get_json(silent=True) or {}
+    try:
+        count = int(payload.get("count", 1))
+    except (TypeError, ValueError):
+        return jsonify({"status": "error", "message": "count must be an integer"}), 400
+    if count < 1:
+        return jsonify({"status": "error", "message": "count must be at least 1"}), 400
+    rover_id = payload.get("rover_id")
+    if rover_id is not None and not (isinstance(rover_id, str) and ROVER_ID_PATTERN.fullmatch(rover_id)):
+        return jsonify({"status": "error", "message": "rover_id must be 1-64 letters, digits, '_' or '-'"}), 400
+    if rover_id and count != 1:
+        return jsonify({"status": "error", "message": "rover_id can only be used with count=1"})
+    
+    # Each rover runs a session and command threads; never start more than the fleet allows
+    count = min(count, FLEET_MAX_ROVERS - len(fleet.list_rovers()))
+    if count < 1:
+        return jsonify({"status": "error", "message": f"Fleet is full ({FLEET_MAX_ROVERS} rovers)"}), 400
+    
+    started = []
+    for _ in range(count):
+        rover = fleet.start_rover(rover_id)
+        if rover is None:
+            return jsonify({"status": "error", "message": f"Rover {rover_id} already running"})
+        started.append({"rover_id": rover.rover_id, "namespace": rover.mission.namespace})
+    
+    return jsonify({"status": "success", "rovers": started})
+
+@app.route('/api/fleet/<rover_id>/stop', methods=['POST'])
+def api_fleet_stop(rover_id):
+    if not fleet.stop_rover(rover_id):
+        return jsonify({"status": "error", "message": f"No running rover {rover_id}"})
+    return jsonify({"status": "success", "message": f"Rover {rover_id} stopping"})
+
+@app.route('/api/fleet/stop-all', methods=['POST'])
+def api_fleet_stop_all():
+    stopped = [rover["rover_id"] for rover in fleet.list_rovers() if fleet.stop_rover(rover["rover_id"])]
+    return jsonify({"status": "success", "stopped": stopped})
+
+@app.route('/api/fleet/<rover_id>/rover-data', methods=['GET'])
+def api_fleet_rover_data(rover_id):
+    rover = fleet.get_rover(rover_id)
+    if rover is None:
+        return jsonify({"status": "error", "message": f"No rover {rover_id}"}), 404
+    return rover_data_response(rover.mission)
+
+@app.route('/api/fleet/<rover_id>/map-state', methods=['GET'])
+def api_fleet_map_state(rover_id):
+    rover = fleet.get_rover(rover_id)
+    if rover is None:
+        return jsonify({"status": "error", "message": f"No rover {rover_id}"}), 404
+    return jsonify(rover.mission.map_state(*path_options()))
+
+@app.route('/api/fleet/<rover_id>/survivors/near', methods=['GET'])
+def api_fleet_survivors_near(rover_id):
+    rover = fleet.get_rover(rover_id)
+    if rover is None:
+        return jsonify({"status": "error", "message": f"No rover {rover_id}"}), 404
+    return survivors_near(rover.mission)
+
+@app.route('/api/fleet/<rover_id>/coverage', methods=['GET'])
+def api_fleet_coverage(rover_id):
+    rover = fleet.get_rover(rover_id)
+    if rover is None:
+        return jsonify({"status": "error", "message": f"No rover {rover_id}"}), 404
+    return jsonify(coverage_report(rover.mission))
 
 if __name__ == '__main__':
     socketio.run(app, debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,196 @@
+import asyncio
+
+import aiohttp
+
+from config import SESSION_ID, BASE_URL
+from rover_transport import ENDPOINT_TIMEOUTS, DEFAULT_TIMEOUT
+from rover_frames import StatusFrame, SensorFrame, FrameError, loads, rover_status
+
+VALID_DIRECTIONS = ['forward', 'backward', 'left', 'right']
+
+
+class AsyncRoverTransport:
+    """Pooled aiohttp transport shared by many AsyncRoverAPI sessions"""
+
+    def __init__(self, max_concurrency=32, limit_per_host=32, timeouts=None):
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+        self.request_count = 0
+
+    def timeout_for(self, url):
+        """Return the aiohttp timeout for the endpoint behind a URL"""
+        connect, read = DEFAULT_TIMEOUT
+        path = url.split('?', 1)[0].rstrip('/')
+        for endpoint, timeout in self.timeouts.items():
+            if path.endswith('/' + endpoint):
+                connect, read = timeout
+                break
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency,
+                                             limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  headers={'Accept-Encoding': 'gzip, deflate'})
+        return self._session
+
+    async def request(self, method, url, params=None):
+        """Send a request and return (status_code, json_data, text)
+
+        json_data is None if the body is not valid JSON. text is only decoded
+        when it is needed for an error message, and is None otherwise.
+        """
+        session = self._get_session()
+        async with self._semaphore:
+            self.request_count += 1
+            async with session.request(method, url, params=params,
+                                       timeout=self.timeout_for(url)) as response:
+                body = await response.read()
+                try:
+                    data = loads(body) if body else None
+                except FrameError:
+                    data = None
+                text = body.decode('utf-8', 'replace') if response.status != 200 or data is None else None
+                return response.status, data, text
+
+    async def get(self, url, params=None):
+        return await self.request('GET', url, params=params)
+
+    async def post(self, url, params=None):
+        return await self.request('POST', url, params=params)
+
+    async def close(self):
+        """Close all pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class AsyncRoverAPI:
+    """asyncio counterpart of RoverAPI"""
+
+    def __init__(self, session_id=None, transport=None, base_url=None):
+        self.session_id = session_id if session_id else SESSION_ID
+        self.transport = transport if transport else AsyncRoverTransport()
+        self.root_url = f"{base_url if base_url else BASE_URL}/api"
+        self.base_url = f"{self.root_url}/rover"
+        self.endpoints = {
+            'session': f"{self.root_url}/session/start",
+            'status': f"{self.base_url}/status",
+            'sensor-data': f"{self.base_url}/sensor-data",
+            'move': f"{self.base_url}/move",
+            'stop': f"{self.base_url}/stop",
+            'charge': f"{self.base_url}/charge"
+        }
+        self.last_battery = None
+
+    def get_params(self):
+        return {'session_id': self.session_id}
+
+    async def _call(self, method, endpoint, params=None, label=None):
+        """Call an endpoint and return its JSON body, or None on any error"""
+        label = label or endpoint
+        try:
+            status_code, data, text = await self.transport.request(method, self.endpoints[endpoint], params=params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error calling {label}: {e}")
+            return None
+
+        if status_code != 200:
+            print(f"{label} failed with status code: {status_code}")
+            if text:
+                print(f"Error message: {text}")
+            return None
+        if data is None:
+            print(f"Error parsing JSON response from {label}")
+            return None
+        if 'error' in data:
+            print(f"\nAPI Error: {data['error']}")
+            return None
+        return data
+
+    async def start_session(self):
+        """Start a new session and remember its ID"""
+        data = await self._call('POST', 'session', label='Start session')
+        if data is None:
+            return None
+        self.session_id = data.get('session_id')
+        return self.session_id
+
+    async def get_status(self):
+        """Get the raw /status response"""
+        return await self._call('GET', 'status', self.get_params(), label='Status request')
+
+    async def get_sensor_data(self):
+        """Get the raw /sensor-data response"""
+        return await self._call('GET', 'sensor-data', self.get_params(), label='Sensor request')
+
+    async def get_status_frame(self):
+        """Get the /status response as a StatusFrame"""
+        return self._frame(StatusFrame, await self.get_status(), 'Status request')
+
+    async def get_sensor_frame(self):
+        """Get the /sensor-data response as a SensorFrame"""
+        return self._frame(SensorFrame, await self.get_sensor_data(), 'Sensor request')
+
+    def _frame(self, frame_type, data, label):
+        if data is None:
+            return None
+        try:
+            return frame_type.from_dict(data)
+        except FrameError as e:
+            print(f"Invalid response from {label}: {e}")
+            return None
+
+    async def get_rover_status(self):
+        """Get both status and sensor data from the rover"""
+        status, sensor = await asyncio.gather(self.get_status_frame(), self.get_sensor_frame())
+        if status is None or sensor is None:
+            return None
+
+        # Track battery changes
+        current_battery = status.battery
+        if self.last_battery is not None and current_battery != self.last_battery:
+            print(f"Battery changed: {self.last_battery} -> {current_battery}")
+        self.last_battery = current_battery
+
+        return rover_status(status, sensor)
+
+    async def send_move_command(self, direction):
+        """Send movement command to the API"""
+        # Convert direction to lowercase and validate
+        direction = direction.lower()
+        if direction not in VALID_DIRECTIONS:
+            print(f"Invalid direction: {direction}")
+            return None
+
+        params = self.get_params()
+        params['direction'] = direction
+        response_data = await self._call('POST', 'move', params, label='Move command')
+        if response_data is not None:
+            print(f"Move command '{direction}' sent successfully")
+        return response_data
+
+    async def send_stop_command(self):
+        """Send stop command to the API"""
+        response_data = await self._call('POST', 'stop', self.get_params(), label='Stop command')
+        if response_data is not None:
+            print("Stop command sent successfully")
+        return response_data
+
+    async def send_charge_command(self):
+        """Send charge command to the API"""
+        response_data = await self._call('POST', 'charge', self.get_params(), label='Charge command')
+        if response_data is not None:
+            print("Charge command sent successfully")
+        return response_data
+
+    async def close(self):
+        await self.transport.close()
@@ -0,0 +1,75 @@
+import asyncio
+from colorama import Fore, Style
+from async_rover_api import AsyncRoverAPI
+from rover_simulation import RoverSimulation
+
+
+class AsyncRoverSimulation(RoverSimulation):
+    """RoverSimulation whose API calls are coroutines on an AsyncRoverAPI
+
+    Local state and thresholds are shared with RoverSimulation; only the
+    network calls differ.
+    """
+
+    def __init__(self, api=None, transport=None, base_url=None):
+        super().__init__(base_url=base_url)
+        self.api = api if api else AsyncRoverAPI(transport=transport, base_url=self.base_url)
+        self.session_id = None
+
+    async def start_session(self):
+        """Start a new session and get session ID"""
+        print(f"{Fore.CYAN}{Style.BRIGHT}Starting new rover session...{Style.RESET_ALL}")
+        self.session_id = await self.api.start_session()
+        if not self.session_id:
+            print(f"{Fore.RED}Failed to start session.{Style.RESET_ALL}")
+            return False
+        print(f"{Fore.GREEN}Session started successfully!{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}Session ID: {Fore.YELLOW}{self.session_id}{Style.RESET_ALL}")
+        return True
+
+    async def fetch_telemetry(self):
+        """Fetch status and sensor data once each, concurrently"""
+        if not self.session_id:
+            print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
+            return {"status": None, "sensor_data": None}
+
+        status, sensor = await asyncio.gather(self.api.get_status_frame(), self.api.get_sensor_frame())
+        return {"status": status, "sensor_data": sensor}
+
+    async def charge_rover(self):
+        """Charge the rover"""
+        if not self.session_id:
+            print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
+            return False
+        if await self.api.send_charge_command() is None:
+            return False
+        self.apply_charging()
+        return True
+
+    async def move_rover(self, direction=None):
+        """Move the rover in a specified or random direction"""
+        if not self.session_id:
+            print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
+            return False
+
+        direction = self.choose_direction(direction)
+        if direction is None:
+            return False
+        if await self.api.send_move_command(direction) is None:
+            return False
+        self.apply_move(direction)
+        return True
+
+    async def stop_rover(self):
+        """Stop the rover"""
+        if not self.session_id:
+            print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
+            return False
+        if await self.api.send_stop_command() is None:
+            return False
+        self.apply_stop()
+        return True
+
+    async def close(self):
+        await self.api.close()
+        super().close()
@@ -0,0 +1,248 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import OUTBOX_WORKERS
+
+# Commands that jump the queue and cancel any move still waiting
+PRIORITY_KINDS = ("stop", "charge")
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def lane_executor(lane):
+    """Return the process-wide pool that runs one lane ("priority" or "move") of every outbox
+
+    The lanes get separate pools so a stop never waits behind other rovers' moves.
+    """
+    with _executors_lock:
+        executor = _executors.get(lane)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=OUTBOX_WORKERS, thread_name_prefix=f'command-outbox-{lane}')
+            _executors[lane] = executor
+        return executor
+
+
+class CommandTicket:
+    """One queued command; wait() blocks until it is acked, cancelled or superseded
+
+    state is "pending", "sent", "acked", "failed", "cancelled" (by a stop or
+    charge) or "superseded" (by a newer move). latency is the enqueue-to-ack
+    time in seconds once the backend has answered.
+    """
+
+    def __init__(self, kind, send, args):
+        self.kind = kind
+        self.send = send
+        self.args = args
+        self.state = "pending"
+        self.result = None
+        self.enqueued_at = time.perf_counter()
+        self.acked_at = None
+        self._done = threading.Event()
+        self._wakers = []  # Events of cancellable waits, set on finish
+
+    @property
+    def latency(self):
+        if self.acked_at is None:
+            return None
+        return self.acked_at - self.enqueued_at
+
+    def finish(self, state, result=None):
+        """Resolve the ticket; returns False if it was already resolved (e.g. cancelled)"""
+        if self._done.is_set():
+            return False
+        self.state = state
+        self.result = result
+        if state in ("acked", "failed"):
+            self.acked_at = time.perf_counter()
+        self._done.set()
+        for waker in list(self._wakers):
+            waker.set()
+        return True
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None, cancel=None):
+        """The command's result, or None if it failed, was dropped or timed out
+
+        With a CancelToken, the wait also ends (returning None) as soon as the
+        token is cancelled; the command itself is still sent.
+        """
+        if cancel is None:
+            self._done.wait(timeout)
+            return self.result
+        waker = threading.Event()
+        self._wakers.append(waker)
+        try:
+            if not self._done.is_set():
+                with cancel.watch(waker):
+                    waker.wait(timeout)
+        finally:
+            self._wakers.remove(waker)
+        return self.result if self._done.is_set() else None
+
+
+class CommandOutbox:
+    """Sends rover commands in the background, moves and stops on separate lanes
+
+    - Moves coalesce: a move waiting to be sent is replaced by a newer one,
+      so the last move wins and the superseded ticket resolves to None.
+    - stop and charge go out on their own lane, so they never wait behind a
+      slow move, and they cancel any move still waiting.
+      If a move that was already in flight is acked after a later stop or
+      charge, that command is sent again so it stays the last one applied.
+    - Every ticket records its enqueue-to-ack latency, summarized by stats().
+
+    send callables return a falsy value on failure. An outbox owns no
+    threads: a lane with work queued runs as one task on the shared
+    lane_executor() pool until it is drained. close() sends whatever is
+    still queued and refuses new commands; the owner must call it.
+    """
+
+    def __init__(self, latency_window=1000):
+        self.counts = {}
+        self.reasserted = 0
+        self._latencies = {}
+        self._latency_window = latency_window
+        self._pending_move = None
+        self._in_flight_move = None
+        self._priority = deque()
+        self._priority_generation = 0
+        self._last_priority = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._active = set()  # Lanes with a drain task queued or running
+        self._lane_threads = set()
+
+    def _schedule(self, lane, drain):
+        # Called with the condition held, whenever a lane gets work
+        if lane not in self._active:
+            self._active.add(lane)
+            lane_executor(lane).submit(drain)
+
+    def submit(self, kind, send, *args):
+        """Queue send(*args) as a command of this kind and return its CommandTicket"""
+        ticket = CommandTicket(kind, send, args)
+        with self._condition:
+            if self._closed:
+                self._count(kind, "cancelled")
+                ticket.finish("cancelled")
+                return ticket
+            self._count(kind, "queued")
+            if kind in PRIORITY_KINDS:
+                if self._pending_move is not None:
+                    self._drop_move("cancelled")
+                self._priority.append(ticket)
+                self._priority_generation += 1
+                self._last_priority = ticket
+                self._schedule("priority", self._drain_priority)
+            else:
+                if self._pending_move is not None:
+                    self._drop_move("superseded")
+                self._pending_move = ticket
+                self._schedule("move", self._drain_moves)
+        return ticket
+
+    def _drop_move(self, state):
+        ticket, self._pending_move = self._pending_move, None
+        self._count(ticket.kind, state)
+        ticket.finish(state)
+
+    def _count(self, kind, state):
+        counts = self.counts.setdefault(kind, {})
+        counts[state] = counts.get(state, 0) + 1
+
+    def _finish_lane(self, lane):
+        # Called with the condition held, once the lane has nothing left to send
+        self._active.discard(lane)
+        self._lane_threads.discard(threading.current_thread())
+        self._condition.notify_all()
+
+    def _drain_priority(self):
+        while True:
+            with self._condition:
+                if not self._priority:
+                    self._finish_lane("priority")
+                    return
+                self._lane_threads.add(threading.current_thread())
+                ticket = self._priority.popleft()
+            self._send(ticket)
+
+    def _drain_moves(self):
+        while True:
+            with self._condition:
+                if self._pending_move is None:
+                    self._finish_lane("move")
+                    return
+                self._lane_threads.add(threading.current_thread())
+                ticket, self._pending_move = self._pending_move, None
+                self._in_flight_move = ticket
+                generation = self._priority_generation
+            self._send(ticket)
+
+            with self._condition:
+                self._in_flight_move = None
+                # A stop/charge sent while this move was in flight may have landed first;
+                # a move still waiting was queued after it, so then the move wins
+                last = self._last_priority
+                if (self._priority_generation != generation and self._pending_move is None
+                        and last not in self._priority):
+                    self.reasserted += 1
+                    self._count(last.kind, "queued")
+                    self._priority.append(CommandTicket(last.kind, last.send, last.args))
+                    self._schedule("priority", self._drain_priority)
+
+    def _send(self, ticket):
+        ticket.state = "sent"
+        try:
+            result = ticket.send(*ticket.args)
+        except Exception as e:
+            print(f"Error sending {ticket.kind} command: {e}")
+            result = None
+        state = "acked" if result else "failed"
+        if not ticket.finish(state, result):
+            return  # Cancelled while in flight; the caller has moved on
+        with self._condition:
+            self._count(ticket.kind, state)
+            samples = self._latencies.setdefault(ticket.kind, deque(maxlen=self._latency_window))
+            samples.append(ticket.latency)
+
+    def cancel_moves(self):
+        """Drop the waiting move and release whoever waits on the one in flight
+
+        The in-flight request itself still completes; its result is ignored.
+        """
+        with self._condition:
+            if self._pending_move is not None:
+                self._drop_move("cancelled")
+            ticket = self._in_flight_move
+            if ticket is not None and ticket.finish("cancelled"):
+                self._count(ticket.kind, "cancelled")
+
+    def close(self):
+        """Send whatever is still queued, then refuse new commands"""
+        with self._condition:
+            self._closed = True
+            if threading.current_thread() in self._lane_threads:
+                return  # Called from a send; the lanes finish on their own
+            while self._active:
+                self._condition.wait()
+
+    def stats(self):
+        """Per-kind counts and enqueue-to-ack latency (ms) over recent commands"""
+        with self._condition:
+            stats = {"reasserted": self.reasserted}
+            for kind, counts in self.counts.items():
+                entry = dict(counts)
+                samples = sorted(self._latencies.get(kind, ()))
+                if samples:
+                    entry["latency_mean_ms"] = sum(samples) / len(samples) * 1000
+                    entry["latency_p50_ms"] = samples[len(samples) // 2] * 1000
+                    entry["latency_p99_ms"] = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+                    entry["latency_max_ms"] = samples[-1] * 1000
+                stats[kind] = entry
+            return stats
@@ -1,2 +1,33 @@
+import os
+
 # Rover API Configuration
 SESSION_ID = "294d1b80-6e14-4da5-8c86-9ae105f9e72f"  # Change this value to update session ID
+BASE_URL = os.environ.get("ROVER_API_URL", "https://roverdata2-production.up.railway.app")  # Set ROVER_API_URL to use another backend
+
+# Rover history storage: newest entries are kept in memory, older ones spill to SPILL_DIR
+HISTORY_CAPACITY = {
+    "log_entries": int(os.environ.get("ROVER_LOG_CAPACITY", 500)),
+    "movement_history": int(os.environ.get("ROVER_MOVEMENT_CAPACITY", 500)),
+    "path_history": int(os.environ.get("ROVER_PATH_CAPACITY", 2000)),
+    "survivors_found": int(os.environ.get("ROVER_SURVIVOR_CAPACITY", 1000))
+}
+SPILL_DIR = os.environ.get("ROVER_SPILL_DIR", "rover_history")  # Set to an empty string to drop old entries instead
+
+# RFID tags closer than this (grid units) are treated as the same survivor
+SURVIVOR_RADIUS = float(os.environ.get("ROVER_SURVIVOR_RADIUS", 0.5))
+
+# Coverage grid cell size (grid units); set ROVER_SITE_CELLS to report coverage of a known site size
+COVERAGE_CELL_SIZE = float(os.environ.get("ROVER_COVERAGE_CELL_SIZE", 1.0))
+SITE_CELLS = int(os.environ["ROVER_SITE_CELLS"]) if os.environ.get("ROVER_SITE_CELLS") else None
+
+# Map paths are simplified (Ramer-Douglas-Peucker) to this tolerance in grid units
+PATH_TOLERANCE = float(os.environ.get("ROVER_PATH_TOLERANCE", 0.5))
+
+# SQLite file for the mission telemetry audit trail; set to an empty string to disable recording
+TELEMETRY_DB = os.environ.get("ROVER_TELEMETRY_DB", "rover_telemetry.db")
+
+# Most fleet rovers that can run at once; /api/fleet/start clamps count to what is left
+FLEET_MAX_ROVERS = int(os.environ.get("ROVER_FLEET_MAX_ROVERS", 50))
+
+# Worker threads shared by every rover's command outbox, per lane (moves, and stop/charge)
+OUTBOX_WORKERS = int(os.environ.get("ROVER_OUTBOX_WORKERS", 16))
@@ -0,0 +1,64 @@
+import argparse
+import contextlib
+import io
+import json
+
+from local_rover_server import serve_in_thread
+from robot_backend import HeadlessRobot, parse_key_script
+from rover_api import RoverAPI
+from rover_simulation import RoverSimulation
+
+DEFAULT_SCRIPT = "0:W,250:A,500:S,750:D,1000:P,1250:X,1500:W"
+
+
+def controller_class(name):
+    # Imported here so only the chosen controller's module is loaded
+    if name == "pioneer":
+        from pioneer_controller import PioneerController
+        return PioneerController
+    from RovX_controller import RovXController
+    return RovXController
+
+
+def run_headless(name, keys, steps, timestep=32, api=None, quiet=True):
+    """Run one controller on a HeadlessRobot; return the controller and robot stats"""
+    robot = HeadlessRobot(basic_timestep=timestep, keys=keys, max_steps=steps)
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        controller = controller_class(name)(robot=robot, api=api)
+        controller.run()
+    return controller, robot.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a Webots controller headless at full speed")
+    parser.add_argument("controller", choices=["pioneer", "rovx"])
+    parser.add_argument("--steps", type=int, default=100000, help="robot.step calls to run")
+    parser.add_argument("--timestep", type=int, default=32, help="Basic timestep in ms")
+    parser.add_argument("--keys", default=DEFAULT_SCRIPT, help='Key script as "step:key,step:key"')
+    parser.add_argument("--verbose", action="store_true", help="Show the controller's output")
+    args = parser.parse_args()
+
+    # Status requests (P) go to the local stand-in backend, not the real one
+    server, base_url = serve_in_thread()
+    try:
+        simulation = RoverSimulation(base_url=base_url)
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulation.start_session()
+        api = RoverAPI(session_id=simulation.session_id, base_url=base_url)
+        controller, stats = run_headless(args.controller, parse_key_script(args.keys), args.steps,
+                                         timestep=args.timestep, api=api, quiet=not args.verbose)
+    finally:
+        server.shutdown()
+
+    stats["step_jitter"] = controller.step_jitter.stats()
+    stats["commands"] = controller.outbox.stats()
+    stats["telemetry_polls"] = controller.telemetry.polls
+    if args.controller == "rovx":
+        stats["battery"] = controller.battery
+        stats["position"] = controller.position
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import math
+import threading
+import time
+from collections import deque
+
+
+class TelemetryWorker:
+    """Polls RoverAPI.get_rover_status() on its own thread
+
+    The controller's step loop reads latest() instead of waiting on the two
+    HTTP round-trips, so physics stepping never blocks on the network.
+    """
+
+    def __init__(self, api, interval=1.0):
+        self.api = api
+        self.interval = interval
+        self.polls = 0
+        self.failures = 0
+        self._latest = None
+        self._updated = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='telemetry-worker', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                status = self.api.get_rover_status()
+            except Exception as e:
+                print(f"Error polling rover status: {e}")
+                status = None
+            with self._lock:
+                self.polls += 1
+                if status is None:
+                    self.failures += 1
+                else:
+                    self._latest = status
+                    self._updated = time.monotonic()
+            self._stop.wait(self.interval)
+
+    def latest(self):
+        """The newest status (or None) and its age in seconds"""
+        with self._lock:
+            if self._latest is None:
+                return None, None
+            return self._latest, time.monotonic() - self._updated
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class StepJitter:
+    """Wall-clock intervals between robot.step iterations
+
+    Keeps running totals for every step and a window of recent intervals
+    for percentiles. Steps slower than late_factor times the timestep count
+    as late.
+    """
+
+    def __init__(self, timestep_ms, window=10000, late_factor=1.5):
+        self.expected = timestep_ms / 1000.0
+        self.late_factor = late_factor
+        self.count = 0
+        self.late = 0
+        self.max_interval = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._recent = deque(maxlen=window)
+        self._last = None
+
+    def mark(self):
+        """Call once per loop iteration, right after robot.step returns"""
+        now = time.perf_counter()
+        if self._last is not None:
+            interval = now - self._last
+            self.count += 1
+            delta = interval - self._mean
+            self._mean += delta / self.count
+            self._m2 += delta * (interval - self._mean)
+            self.max_interval = max(self.max_interval, interval)
+            if interval > self.expected * self.late_factor:
+                self.late += 1
+            self._recent.append(interval)
+        self._last = now
+
+    def stats(self):
+        if not self.count:
+            return {"steps": 0}
+        recent = sorted(self._recent)
+
+        def pct(p):
+            return recent[min(len(recent) - 1, int(round(p / 100.0 * (len(recent) - 1))))] * 1000
+
+        return {
+            "steps": self.count,
+            "expected_ms": self.expected * 1000,
+            "mean_ms": self._mean * 1000,
+            "p50_ms": pct(50),
+            "p99_ms": pct(99),
+            "max_ms": self.max_interval * 1000,
+            "jitter_ms": math.sqrt(self._m2 / self.count) * 1000,
+            "late": self.late
+        }
+
+    def report(self):
+        stats = self.stats()
+        if not stats["steps"]:
+            return "Step timing: no steps recorded"
+        return (f"Step timing: {stats['steps']} steps, mean {stats['mean_ms']:.2f} ms "
+                f"(expected {stats['expected_ms']:.0f} ms), p99 {stats['p99_ms']:.2f} ms, "
+                f"max {stats['max_ms']:.2f} ms, jitter {stats['jitter_ms']:.2f} ms, {stats['late']} late")
@@ -0,0 +1,120 @@
+import math
+import threading
+
+import numpy as np
+
+
+class CoverageGrid:
+    """Per-cell visit counts of the ground the rover has covered
+
+    Counts live in a NumPy array that doubles when the rover leaves it, so
+    visit() is amortized O(1). The visited-cell count and explored bounding
+    box are updated on each visit, which keeps coverage_percent() O(1);
+    summary() and hotspots() are vectorized over the array.
+    """
+
+    def __init__(self, cell_size=1.0, initial_size=64, area_cells=None):
+        self.cell_size = cell_size
+        self.area_cells = area_cells  # Cells in the site; None means the explored bounding box
+        self.counts = np.zeros((initial_size, initial_size), dtype=np.int32)
+        self.origin = None  # Cell (i, j) stored at counts[0, 0]
+        self.visited_cells = 0
+        self.total_visits = 0
+        self.bounds = None  # [min_i, min_j, max_i, max_j] over visited cells
+        self._lock = threading.Lock()
+
+    def cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def visit(self, x, y):
+        """Count one visit to the cell containing (x, y); return its visit count"""
+        ci, cj = self.cell(x, y)
+        with self._lock:
+            if self.origin is None:
+                rows, cols = self.counts.shape
+                self.origin = (ci - rows // 2, cj - cols // 2)
+            i, j = ci - self.origin[0], cj - self.origin[1]
+            rows, cols = self.counts.shape
+            if not (0 <= i < rows and 0 <= j < cols):
+                self._grow(ci, cj)
+                i, j = ci - self.origin[0], cj - self.origin[1]
+
+            if self.counts[i, j] == 0:
+                self.visited_cells += 1
+                if self.bounds is None:
+                    self.bounds = [ci, cj, ci, cj]
+                else:
+                    bounds = self.bounds
+                    bounds[0], bounds[1] = min(bounds[0], ci), min(bounds[1], cj)
+                    bounds[2], bounds[3] = max(bounds[2], ci), max(bounds[3], cj)
+            self.counts[i, j] += 1
+            self.total_visits += 1
+            return int(self.counts[i, j])
+
+    def _grow(self, ci, cj):
+        """Reallocate so cell (ci, cj) fits, doubling each axis as needed"""
+        rows, cols = self.counts.shape
+        oi, oj = self.origin
+        lo_i, hi_i = min(oi, ci), max(oi + rows, ci + 1)
+        lo_j, hi_j = min(oj, cj), max(oj + cols, cj + 1)
+        new_rows, new_cols = rows, cols
+        while new_rows < hi_i - lo_i:
+            new_rows *= 2
+        while new_cols < hi_j - lo_j:
+            new_cols *= 2
+
+        # Leave the spare room on the side the rover is heading
+        new_oi = lo_i if ci >= oi else hi_i - new_rows
+        new_oj = lo_j if cj >= oj else hi_j - new_cols
+        counts = np.zeros((new_rows, new_cols), dtype=self.counts.dtype)
+        counts[oi - new_oi:oi - new_oi + rows, oj - new_oj:oj - new_oj + cols] = self.counts
+        self.counts = counts
+        self.origin = (new_oi, new_oj)
+
+    def coverage_percent(self):
+        """Visited cells as a percentage of the site (or explored bounding box)"""
+        if not self.visited_cells:
+            return 0.0
+        if self.area_cells:
+            total = self.area_cells
+        else:
+            min_i, min_j, max_i, max_j = self.bounds
+            total = (max_i - min_i + 1) * (max_j - min_j + 1)
+        return 100.0 * self.visited_cells / total
+
+    def summary(self):
+        with self._lock:
+            visited = self.counts[self.counts > 0]
+            summary = {
+                "cell_size": self.cell_size,
+                "visited_cells": self.visited_cells,
+                "total_visits": self.total_visits,
+                "coverage_percent": round(self.coverage_percent(), 2),
+                "max_visits": int(visited.max()) if visited.size else 0,
+                "mean_visits": round(float(visited.mean()), 2) if visited.size else 0.0,
+                "revisited_cells": int(np.count_nonzero(visited > 1)),
+                "bounds": None
+            }
+            if self.bounds is not None:
+                min_i, min_j, max_i, max_j = self.bounds
+                summary["bounds"] = {
+                    "min_x": min_i * self.cell_size, "min_y": min_j * self.cell_size,
+                    "max_x": (max_i + 1) * self.cell_size, "max_y": (max_j + 1) * self.cell_size
+                }
+        return summary
+
+    def hotspots(self, n=5):
+        """The n most visited cells, most visited first"""
+        with self._lock:
+            if not self.visited_cells or n <= 0:
+                return []
+            flat = self.counts.ravel()
+            n = min(n, flat.size)
+            top = np.argpartition(flat, -n)[-n:]
+            top = top[np.argsort(flat[top])[::-1]]
+            rows, cols = np.unravel_index(top, self.counts.shape)
+            oi, oj = self.origin
+            return [
+                {"x": (int(i) + oi) * self.cell_size, "y": (int(j) + oj) * self.cell_size, "visits": int(flat[k])}
+                for i, j, k in zip(rows, cols, top) if flat[k] > 0
+            ]
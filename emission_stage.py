@@ -0,0 +1,92 @@
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+
+
+class EmissionStage:
+    """Coalesces Socket.IO events and sends only what changed
+
+    Inside batch(), publish() keeps the latest payload per topic and append()
+    collects items for list topics; everything is sent once, one event per
+    topic, when the outermost batch exits. Outside a batch events are sent
+    right away. A published payload whose hash matches the last one sent on
+    its topic is skipped.
+    """
+
+    def __init__(self, socketio, namespace='/'):
+        self.socketio = socketio
+        self.namespace = namespace
+        self.sent = 0
+        self.skipped = 0
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._pending = {}  # topic -> (payload or callable, dedupe), in first-queued order
+        self._hashes = {}
+
+    def publish(self, topic, payload, dedupe=True):
+        """Queue the latest state for a topic
+
+        payload may be a callable; it is called at flush time so it sees the
+        state at the end of the batch, and may return None to send nothing.
+        """
+        with self._lock:
+            self._pending[topic] = (payload, dedupe)
+        self._flush_if_idle()
+
+    def append(self, topic, item):
+        """Queue one item for a list topic; the topic is sent as a list"""
+        with self._lock:
+            items, _ = self._pending.setdefault(topic, ([], False))
+            items.append(item)
+        self._flush_if_idle()
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+            self._flush_if_idle()
+
+    def _flush_if_idle(self):
+        if self._depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Send one event per queued topic, skipping unchanged payloads"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            events = []
+            for topic, (payload, dedupe) in pending.items():
+                if callable(payload):
+                    payload = payload()
+                if payload is None:
+                    continue
+                if dedupe:
+                    digest = payload_hash(payload)
+                    if self._hashes.get(topic) == digest:
+                        self.skipped += 1
+                        continue
+                    self._hashes[topic] = digest
+                events.append((topic, payload))
+
+        for topic, payload in events:
+            self.socketio.emit(topic, payload, namespace=self.namespace)
+            self.sent += 1
+
+    def forget(self, topic=None):
+        """Drop remembered hashes so the next publish is always sent"""
+        with self._lock:
+            if topic is None:
+                self._hashes.clear()
+            else:
+                self._hashes.pop(topic, None)
+
+
+def payload_hash(payload):
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).digest()
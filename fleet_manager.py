@@ -0,0 +1,184 @@
+import heapq
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from rover_mission import RoverMission
+from rover_simulation import RoverSimulation
+
+
+class FleetRover:
+    """Book-keeping for one rover in the fleet"""
+
+    def __init__(self, rover_id, mission):
+        self.rover_id = rover_id
+        self.mission = mission
+        self.started = False
+        self.stopping = False
+        self.started_at = time.time()
+        self.ticks = 0
+        self.busy = False
+
+    def summary(self):
+        snapshot = self.mission.snapshot
+        rover_data = snapshot.fields
+        return {
+            "rover_id": self.rover_id,
+            "namespace": self.mission.namespace,
+            "session_id": rover_data.get("session_id"),
+            "status": rover_data["status"],
+            "battery": rover_data["battery"],
+            "position": rover_data["position"],
+            "survivors_found": len(self.mission.survivor_index),
+            "coverage": snapshot.coverage,
+            "ticks": self.ticks,
+            "running": self.mission.running
+        }
+
+
+class RoverFleet:
+    """Runs many RoverMissions on one shared worker pool
+
+    Rovers do not own threads; their commands go out on the command outbox's
+    shared lane pools. A scheduler thread keeps a heap of due times and hands
+    each rover's next tick to the pool; a rover is rescheduled only after its
+    current tick finishes, at the delay its mission's TickScheduler
+    picks (or sooner, when one of its timers is due), so its state is never
+    touched by two workers at once.
+    """
+
+    def __init__(self, socketio, max_workers=8, base_url=None, transport=None, recorder=None):
+        self.socketio = socketio
+        self.base_url = base_url
+        self.transport = transport
+        self.recorder = recorder
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rover-fleet')
+        self.rovers = {}
+        self._schedule = []
+        self._condition = threading.Condition()
+        self._scheduler = None
+        self._closed = False
+
+    def start_rover(self, rover_id=None):
+        """Create a rover with its own session and namespace and schedule it"""
+        rover_id = rover_id or uuid.uuid4().hex[:8]
+        with self._condition:
+            if rover_id in self.rovers:
+                return None
+            simulation = RoverSimulation(transport=self.transport, base_url=self.base_url)
+            mission = RoverMission(simulation, self.socketio, namespace=f"/rover/{rover_id}", rover_id=rover_id,
+                                   recorder=self.recorder)
+            mission.running = True
+            rover = FleetRover(rover_id, mission)
+            self.rovers[rover_id] = rover
+            self._ensure_scheduler()
+            self._push(time.monotonic(), rover_id)
+        return rover
+
+    def stop_rover(self, rover_id):
+        """Ask a rover to stop; it shuts down on its next turn in the pool"""
+        with self._condition:
+            rover = self.rovers.get(rover_id)
+            if rover is None or rover.stopping:
+                return False
+            rover.stopping = True
+            rover.mission.request_stop()  # Frees a worker blocked on this rover's requests
+            self._push(time.monotonic(), rover_id)
+        return True
+
+    def get_rover(self, rover_id):
+        with self._condition:
+            return self.rovers.get(rover_id)
+
+    def list_rovers(self):
+        with self._condition:
+            rovers = list(self.rovers.values())
+        return [rover.summary() for rover in rovers]
+
+    def shutdown(self, timeout=10):
+        """Stop every rover, wait for them to finish, then stop the worker pool"""
+        with self._condition:
+            rover_ids = list(self.rovers)
+        for rover_id in rover_ids:
+            self.stop_rover(rover_id)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self.rovers and time.monotonic() < deadline:
+                self._condition.wait(0.1)
+            self._closed = True
+            self._condition.notify_all()
+        self.executor.shutdown(wait=True)
+
+    def _ensure_scheduler(self):
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(target=self._run_scheduler, name='rover-fleet-scheduler', daemon=True)
+            self._scheduler.start()
+
+    def _push(self, due, rover_id):
+        heapq.heappush(self._schedule, (due, rover_id))
+        self._condition.notify_all()
+
+    def _run_scheduler(self):
+        """Hand due rovers to the worker pool"""
+        with self._condition:
+            while not self._closed:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due, rover_id = self._schedule[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._schedule)
+                rover = self.rovers.get(rover_id)
+                if rover is None or rover.busy:
+                    continue
+                rover.busy = True
+                self.executor.submit(self._step, rover)
+
+    def _step(self, rover):
+        """Run one unit of work for a rover on a pool worker"""
+        mission = rover.mission
+        reschedule = True
+        starting = False
+        try:
+            if rover.stopping:
+                reschedule = False
+            elif not rover.started:
+                rover.started = starting = True
+                reschedule = bool(mission.start())
+            else:
+                if mission.wake():
+                    rover.ticks += 1
+        except Exception as e:
+            mission.add_log_entry(f"Simulation error: {str(e)}", "error")
+            if starting:
+                reschedule = False  # Never got going; don't keep ticking it
+        finally:
+            if not reschedule:
+                self._retire(mission)
+            with self._condition:
+                rover.busy = False
+                if not reschedule:
+                    self.rovers.pop(rover.rover_id, None)
+                    self._condition.notify_all()
+                elif rover.stopping:
+                    self._push(time.monotonic(), rover.rover_id)
+                else:
+                    self._push(time.monotonic() + mission.next_interval(), rover.rover_id)
+
+    def _retire(self, mission):
+        """Shut down a mission that is leaving the fleet, however it got here
+
+        Also covers rovers that failed to start or were stopped before their
+        first turn, so none leaves a session, outbox threads or an unset idle
+        event behind.
+        """
+        try:
+            mission.shutdown()
+        except Exception as e:
+            print(f"Error shutting down rover {mission.rover_id}: {str(e)}")
+            mission.running = False
+            mission.mark_idle()
@@ -0,0 +1,133 @@
+import argparse
+
+import numpy as np
+
+DIRECTIONS = ("forward", "backward", "left", "right")
+# Position change per direction, as in RovXController.update_status ([x, z])
+DIRECTION_VECTORS = np.array([[0.0, 1.0], [0.0, -1.0], [-1.0, 0.0], [1.0, 0.0]])
+STOPPED = -1
+
+
+class FleetPhysics:
+    """Battery, recharge, position and comms state of many rovers, stepped together
+
+    Each rover follows the RovXController rules: it drains faster while moving,
+    starts recharging (and stops) at or below recharge_start, charges up to
+    recharge_stop, and can't move while recharging or depleted. Comms are lost
+    at or below comms_loss, as in RoverSimulation. State is kept in NumPy arrays
+    so step() advances the whole fleet without a per-rover Python loop.
+    """
+
+    def __init__(self, count, battery=100.0, recharge_start=5, recharge_stop=80, comms_loss=10,
+                 recharge_rate=10, discharge_moving=2, discharge_idle=0.5, move_speed=0.5):
+        self.count = count
+        self.recharge_start = recharge_start
+        self.recharge_stop = recharge_stop
+        self.comms_loss = comms_loss
+        self.recharge_rate = recharge_rate  # % per second
+        self.discharge_moving = discharge_moving  # % per second
+        self.discharge_idle = discharge_idle  # % per second
+        self.move_speed = move_speed  # Units per second
+
+        self.battery = np.full(count, battery, dtype=np.float64)
+        self.recharging = np.zeros(count, dtype=bool)
+        self.position = np.zeros((count, 2), dtype=np.float64)
+        self.direction = np.full(count, STOPPED, dtype=np.int8)  # Index into DIRECTIONS, or STOPPED
+        self.comms = self.battery > self.comms_loss
+
+        self.elapsed = 0.0
+        self.steps = 0
+        self.recharges_started = 0
+        self.recharges_completed = 0
+        self.distance = 0.0
+
+    def set_directions(self, directions):
+        """Command directions for the fleet (DIRECTIONS indexes or STOPPED)
+
+        Like RovXController.set_speeds, rovers that are recharging or depleted
+        stay stopped.
+        """
+        directions = np.broadcast_to(np.asarray(directions, dtype=np.int8), self.direction.shape)
+        self.direction = np.where(self.recharging | (self.battery <= 0), STOPPED, directions).astype(np.int8)
+
+    def step(self, dt):
+        """Advance every rover by dt seconds"""
+        charging = self.recharging
+        moving = self.direction != STOPPED
+
+        # Charge up to recharge_stop; drain at the moving or idle rate otherwise
+        drain = np.where(moving, self.discharge_moving, self.discharge_idle)
+        battery = np.where(charging,
+                           np.minimum(self.recharge_stop, self.battery + self.recharge_rate * dt),
+                           np.maximum(0.0, self.battery - drain * dt))
+
+        completed = charging & (battery >= self.recharge_stop)
+        started = ~charging & (battery <= self.recharge_start)
+        recharging = (charging & ~completed) | started
+        self.direction[started] = STOPPED
+
+        # Only rovers still able to move change position
+        moving = (self.direction != STOPPED) & ~recharging & (battery > 0)
+        indexes = np.flatnonzero(moving)
+        if indexes.size:
+            self.position[indexes] += DIRECTION_VECTORS[self.direction[indexes]] * (self.move_speed * dt)
+
+        self.battery = battery
+        self.recharging = recharging
+        self.comms = battery > self.comms_loss
+        self.elapsed += dt
+        self.steps += 1
+        self.recharges_started += int(np.count_nonzero(started))
+        self.recharges_completed += int(np.count_nonzero(completed))
+        self.distance += indexes.size * self.move_speed * dt
+
+    def run(self, steps, dt, policy=None):
+        """Run steps of dt seconds, letting policy(fleet) set directions before each"""
+        for _ in range(steps):
+            if policy is not None:
+                policy(self)
+            self.step(dt)
+        return self
+
+    def summary(self):
+        return {
+            "rovers": self.count,
+            "elapsed": self.elapsed,
+            "steps": self.steps,
+            "moving": int(np.count_nonzero(self.direction != STOPPED)),
+            "recharging": int(np.count_nonzero(self.recharging)),
+            "comms_lost": int(np.count_nonzero(~self.comms)),
+            "depleted": int(np.count_nonzero(self.battery <= 0)),
+            "mean_battery": round(float(self.battery.mean()), 2) if self.count else 0.0,
+            "min_battery": round(float(self.battery.min()), 2) if self.count else 0.0,
+            "recharges_started": self.recharges_started,
+            "recharges_completed": self.recharges_completed,
+            "distance": round(self.distance, 2)
+        }
+
+
+def random_walk_policy(seed=None):
+    """RoverSimulation's policy: every rover that isn't recharging moves in a random direction"""
+    rng = np.random.default_rng(seed)
+
+    def policy(fleet):
+        fleet.set_directions(rng.integers(0, len(DIRECTIONS), fleet.count, dtype=np.int8))
+    return policy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate battery and recharge behaviour of a rover fleet")
+    parser.add_argument("--rovers", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=3600, help="Simulated seconds")
+    parser.add_argument("--dt", type=float, default=1.0, help="Seconds per step")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fleet = FleetPhysics(args.rovers)
+    fleet.run(int(args.duration / args.dt), args.dt, random_walk_policy(args.seed))
+    for key, value in fleet.summary().items():
+        print(f"{key:<20} {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# Local stand-in for the RoverX backend.
+#
+# Implements the same /api/session/start and /api/rover/* contract as the
+# hosted service with deterministic rover behaviour, plus injectable latency,
+# jitter and error rates. Point any client at it with
+# ROVER_API_URL=http://127.0.0.1:8000 or the client's base_url argument.
+import argparse
+import random
+import threading
+import time
+import uuid
+
+from flask import Flask, request, jsonify
+from werkzeug.serving import make_server
+
+# Communication is lost below this battery level (same as RoverSimulation)
+COMMS_LOSS = 10
+
+# Deterministic battery model, applied per command or per sensor read
+MOVE_COST = 3        # % per move command
+IDLE_COST = 0.5      # % per sensor read while not charging
+CHARGE_STEP = 10     # % per sensor read while charging
+
+MOVES = {
+    "forward": (0, 1),
+    "backward": (0, -1),
+    "left": (-1, 0),
+    "right": (1, 0)
+}
+
+
+class RoverState:
+    """State of one simulated rover session"""
+
+    def __init__(self, seed, tag_count=25, area=20):
+        self.rng = random.Random(seed)
+        self.battery = 100.0
+        self.x = 0
+        self.y = 0
+        self.status = "Idle"
+        self.recharging = False
+        self.step = 0
+
+        # Fixed RFID tags scattered over the site
+        self.tags = set()
+        while len(self.tags) < tag_count:
+            self.tags.add((self.rng.randint(-area, area), self.rng.randint(-area, area)))
+
+    def drain(self, amount):
+        self.battery = max(0.0, self.battery - amount)
+
+    def advance(self):
+        """Advance the battery model by one sensor read"""
+        self.step += 1
+        if self.recharging:
+            self.battery = min(100.0, self.battery + CHARGE_STEP)
+        else:
+            self.drain(IDLE_COST)
+
+    def move(self, direction):
+        dx, dy = MOVES[direction]
+        self.x += dx
+        self.y += dy
+        self.recharging = False
+        self.status = f"Moving {direction}"
+        self.drain(MOVE_COST)
+
+    def stop(self):
+        if not self.recharging:
+            self.status = "Idle"
+
+    def charge(self):
+        self.recharging = True
+        self.status = "Charging"
+
+    def battery_level(self):
+        return int(round(self.battery))
+
+    def comms_status(self):
+        return "Active" if self.battery > COMMS_LOSS else "Lost"
+
+    def status_payload(self):
+        return {
+            "status": self.status,
+            "battery": self.battery_level(),
+            "coordinates": [self.x, self.y]
+        }
+
+    def sensor_payload(self):
+        distance = self.rng.choice([None, round(self.rng.uniform(0.2, 5.0), 2)])
+        return {
+            "timestamp": time.time(),
+            "position": {"x": self.x, "y": self.y},
+            "accelerometer": {
+                "x": round(self.rng.uniform(-0.2, 0.2), 3),
+                "y": round(self.rng.uniform(-0.2, 0.2), 3),
+                "z": round(9.81 + self.rng.uniform(-0.05, 0.05), 3)
+            },
+            "battery_level": self.battery_level(),
+            "communication_status": self.comms_status(),
+            "recharging": self.recharging,
+            "ultrasonic": {"distance": distance, "detection": distance is not None and distance < 1.0},
+            "ir": {"reflection": self.step % 7 == 0},
+            "rfid": {"tag_detected": (self.x, self.y) in self.tags}
+        }
+
+
+class FaultInjector:
+    """Adds latency, jitter and random errors to responses"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self):
+        with self.lock:
+            jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        delay_ms = max(0, self.latency_ms + jitter)
+        if delay_ms:
+            time.sleep(delay_ms / 1000.0)
+
+    def should_fail(self):
+        if not self.error_rate:
+            return False
+        with self.lock:
+            return self.rng.random() < self.error_rate
+
+
+def create_app(latency_ms=0, jitter_ms=0, error_rate=0.0, seed=0):
+    """Build the stand-in backend Flask app"""
+    app = Flask(__name__)
+    faults = FaultInjector(latency_ms, jitter_ms, error_rate, seed)
+    sessions = {}
+    lock = threading.Lock()
+    app.config["FAULTS"] = faults
+    app.config["SESSIONS"] = sessions
+
+    def get_rover():
+        session_id = request.args.get("session_id")
+        return sessions.get(session_id)
+
+    @app.before_request
+    def inject_faults():
+        faults.delay()
+        if faults.should_fail():
+            return jsonify({"error": "Injected fault"}), 503
+
+    @app.route("/api/session/start", methods=["POST"])
+    def start_session():
+        with lock:
+            session_id = str(uuid.UUID(int=random.Random(seed + len(sessions)).getrandbits(128)))
+            sessions[session_id] = RoverState(seed + len(sessions))
+        return jsonify({"session_id": session_id, "message": "Session started"})
+
+    @app.route("/api/rover/status", methods=["GET"])
+    def status():
+        rover = get_rover()
+        if rover is None:
+            return jsonify({"error": "Invalid session ID"}), 404
+        with lock:
+            return jsonify(rover.status_payload())
+
+    @app.route("/api/rover/sensor-data", methods=["GET"])
+    def sensor_data():
+        rover = get_rover()
+        if rover is None:
+            return jsonify({"error": "Invalid session ID"}), 404
+        with lock:
+            rover.advance()
+            return jsonify(rover.sensor_payload())
+
+    @app.route("/api/rover/move", methods=["POST"])
+    def move():
+        rover = get_rover()
+        if rover is None:
+            return jsonify({"error": "Invalid session ID"}), 404
+        direction = request.args.get("direction", "").lower()
+        if direction not in MOVES:
+            return jsonify({"error": f"Invalid direction: {direction}"}), 400
+        with lock:
+            if rover.comms_status() != "Active" and not rover.recharging:
+                return jsonify({"error": "Communication lost"}), 409
+            rover.move(direction)
+        return jsonify({"message": f"Rover moving {direction}"})
+
+    @app.route("/api/rover/stop", methods=["POST"])
+    def stop():
+        rover = get_rover()
+        if rover is None:
+            return jsonify({"error": "Invalid session ID"}), 404
+        with lock:
+            rover.stop()
+        return jsonify({"message": "Rover stopped"})
+
+    @app.route("/api/rover/charge", methods=["POST"])
+    def charge():
+        rover = get_rover()
+        if rover is None:
+            return jsonify({"error": "Invalid session ID"}), 404
+        with lock:
+            rover.charge()
+        return jsonify({"message": "Rover charging"})
+
+    return app
+
+
+def serve_in_thread(host="127.0.0.1", port=0, **options):
+    """Start the stand-in backend in a daemon thread
+
+    Returns (server, base_url); call server.shutdown() to stop it.
+    """
+    server = make_server(host, port, create_app(**options), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in rover backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Base latency added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform +/- jitter around the base latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    print(f"Stand-in rover backend on http://{args.host}:{args.port}")
+    app.run(host=args.host, port=args.port, threaded=True)
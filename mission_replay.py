@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import deque
+
+from rover_mission import RoverMission
+
+
+def check_speed(speed):
+    if not speed > 0:
+        raise ValueError("speed must be positive")
+
+
+class MissionReplay:
+    """Streams a recorded mission through the live dashboard events
+
+    Events are read from the TelemetryStore a window at a time and applied
+    to a backend-less RoverMission, so clients get the same status_update,
+    sensor_update, movement_update, map_update and log_update events (and
+    the REST endpoints serve the replayed state). Mission time advances at
+    `speed` times wall time; each frame applies every event that fell due
+    and sends them coalesced, so nothing is dropped at high speeds.
+    """
+
+    def __init__(self, store, mission_id, socketio, namespace='/', speed=10.0, frame_interval=0.05, window=60.0):
+        info = store.mission(mission_id)
+        if info is None:
+            raise ValueError(f"No recorded mission {mission_id}")
+        check_speed(speed)
+        self.store = store
+        self.mission_id = mission_id
+        self.socketio = socketio
+        self.namespace = namespace
+        self.speed = speed
+        self.frame_interval = frame_interval
+        self.window = window
+        self.start_ts = info["start"]
+        self.end_ts = info["end"]
+        self.rover_id = info["rover_id"]
+
+        self.position = self.start_ts  # Mission time reached so far
+        self.paused = False
+        self.finished = False
+        self.events_applied = 0
+        self.frames = 0
+        self._pending = deque()
+        self._loaded_until = self.start_ts
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self.mission = self._new_mission()
+
+    def _new_mission(self):
+        return RoverMission(None, self.socketio, namespace=self.namespace, rover_id=self.rover_id)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='mission-replay', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def pause(self):
+        with self._lock:
+            self.paused = True
+        self._wake.set()
+
+    def resume(self):
+        with self._lock:
+            self.paused = False
+        self._wake.set()
+
+    def set_speed(self, speed):
+        check_speed(speed)
+        with self._lock:
+            self.speed = speed
+        self._wake.set()
+
+    def seek(self, offset):
+        """Jump to `offset` seconds into the mission
+
+        State is rebuilt from the start in one batch under a new mission, so
+        clients see a new map epoch and resync.
+        """
+        with self._lock:
+            target = self.start_ts + min(max(offset, 0.0), self.end_ts - self.start_ts)
+            self.mission = self._new_mission()
+            self._pending.clear()
+            self._loaded_until = self.start_ts
+            self.position = target
+            self.finished = False
+            self.events_applied = 0
+            with self.mission.update():
+                for event in self._take_due(target):
+                    self._apply(event)
+        self._wake.set()
+
+    def status(self):
+        with self._lock:
+            return {
+                "mission": self.mission_id,
+                "rover_id": self.rover_id,
+                "offset": self.position - self.start_ts,
+                "duration": self.end_ts - self.start_ts,
+                "speed": self.speed,
+                "paused": self.paused,
+                "finished": self.finished,
+                "events_applied": self.events_applied,
+                "frames": self.frames
+            }
+
+    def _load_until(self, ts):
+        """Read windows of events from the store until ts is covered"""
+        while self._loaded_until <= ts and self._loaded_until <= self.end_ts:
+            end = self._loaded_until + self.window
+            self._pending.extend(self.store.read(mission=self.mission_id, start=self._loaded_until, end=end))
+            self._loaded_until = end
+
+    def _take_due(self, ts):
+        self._load_until(ts)
+        due = []
+        while self._pending and self._pending[0]["ts"] <= ts:
+            due.append(self._pending.popleft())
+        return due
+
+    def _run(self):
+        last = time.monotonic()
+        while not self._stopped:
+            now = time.monotonic()
+            with self._lock:
+                if not self.paused and not self.finished:
+                    self.position = min(self.end_ts, self.position + (now - last) * self.speed)
+                last = now
+
+                due = self._take_due(self.position)
+                if due:
+                    with self.mission.update():
+                        for event in due:
+                            self._apply(event)
+                    self.frames += 1
+                if self.position >= self.end_ts and not self._pending and not self.finished:
+                    self.finished = True
+                    self.mission.add_log_entry("Replay finished", "info")
+
+                idle = self.paused or self.finished
+                next_due = self._pending[0]["ts"] if self._pending else self._loaded_until
+                wait = None if idle else min(1.0, max(self.frame_interval, (next_due - self.position) / self.speed))
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def _apply(self, event):
+        """Apply one recorded event to the replay mission, queueing its Socket.IO events"""
+        mission = self.mission
+        rover_data = mission.rover_data
+        kind, payload = event["kind"], event["payload"]
+        self.events_applied += 1
+
+        if kind == "status":
+            for key in ("status", "battery", "position", "session_id"):
+                if key in payload:
+                    rover_data[key] = payload[key]
+            self._move_to(payload.get("position"))
+            mission.emit_status()
+        elif kind == "sensor":
+            rover_data["sensor_data"] = payload
+            if "battery_level" in payload:
+                rover_data["battery"] = min(payload["battery_level"], 100)
+            mission.stage.publish('sensor_update', payload)
+            self._move_to(payload.get("position"))
+        elif kind == "move":
+            rover_data["movement_history"].append(payload)
+            mission.stage.publish('movement_update', mission.build_movement_update, dedupe=False)
+            mission.emit_map_update(self._current_position(), payload.get("direction"))
+        elif kind == "log":
+            rover_data["log_entries"].append(payload)
+            mission.stage.append('log_update', payload)
+        elif kind == "survivor":
+            position = payload["position"]
+            if mission.survivor_index.add(position):
+                rover_data["survivors_found"].append(position)
+            mission.emit_map_update(self._current_position())
+
+    def _current_position(self):
+        position = self.mission.rover_data["position"]
+        return [position["x"], position["y"]]
+
+    def _move_to(self, position):
+        if not position:
+            return
+        self.mission.rover_data["position"] = {"x": position["x"], "y": position["y"]}
+        current_pos = [position["x"], position["y"]]
+        self.mission.record_position(current_pos)
+        self.mission.emit_map_update(current_pos)
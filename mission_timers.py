@@ -0,0 +1,86 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class MissionTimers:
+    """Named one-shot timers for delayed mission events, kept in a heap
+
+    Scheduling a name that is already pending moves it to the new due time.
+    The mission loop waits at most until next_due_in() and then calls
+    run_due(), so events fire at their due time instead of on the next poll.
+    Replaced and cancelled entries stay in the heap and are skipped when
+    they reach the top.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.fired = 0
+        self._heap = []
+        self._timers = {}  # name -> (due, seq, callback) of the live entry
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def schedule(self, delay, name, callback):
+        """Call callback() once, delay seconds from now; returns the due time"""
+        due = self.clock() + max(0.0, delay)
+        with self._lock:
+            entry = (due, next(self._seq), callback)
+            self._timers[name] = entry
+            heapq.heappush(self._heap, (due, entry[1], name))
+        return due
+
+    def cancel(self, name):
+        with self._lock:
+            return self._timers.pop(name, None) is not None
+
+    def pending(self, name):
+        with self._lock:
+            return name in self._timers
+
+    def due_in(self, name):
+        """Seconds until a timer fires, or None if it isn't pending"""
+        with self._lock:
+            entry = self._timers.get(name)
+        return None if entry is None else max(0.0, entry[0] - self.clock())
+
+    def next_due_in(self):
+        """Seconds until the earliest pending timer, or None if there are none"""
+        with self._lock:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            due = self._heap[0][0]
+        return max(0.0, due - self.clock())
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap:
+            _, seq, name = heap[0]
+            entry = self._timers.get(name)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(heap)
+
+    def run_due(self):
+        """Fire every timer that is due, earliest first; returns how many fired"""
+        now = self.clock()
+        due = []
+        with self._lock:
+            while True:
+                self._drop_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, name = heapq.heappop(self._heap)
+                due.append(self._timers.pop(name)[2])
+        # Callbacks run outside the lock so they can schedule follow-up timers
+        for callback in due:
+            callback()
+        self.fired += len(due)
+        return len(due)
+
+    def clear(self):
+        with self._lock:
+            self._timers.clear()
+            self._heap.clear()
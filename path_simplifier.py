@@ -0,0 +1,92 @@
+import math
+import threading
+
+MIN_COARSEN_TOLERANCE = 1e-3  # Coarsening starts here when the tolerance is 0
+
+
+def simplify(points, tolerance):
+    """Ramer-Douglas-Peucker: drop points closer than tolerance to the simplified line
+
+    The first and last points are always kept.
+    """
+    n = len(points)
+    if n < 3:
+        return [list(p) for p in points]
+
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        ax, ay = points[start][0], points[start][1]
+        bx, by = points[end][0], points[end][1]
+        dx, dy = bx - ax, by - ay
+        norm = math.hypot(dx, dy)
+
+        max_distance, index = -1.0, None
+        for i in range(start + 1, end):
+            px, py = points[i][0], points[i][1]
+            if norm == 0:
+                distance = math.hypot(px - ax, py - ay)
+            else:
+                distance = abs(dy * px - dx * py + bx * ay - by * ax) / norm
+            if distance > max_distance:
+                max_distance, index = distance, i
+
+        if index is not None and max_distance > tolerance:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    return [list(p) for p, kept in zip(points, keep) if kept]
+
+
+class PathSimplifier:
+    """Incrementally simplified copy of a growing path
+
+    New points collect in a raw tail. Once the tail reaches chunk_size points
+    it is simplified and frozen, so each update only re-simplifies the tail.
+    If the frozen part outgrows max_points it is re-simplified at doubled
+    tolerances until it fits in half of that, keeping long missions bounded.
+    """
+
+    def __init__(self, tolerance=0.5, chunk_size=256, max_points=2000):
+        if not 0 <= tolerance < math.inf:
+            raise ValueError("tolerance must be a non-negative number")
+        self.tolerance = tolerance
+        self.chunk_size = chunk_size
+        self.max_points = max_points
+        self.frozen_tolerance = tolerance
+        self._frozen = []
+        self._tail = []
+        self._tail_cache = None
+        self._lock = threading.Lock()
+
+    def append(self, point):
+        with self._lock:
+            self._tail.append(list(point))
+            self._tail_cache = None
+            if len(self._tail) < self.chunk_size:
+                return
+
+            # Freeze everything but the tail's last point, which starts the next tail
+            simplified = simplify(self._tail, self.tolerance)
+            self._frozen.extend(simplified[:-1])
+            self._tail = [simplified[-1]]
+            if len(self._frozen) > self.max_points:
+                # Coarsen to half the budget so this stays rare (simplify keeps at least 2 points)
+                target = max(2, self.max_points // 2)
+                self._frozen = simplify(self._frozen, self.frozen_tolerance)
+                while len(self._frozen) > target:
+                    self.frozen_tolerance = max(self.frozen_tolerance * 2, MIN_COARSEN_TOLERANCE)
+                    self._frozen = simplify(self._frozen, self.frozen_tolerance)
+
+    def points(self):
+        """The simplified path, oldest point first"""
+        with self._lock:
+            if self._tail_cache is None:
+                self._tail_cache = simplify(self._tail, self.tolerance)
+            return self._frozen + self._tail_cache
+
+    def __len__(self):
+        return len(self.points())
@@ -1,11 +1,12 @@
-from controller import Robot, Motor, Keyboard
 from rover_api import RoverAPI
+from robot_backend import create_robot
+from controller_telemetry import TelemetryWorker, StepJitter
 import time
 
 class PioneerController:
-    def __init__(self):
-        # Initialize the Webots robot
-        self.robot = Robot()
+    def __init__(self, robot=None, api=None, telemetry_interval=1.0):
+        # Initialize the Webots robot (or an injected stand-in such as HeadlessRobot)
+        self.robot = robot if robot else create_robot()
         self.timestep = int(self.robot.getBasicTimeStep())
         
         # Initialize keyboard
@@ -30,8 +31,11 @@ class PioneerController:
         self.left_back.setVelocity(0)
         self.right_back.setVelocity(0)
         
-        # Initialize the API
-        self.api = RoverAPI()
+        # Initialize the API; polling and commands run off the step loop
+        self.api = api if api else RoverAPI()
+        self.telemetry = TelemetryWorker(self.api, interval=telemetry_interval)
+        self.outbox = self.api.outbox  # Moves coalesce; stops jump ahead of them
+        self.step_jitter = StepJitter(self.timestep)
         
         # Motor speed constants
         self.MAX_SPEED = 6.28  # Maximum motor speed in rad/s
@@ -80,26 +84,44 @@ class PioneerController:
         elif direction == 'stop':
             self.stop()
             
+        if direction in ('forward', 'backward', 'left', 'right'):
+            self.api.queue_move_command(direction)
+            
     def stop(self):
         """Stop all motors"""
         self.set_speeds(0, 0)
         self.current_direction = None
+        self.api.queue_stop_command()
         
     def print_status(self):
-        """Print current rover status"""
-        status = self.api.get_rover_status()
+        """Print the latest rover status polled by the telemetry worker"""
+        status, age = self.telemetry.latest()
         if status:
-            print(f"\nRover Status:")
+            print(f"\nRover Status ({age:.1f}s ago):")
             print(f"Battery: {status['battery']}%")
             print(f"Position: {status['coordinates']}")
             print(f"Status: {status['status']}")
+        else:
+            print("\nNo rover status received yet")
+        print(self.step_jitter.report())
         
     def run(self):
         """Main control loop"""
         print("Pioneer 3-AT controller starting...")
         self.print_menu()
-        
+        self.telemetry.start()
+        try:
+            self.control_loop()
+        finally:
+            self.telemetry.stop()
+            self.outbox.close()
+            print(self.step_jitter.report())
+            
+    def control_loop(self):
+        """Handle key presses, once per robot step"""
         while self.robot.step(self.timestep) != -1:
+            self.step_jitter.mark()
+            
             # Get keyboard input
             key = self.keyboard.getKey()
             
@@ -0,0 +1,40 @@
+import threading
+from collections import OrderedDict
+
+
+class VersionedResponseCache:
+    """Serialized response bodies, each valid for one state version
+
+    get() builds a body at most once per (key, version); a newer version
+    replaces the cached body, and the least recently used keys are evicted
+    beyond max_entries.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        # Build outside the lock so one slow build doesn't block other keys
+        body = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,169 @@
+import json
+import os
+import threading
+from array import array
+
+
+class RingBuffer:
+    """Fixed-capacity history that keeps the newest items
+
+    Storage is preallocated, so appends never grow memory. When full, each
+    append overwrites the oldest item; if spill_path is set, the overwritten
+    item is appended to that file first so nothing is lost. Appends and
+    reads are safe from multiple threads.
+    """
+
+    def __init__(self, capacity, spill_path=None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.total = 0  # Items appended over the buffer's lifetime
+        self.spilled = 0
+        self._start = 0
+        self._size = 0
+        self._spill_file = None
+        self._lock = threading.Lock()
+        self._allocate()
+
+    # Storage hooks (overridden by PointBuffer)
+
+    def _allocate(self):
+        self._items = [None] * self.capacity
+
+    def _get(self, slot):
+        return self._items[slot]
+
+    def _set(self, slot, item):
+        self._items[slot] = item
+
+    def _open_spill(self):
+        return open(self.spill_path, "a", encoding="utf-8")
+
+    def _write_spill(self, item):
+        self._spill_file.write(json.dumps(item) + "\n")
+
+    # Ring logic
+
+    def append(self, item):
+        with self._lock:
+            if self._size < self.capacity:
+                self._set((self._start + self._size) % self.capacity, item)
+                self._size += 1
+            else:
+                self._spill(self._get(self._start))
+                self._set(self._start, item)
+                self._start = (self._start + 1) % self.capacity
+            self.total += 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def _spill(self, item):
+        if not self.spill_path:
+            return
+        if self._spill_file is None:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._spill_file = self._open_spill()
+        self._write_spill(item)
+        self.spilled += 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        with self._lock:
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("ring buffer index out of range")
+            return self._get((self._start + index) % self.capacity)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __contains__(self, item):
+        return any(existing == item for existing in self)
+
+    def to_list(self):
+        """Return the buffered items, oldest first"""
+        with self._lock:
+            return [self._get((self._start + i) % self.capacity) for i in range(self._size)]
+
+    def since(self, total):
+        """Return the buffered items appended after the buffer's total was `total`
+
+        Items already pushed out of the buffer are not included.
+        """
+        with self._lock:
+            count = min(self.total - total, self._size)
+            if count <= 0:
+                return []
+            return [self._get((self._start + i) % self.capacity) for i in range(self._size - count, self._size)]
+
+    def clear(self):
+        with self._lock:
+            self._start = 0
+            self._size = 0
+
+    def flush(self):
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def read_spilled(self):
+        """Return every item spilled to disk, oldest first"""
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return []
+        self.flush()
+        with open(self.spill_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class PointBuffer(RingBuffer):
+    """RingBuffer of [x, y] points stored in two preallocated float arrays
+
+    Spilled points are written as packed doubles (x, y pairs).
+    """
+
+    def _allocate(self):
+        self._xs = array('d', [0.0]) * self.capacity
+        self._ys = array('d', [0.0]) * self.capacity
+
+    def _get(self, slot):
+        return [self._xs[slot], self._ys[slot]]
+
+    def _set(self, slot, item):
+        self._xs[slot] = item[0]
+        self._ys[slot] = item[1]
+
+    def _open_spill(self):
+        return open(self.spill_path, "ab")
+
+    def _write_spill(self, item):
+        array('d', item).tofile(self._spill_file)
+
+    def last(self):
+        """Return the newest point, or None if empty"""
+        with self._lock:
+            if not self._size:
+                return None
+            return self._get((self._start + self._size - 1) % self.capacity)
+
+    def read_spilled(self):
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return []
+        self.flush()
+        values = array('d')
+        with open(self.spill_path, "rb") as f:
+            values.frombytes(f.read())
+        return [[values[i], values[i + 1]] for i in range(0, len(values) - 1, 2)]
@@ -0,0 +1,150 @@
+import time
+
+NO_KEY = -1  # What Keyboard.getKey() returns when no key is pressed
+
+
+def create_robot():
+    """The Webots Robot for this controller process
+
+    Imported lazily so the controllers can be loaded (and run headless)
+    without the Webots controller module installed.
+    """
+    from controller import Robot
+    return Robot()
+
+
+def parse_key_script(script):
+    """Turn "step:key,step:key" into [(step, key code)], e.g. "0:W,100:A,200:X"
+
+    Keys are single characters (upper-cased, as Webots reports letters) or
+    integer key codes.
+    """
+    keys = []
+    for entry in script.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        step, key = entry.split(":", 1)
+        keys.append((int(step), key))
+    return keys
+
+
+def key_code(key):
+    if isinstance(key, int):
+        return key
+    return int(key) if key.isdigit() and len(key) > 1 else ord(key.upper())
+
+
+class StubMotor:
+    """Records the position and velocity a controller sets on a wheel"""
+
+    def __init__(self, name):
+        self.name = name
+        self.position = 0.0
+        self.velocity = 0.0
+        self.velocity_changes = 0
+
+    def setPosition(self, position):
+        self.position = position
+
+    def setVelocity(self, velocity):
+        if velocity != self.velocity:
+            self.velocity_changes += 1
+        self.velocity = velocity
+
+    def getVelocity(self):
+        return self.velocity
+
+
+class ScriptedKeyboard:
+    """Replays key presses at given robot steps
+
+    keys is a list of (step, key) pairs; each key is returned by getKey() once
+    during that step, so several keys may be queued for the same step.
+    """
+
+    def __init__(self, robot, keys=()):
+        self.robot = robot
+        self.sampling_period = None
+        self._keys = sorted(((step, key_code(key)) for step, key in keys), key=lambda entry: entry[0])
+        self._next = 0
+
+    def enable(self, sampling_period):
+        self.sampling_period = sampling_period
+
+    def disable(self):
+        self.sampling_period = None
+
+    def getKey(self):
+        if self._next < len(self._keys) and self._keys[self._next][0] <= self.robot.steps:
+            key = self._keys[self._next][1]
+            self._next += 1
+            return key
+        return NO_KEY
+
+    @property
+    def remaining(self):
+        return len(self._keys) - self._next
+
+
+class HeadlessRobot:
+    """Stand-in for the Webots Robot that steps as fast as the controller allows
+
+    Simulated time advances by the requested timestep on every step(). step()
+    returns -1 (simulation ended) after max_steps, or once the key script is
+    exhausted when stop_after_keys is set.
+    """
+
+    def __init__(self, basic_timestep=32, keys=(), max_steps=None, stop_after_keys=False):
+        self.basic_timestep = basic_timestep
+        self.max_steps = max_steps
+        self.stop_after_keys = stop_after_keys
+        self.steps = 0
+        self.sim_time = 0.0
+        self.keyboard = ScriptedKeyboard(self, keys)
+        self.devices = {}
+        self._started = None
+        self._finished = None
+
+    def getBasicTimeStep(self):
+        return self.basic_timestep
+
+    def getTime(self):
+        return self.sim_time
+
+    def getKeyboard(self):
+        return self.keyboard
+
+    def getDevice(self, name):
+        if name not in self.devices:
+            self.devices[name] = StubMotor(name)
+        return self.devices[name]
+
+    def step(self, duration):
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        if self.max_steps is not None and self.steps >= self.max_steps:
+            self._finished = now
+            return -1
+        if self.stop_after_keys and self.steps > 0 and not self.keyboard.remaining:
+            self._finished = now
+            return -1
+        self.steps += 1
+        self.sim_time += duration / 1000.0
+        return 0
+
+    def stats(self):
+        """Steps run and how fast, wall time versus simulated time"""
+        if self._started is None:
+            wall_time = 0.0
+        else:
+            wall_time = (self._finished if self._finished is not None else time.perf_counter()) - self._started
+        return {
+            "steps": self.steps,
+            "sim_time": self.sim_time,
+            "wall_time": wall_time,
+            "steps_per_second": self.steps / wall_time if wall_time else 0.0,
+            "us_per_step": wall_time / self.steps * 1e6 if self.steps else 0.0,
+            "realtime_factor": self.sim_time / wall_time if wall_time else 0.0
+        }
@@ -1,11 +1,16 @@
 import requests
 import time
-from config import SESSION_ID
+from config import SESSION_ID, BASE_URL
+from rover_transport import get_transport
+from command_outbox import CommandOutbox
+from rover_frames import StatusFrame, SensorFrame, FrameError, rover_status
 
 class RoverAPI:
-    def __init__(self, session_id=None):
+    def __init__(self, session_id=None, transport=None, concurrent_fetch=True, base_url=None):
         self.session_id = session_id if session_id else SESSION_ID
-        self.base_url = 'https://roverdata2-production.up.railway.app/api/rover'
+        self.transport = transport if transport else get_transport()
+        self.concurrent_fetch = concurrent_fetch
+        self.base_url = f"{base_url if base_url else BASE_URL}/api/rover"
         self.endpoints = {
             'status': f"{self.base_url}/status",
             'sensor-data': f"{self.base_url}/sensor-data",
@@ -13,6 +18,7 @@ class RoverAPI:
             'stop': f"{self.base_url}/stop"
         }
         self.last_battery = None
+        self.outbox = CommandOutbox()
         
     def get_params(self):
         return {'session_id': self.session_id}
@@ -20,44 +26,31 @@ class RoverAPI:
     def get_rover_status(self):
         """Get both status and sensor data from the rover"""
         try:
-            status_response = requests.get(self.endpoints['status'], params=self.get_params())
-            sensor_response = requests.get(self.endpoints['sensor-data'], params=self.get_params())
+            if self.concurrent_fetch:
+                # Fetch status and sensor data in parallel (one round-trip)
+                status_response, sensor_response = self.transport.get_many([
+                    (self.endpoints['status'], self.get_params()),
+                    (self.endpoints['sensor-data'], self.get_params())
+                ])
+            else:
+                status_response = self.transport.get(self.endpoints['status'], params=self.get_params())
+                sensor_response = self.transport.get(self.endpoints['sensor-data'], params=self.get_params())
             
             if status_response.status_code == 200 and sensor_response.status_code == 200:
                 try:
-                    status_data = status_response.json()
-                    sensor_data = sensor_response.json()
-                    
-                    if 'error' in status_data:
-                        print(f"\nAPI Error: {status_data['error']}")
-                        return None
-                        
-                    if 'error' in sensor_data:
-                        print(f"\nAPI Error: {sensor_data['error']}")
-                        return None
-                    
-                    # Track battery changes
-                    current_battery = status_data.get('battery')
-                    if self.last_battery is not None and current_battery != self.last_battery:
-                        print(f"Battery changed: {self.last_battery} -> {current_battery}")
-                    self.last_battery = current_battery
-                    
-                    return {
-                        'status': status_data.get('status'),
-                        'battery': current_battery,
-                        'coordinates': status_data.get('coordinates'),
-                        'sensor_data': {
-                            'timestamp': sensor_data.get('timestamp'),
-                            'accelerometer': sensor_data.get('accelerometer'),
-                            'communication_status': sensor_data.get('communication_status'),
-                            'ultrasonic': sensor_data.get('ultrasonic'),
-                            'ir': sensor_data.get('ir'),
-                            'rfid': sensor_data.get('rfid')
-                        }
-                    }
-                except Exception as e:
-                    print(f"Error parsing JSON response: {e}")
+                    status = StatusFrame.decode(status_response.content)
+                    sensor = SensorFrame.decode(sensor_response.content)
+                except FrameError as e:
+                    print(f"\nAPI Error: {e}")
                     return None
+                
+                # Track battery changes
+                current_battery = status.battery
+                if self.last_battery is not None and current_battery != self.last_battery:
+                    print(f"Battery changed: {self.last_battery} -> {current_battery}")
+                self.last_battery = current_battery
+                
+                return rover_status(status, sensor)
             else:
                 print(f"API Error - Status: {status_response.status_code}, Sensor: {sensor_response.status_code}")
                 return None
@@ -66,20 +59,39 @@ class RoverAPI:
             print(f"Error fetching rover data: {e}")
             return None
             
+    def queue_move_command(self, direction):
+        """Queue a movement command without waiting; returns its CommandTicket, or None if invalid"""
+        # Convert direction to lowercase and validate
+        direction = direction.lower()
+        if direction not in ['forward', 'backward', 'left', 'right']:
+            print(f"Invalid direction: {direction}")
+            return None
+        return self.outbox.submit('move', self.post_move_command, direction)
+    
+    def queue_stop_command(self):
+        """Queue a stop command ahead of any pending move; returns its CommandTicket"""
+        return self.outbox.submit('stop', self.post_stop_command)
+    
     def send_move_command(self, direction):
-        """Send movement command to the API"""
+        """Send movement command to the API and wait for the response
+        
+        Returns None if the move failed or a newer command replaced it first.
+        """
+        ticket = self.queue_move_command(direction)
+        return ticket.wait() if ticket else None
+    
+    def send_stop_command(self):
+        """Send stop command to the API and wait for the response"""
+        return self.queue_stop_command().wait()
+    
+    def post_move_command(self, direction):
+        """POST a movement command (runs on the outbox's move lane)"""
         try:
-            # Convert direction to lowercase and validate
-            direction = direction.lower()
-            if direction not in ['forward', 'backward', 'left', 'right']:
-                print(f"Invalid direction: {direction}")
-                return None
-
             # Send command with direction in query parameters
             params = self.get_params()
             params['direction'] = direction
             
-            response = requests.post(self.endpoints['move'], params=params)
+            response = self.transport.post(self.endpoints['move'], params=params)
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -98,10 +110,10 @@ class RoverAPI:
             print(f"Error sending move command: {e}")
             return None
             
-    def send_stop_command(self):
-        """Send stop command to the API"""
+    def post_stop_command(self):
+        """POST a stop command (runs on the outbox's priority lane)"""
         try:
-            response = requests.post(self.endpoints['stop'], params=self.get_params())
+            response = self.transport.post(self.endpoints['stop'], params=self.get_params())
             
             if response.status_code == 200:
                 response_data = response.json()
@@ -118,3 +130,7 @@ class RoverAPI:
         except requests.exceptions.RequestException as e:
             print(f"Error sending stop command: {e}")
             return None
+    
+    def close(self):
+        """Send any commands still queued, then refuse new ones"""
+        self.outbox.close()
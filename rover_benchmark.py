@@ -0,0 +1,360 @@
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime
+
+from socketio import packet
+
+from local_rover_server import serve_in_thread
+from rover_api import RoverAPI
+from rover_simulation import RoverSimulation
+from rover_transport import RoverTransport
+
+
+def summarize(samples):
+    """Return latency percentiles (ms) for a list of durations in seconds"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "min_ms": ordered[0] * 1000,
+        "p50_ms": pct(50),
+        "p90_ms": pct(90),
+        "p99_ms": pct(99),
+        "max_ms": ordered[-1] * 1000
+    }
+
+
+def encode_emit(event, data):
+    """Encode a Socket.IO event the way the server does for each emit"""
+    return packet.Packet(packet.EVENT, data=[event, data], namespace='/').encode()
+
+
+class PhaseTimer:
+    """Accumulates time spent in named phases"""
+
+    def __init__(self):
+        self.totals = {}
+
+    def add(self, phase, seconds):
+        self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+
+    def wrap(self, phase, func):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+        return timed
+
+    def reset(self):
+        self.totals = {}
+
+
+class TimedSocketIO:
+    """Stands in for the Socket.IO server and times payload encoding per emit"""
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.emit_count = 0
+        self.last_payload_bytes = {}
+
+    def emit(self, event, data=None, **kwargs):
+        start = time.perf_counter()
+        encoded = encode_emit(event, data)
+        self.timer.add("emit", time.perf_counter() - start)
+        self.emit_count += 1
+        self.last_payload_bytes[event] = len(encoded)
+
+
+def bench_api_latency(base_url, iterations):
+    """Latency percentiles for each RoverAPI call"""
+    transport = RoverTransport()
+    simulation = RoverSimulation(transport=transport, base_url=base_url)
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation.start_session()
+
+    concurrent_api = RoverAPI(session_id=simulation.session_id, transport=transport, base_url=base_url)
+    sequential_api = RoverAPI(session_id=simulation.session_id, transport=transport,
+                              concurrent_fetch=False, base_url=base_url)
+    directions = itertools.cycle(["forward", "right", "backward", "left"])
+    calls = {
+        "get_rover_status": concurrent_api.get_rover_status,
+        "get_rover_status_sequential": sequential_api.get_rover_status,
+        "send_move_command": lambda: concurrent_api.send_move_command(next(directions)),
+        "send_stop_command": concurrent_api.send_stop_command
+    }
+
+    results = {}
+    for name, call in calls.items():
+        samples = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(iterations):
+                start = time.perf_counter()
+                call()
+                samples.append(time.perf_counter() - start)
+        results[name] = summarize(samples)
+
+    results["connections"] = transport.connection_stats()
+    results["commands"] = concurrent_api.outbox.stats()
+    concurrent_api.close()
+    sequential_api.close()
+    simulation.close()
+    transport.close()
+    return results
+
+
+def bench_simulation_tick(base_url, ticks):
+    """Per-tick wall time of RoverMission.tick split by phase"""
+    from rover_mission import RoverMission
+
+    timer = PhaseTimer()
+    transport = RoverTransport()
+    simulation = RoverSimulation(transport=transport, base_url=base_url)
+    emitter = TimedSocketIO(timer)
+    mission = RoverMission(simulation, emitter)
+    mission.running = True  # As app.py and the fleet set it; tick() does not
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation.start_session()
+
+    # Time network phases by wrapping the transport and the snapshot fetch
+    simulation.fetch_telemetry = timer.wrap("fetch", simulation.fetch_telemetry)
+    transport.post = timer.wrap("command", transport.post)
+
+    phases = {"total": [], "fetch": [], "command": [], "emit": [], "decision": []}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(ticks):
+                timer.reset()
+                start = time.perf_counter()
+                mission.tick()
+                total = time.perf_counter() - start
+
+                fetch = timer.totals.get("fetch", 0.0)
+                command = timer.totals.get("command", 0.0)
+                emit = timer.totals.get("emit", 0.0)
+                phases["total"].append(total)
+                phases["fetch"].append(fetch)
+                phases["command"].append(command)
+                phases["emit"].append(emit)
+                phases["decision"].append(max(0.0, total - fetch - command - emit))
+    finally:
+        simulation.close()
+        transport.close()
+
+    results = {phase: summarize(samples) for phase, samples in phases.items()}
+    results["emits_per_tick"] = emitter.emit_count / float(ticks)
+    results["unchanged_skipped_per_tick"] = mission.stage.skipped / float(ticks)
+    results["path_length"] = len(mission.rover_data["path_history"])
+    return results
+
+
+def make_path(length):
+    return [[i % 200, i // 200] for i in range(length)]
+
+
+def bench_emit_cost(sizes, repeats):
+    """Encoding cost of one map_update delta vs. a full map resync as path_history grows"""
+    from rover_mission import RoverMission
+
+    results = []
+    for size in sizes:
+        timer = PhaseTimer()
+        emitter = TimedSocketIO(timer)
+        mission = RoverMission(None, emitter)
+        for point in make_path(size):
+            mission.record_position(point)
+        mission.rover_data["survivors_found"].extend(make_path(max(1, size // 100)))
+        mission.emit_map_update([0, 0])
+
+        samples = []
+        for i in range(repeats):
+            mission.record_position([i, -1])
+            timer.reset()
+            mission.emit_map_update([i, -1])
+            samples.append(timer.totals["emit"])
+
+        mission.publish()
+        full_samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            full = encode_emit("map_update", mission.map_state())
+            full_samples.append(time.perf_counter() - start)
+
+        results.append(dict(
+            summarize(samples), path_length=size, payload_bytes=emitter.last_payload_bytes["map_update"],
+            resync=dict(summarize(full_samples), payload_bytes=len(full))
+        ))
+    return results
+
+
+def bench_rover_data_serialization(sizes, repeats):
+    """Time to serve /api/rover-data for growing histories
+
+    changed: the state changes before every request (serialization cost)
+    cached: repeated polls of one state version
+    revalidated: polls sending If-None-Match (304, no body)
+    projected: ?fields=status,battery after every change
+    """
+    import app as dashboard
+    from rover_mission import RoverMission
+
+    client = dashboard.app.test_client()
+    saved_mission = dashboard.mission
+    results = []
+
+    def timed_get(url, touch=None, **kwargs):
+        samples = []
+        for _ in range(repeats):
+            if touch:
+                touch()
+            start = time.perf_counter()
+            response = client.get(url, **kwargs)
+            body = response.get_data()
+            samples.append(time.perf_counter() - start)
+        return samples, response, body
+
+    try:
+        for size in sizes:
+            # A fresh mission with bounded histories filled past capacity, without spilling
+            mission = dashboard.mission = RoverMission(None, dashboard.socketio)
+            rover_data = mission.rover_data
+            for point in make_path(size):
+                mission.record_position(point)
+            rover_data["survivors_found"].extend(make_path(max(1, size // 100)))
+            rover_data["movement_history"].extend(
+                {"direction": "forward", "timestamp": "12:00:00"} for _ in range(size)
+            )
+            rover_data["log_entries"].extend(
+                {"timestamp": "12:00:00", "message": "Position updated: X=1, Y=2", "level": "info"}
+                for _ in range(size)
+            )
+
+            changed, response, body = timed_get('/api/rover-data', touch=mission.publish)
+            cached, response, _ = timed_get('/api/rover-data')
+            etag = response.headers["ETag"]
+            revalidated, response, _ = timed_get('/api/rover-data', headers={"If-None-Match": etag})
+            projected, _, projected_body = timed_get('/api/rover-data?fields=status,battery', touch=mission.publish)
+            results.append(dict(
+                summarize(changed), history_length=size, payload_bytes=len(body),
+                cached=summarize(cached),
+                revalidated=dict(summarize(revalidated), status_code=response.status_code),
+                projected=dict(summarize(projected), payload_bytes=len(projected_body))
+            ))
+    finally:
+        dashboard.mission = saved_mission
+    return results
+
+
+def bench_fleet_physics(fleet_sizes, steps):
+    """Cost of one vectorized FleetPhysics step as the fleet grows"""
+    from fleet_physics import FleetPhysics, random_walk_policy
+
+    results = []
+    for size in fleet_sizes:
+        fleet = FleetPhysics(size)
+        policy = random_walk_policy(0)
+        samples = []
+        for _ in range(steps):
+            policy(fleet)
+            start = time.perf_counter()
+            fleet.step(1.0)
+            samples.append(time.perf_counter() - start)
+        stats = summarize(samples)
+        results.append(dict(stats, rovers=size, rover_steps_per_second=size / (stats["mean_ms"] / 1000)))
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def flatten(data, prefix=""):
+    """Flatten nested results into dotted keys with numeric values"""
+    flat = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            flat.update(flatten(value, f"{prefix}{key}."))
+    elif isinstance(data, list):
+        for i, value in enumerate(data):
+            flat.update(flatten(value, f"{prefix}{i}."))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        flat[prefix.rstrip(".")] = data
+    return flat
+
+
+def compare(baseline_path, results):
+    """Print the change of every _ms metric against an earlier run"""
+    with open(baseline_path) as f:
+        baseline = flatten(json.load(f))
+    current = flatten(results)
+    print(f"{'metric':<60} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key in sorted(current):
+        if not key.endswith("_ms") or key.startswith("meta") or key not in baseline:
+            continue
+        before, after = baseline[key], current[key]
+        change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+        print(f"{key:<60} {before:>10.3f} {after:>10.3f} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoverX benchmark suite (runs against the local stand-in backend)")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per RoverAPI method")
+    parser.add_argument("--ticks", type=int, default=100, help="Simulation ticks to time")
+    parser.add_argument("--repeats", type=int, default=20, help="Repeats per payload size")
+    parser.add_argument("--sizes", default="100,1000,10000,50000", help="Path/history lengths to test")
+    parser.add_argument("--fleet-sizes", default="100,1000,10000,100000", help="Fleet sizes for the physics step")
+    parser.add_argument("--latency-ms", type=float, default=5, help="Injected backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=1, help="Injected backend jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected backend error rate")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    fleet_sizes = [int(size) for size in args.fleet_sizes.split(",")]
+    server, base_url = serve_in_thread(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                       error_rate=args.error_rate)
+    try:
+        results = {
+            "meta": {
+                "commit": git_commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "args": vars(args)
+            },
+            "api_latency": bench_api_latency(base_url, args.iterations),
+            "simulation_tick": bench_simulation_tick(base_url, args.ticks),
+            "emit_cost": bench_emit_cost(sizes, args.repeats),
+            "rover_data_serialization": bench_rover_data_serialization(sizes, args.repeats),
+            "fleet_physics": bench_fleet_physics(fleet_sizes, args.repeats)
+        }
+    finally:
+        server.shutdown()
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
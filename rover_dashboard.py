@@ -1,22 +1,25 @@
-import requests
 import json
 import time
 import os
 from datetime import datetime
 from colorama import init, Fore, Back, Style
+from config import BASE_URL, HISTORY_CAPACITY
+from ring_buffer import RingBuffer
+from rover_transport import get_transport
+from rover_frames import StatusFrame, SensorFrame
 
 # Initialize colorama
 init()
 
-# Base URL for the API
-BASE_URL = "https://roverdata2-production.up.railway.app"
 
 class RoverDashboard:
-    def __init__(self):
+    def __init__(self, transport=None, base_url=None):
+        self.transport = transport if transport else get_transport()
+        self.base_url = base_url if base_url else BASE_URL
         self.session_id = None
         self.last_status = None
         self.last_sensor_data = None
-        self.movement_history = []
+        self.movement_history = RingBuffer(HISTORY_CAPACITY["movement_history"])
     
     def clear_screen(self):
         """Clear the console screen"""
@@ -46,9 +49,9 @@ class RoverDashboard:
     def start_session(self):
         """Start a new session and get session ID"""
         self.print_header("Starting New Session")
-        url = f"{BASE_URL}/api/session/start"
+        url = f"{self.base_url}/api/session/start"
         try:
-            response = requests.post(url)
+            response = self.transport.post(url)
             if response.status_code == 200:
                 data = response.json()
                 self.session_id = data.get("session_id")
@@ -70,11 +73,11 @@ class RoverDashboard:
             return False
         
         self.print_header("Charging Rover")
-        url = f"{BASE_URL}/api/rover/charge"
+        url = f"{self.base_url}/api/rover/charge"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"Charging result: {data.get('message', 'Success')}")
@@ -94,16 +97,16 @@ class RoverDashboard:
             return False
         
         self.print_header("Rover Status")
-        url = f"{BASE_URL}/api/rover/status"
+        url = f"{self.base_url}/api/rover/status"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                self.last_status = response.json()
-                status = self.last_status.get("status", "Unknown")
-                battery = self.last_status.get("battery", 0)
-                coordinates = self.last_status.get("coordinates", [0, 0])
+                self.last_status = StatusFrame.decode(response.content)
+                status = self.last_status.status
+                battery = self.last_status.battery
+                coordinates = self.last_status.coordinates
                 
                 # Display status with color based on battery level
                 battery_color = Fore.GREEN if battery > 70 else Fore.YELLOW if battery > 30 else Fore.RED
@@ -133,11 +136,11 @@ class RoverDashboard:
             return False
         
         self.print_header(f"Moving Rover {direction.capitalize()}")
-        url = f"{BASE_URL}/api/rover/move"
+        url = f"{self.base_url}/api/rover/move"
         params = {"session_id": self.session_id, "direction": direction}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"Movement result: {data.get('message', 'Success')}")
@@ -162,59 +165,59 @@ class RoverDashboard:
             return False
         
         self.print_header("Rover Sensor Data")
-        url = f"{BASE_URL}/api/rover/sensor-data"
+        url = f"{self.base_url}/api/rover/sensor-data"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                self.last_sensor_data = response.json()
+                frame = self.last_sensor_data = SensorFrame.decode(response.content)
                 
                 # Extract data
-                timestamp = self.last_sensor_data.get("timestamp", 0)
-                position = self.last_sensor_data.get("position", {"x": 0, "y": 0})
-                accel = self.last_sensor_data.get("accelerometer", {"x": 0, "y": 0, "z": 0})
-                battery = self.last_sensor_data.get("battery_level", 0)
-                comm_status = self.last_sensor_data.get("communication_status", "Unknown")
-                recharging = self.last_sensor_data.get("recharging", False)
-                ultrasonic = self.last_sensor_data.get("ultrasonic", {"distance": None, "detection": False})
-                ir = self.last_sensor_data.get("ir", {"reflection": False})
-                rfid = self.last_sensor_data.get("rfid", {"tag_detected": False})
+                timestamp = frame.timestamp
+                position = frame.position
+                accel = frame.accelerometer
+                battery = frame.battery.level
+                comm_status = frame.comms.status
+                recharging = frame.battery.recharging
+                ultrasonic = frame.ultrasonic
+                ir = frame.ir
+                rfid = frame.rfid
                 
                 # Format timestamp
                 time_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
                 
                 # Display data with formatting
                 print(f"Timestamp: {time_str}")
-                print(f"Position: {Fore.MAGENTA}X={position['x']}, Y={position['y']}{Style.RESET_ALL}")
+                print(f"Position: {Fore.MAGENTA}X={position.x}, Y={position.y}{Style.RESET_ALL}")
                 
                 # Battery with color coding
                 battery_color = Fore.GREEN if battery > 70 else Fore.YELLOW if battery > 30 else Fore.RED
                 print(f"Battery: {battery_color}{battery}%{Style.RESET_ALL} {'(Recharging)' if recharging else ''}")
                 
                 # Communication status
-                comm_color = Fore.GREEN if comm_status.lower() == "active" else Fore.RED
+                comm_color = Fore.GREEN if frame.comms.active else Fore.RED
                 print(f"Communication: {comm_color}{comm_status}{Style.RESET_ALL}")
                 
                 # Accelerometer
                 print(f"\nAccelerometer:")
-                print(f"  X: {accel['x']:.2f}, Y: {accel['y']:.2f}, Z: {accel['z']:.2f}")
+                print(f"  X: {accel.x:.2f}, Y: {accel.y:.2f}, Z: {accel.z:.2f}")
                 
                 # Sensors
                 print(f"\nSensors:")
                 
                 # Ultrasonic
-                ultrasonic_distance = ultrasonic['distance'] if ultrasonic['distance'] is not None else "N/A"
-                ultrasonic_color = Fore.YELLOW if ultrasonic['detection'] else Fore.GREEN
-                print(f"  Ultrasonic: {ultrasonic_color}Distance={ultrasonic_distance}, Detection={ultrasonic['detection']}{Style.RESET_ALL}")
+                ultrasonic_distance = ultrasonic.distance if ultrasonic.distance is not None else "N/A"
+                ultrasonic_color = Fore.YELLOW if ultrasonic.detection else Fore.GREEN
+                print(f"  Ultrasonic: {ultrasonic_color}Distance={ultrasonic_distance}, Detection={ultrasonic.detection}{Style.RESET_ALL}")
                 
                 # IR
-                ir_color = Fore.YELLOW if ir['reflection'] else Fore.GREEN
-                print(f"  IR: {ir_color}Reflection={ir['reflection']}{Style.RESET_ALL}")
+                ir_color = Fore.YELLOW if ir.reflection else Fore.GREEN
+                print(f"  IR: {ir_color}Reflection={ir.reflection}{Style.RESET_ALL}")
                 
                 # RFID
-                rfid_color = Fore.YELLOW if rfid['tag_detected'] else Fore.GREEN
-                print(f"  RFID: {rfid_color}Tag Detected={rfid['tag_detected']}{Style.RESET_ALL}")
+                rfid_color = Fore.YELLOW if rfid.tag_detected else Fore.GREEN
+                print(f"  RFID: {rfid_color}Tag Detected={rfid.tag_detected}{Style.RESET_ALL}")
                 
                 return True
             else:
@@ -232,11 +235,11 @@ class RoverDashboard:
             return False
         
         self.print_header("Stopping Rover")
-        url = f"{BASE_URL}/api/rover/stop"
+        url = f"{self.base_url}/api/rover/stop"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"Stop result: {data.get('message', 'Success')}")
@@ -1,23 +1,26 @@
-import requests
 import json
 import time
 from datetime import datetime
 import os
 import sys
 from colorama import init, Fore, Style
+from config import BASE_URL, HISTORY_CAPACITY
+from ring_buffer import RingBuffer
+from rover_transport import get_transport
+from rover_frames import StatusFrame, SensorFrame
 
 # Initialize colorama for colored output
 init(autoreset=True)
 
-# Base URL for the API
-BASE_URL = "https://roverdata2-production.up.railway.app"
 
 class RoverDataDisplay:
-    def __init__(self):
+    def __init__(self, transport=None, base_url=None):
+        self.transport = transport if transport else get_transport()
+        self.base_url = base_url if base_url else BASE_URL
         self.session_id = None
         self.status_data = None
         self.sensor_data = None
-        self.movement_history = []
+        self.movement_history = RingBuffer(HISTORY_CAPACITY["movement_history"])
     
     def print_header(self, text):
         """Print a formatted header"""
@@ -45,9 +48,9 @@ class RoverDataDisplay:
         """Start a new session and get session ID"""
         self.print_header("STARTING NEW SESSION")
         
-        url = f"{BASE_URL}/api/session/start"
+        url = f"{self.base_url}/api/session/start"
         try:
-            response = requests.post(url)
+            response = self.transport.post(url)
             if response.status_code == 200:
                 data = response.json()
                 self.session_id = data.get("session_id")
@@ -69,17 +72,17 @@ class RoverDataDisplay:
         
         self.print_header("ROVER STATUS")
         
-        url = f"{BASE_URL}/api/rover/status"
+        url = f"{self.base_url}/api/rover/status"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                self.status_data = response.json()
+                self.status_data = StatusFrame.decode(response.content)
                 
-                status = self.status_data.get("status", "Unknown")
-                battery = self.status_data.get("battery", 0)
-                coordinates = self.status_data.get("coordinates", [0, 0])
+                status = self.status_data.status
+                battery = self.status_data.battery
+                coordinates = self.status_data.coordinates
                 
                 # Display status with color based on battery level
                 battery_color = Fore.GREEN if battery > 70 else Fore.YELLOW if battery > 30 else Fore.RED
@@ -104,11 +107,11 @@ class RoverDataDisplay:
         
         self.print_header("CHARGING ROVER")
         
-        url = f"{BASE_URL}/api/rover/charge"
+        url = f"{self.base_url}/api/rover/charge"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"{data.get('message', 'Charging successful')}")
@@ -133,11 +136,11 @@ class RoverDataDisplay:
         
         self.print_header(f"MOVING ROVER {direction.upper()}")
         
-        url = f"{BASE_URL}/api/rover/move"
+        url = f"{self.base_url}/api/rover/move"
         params = {"session_id": self.session_id, "direction": direction}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"{data.get('message', 'Movement successful')}")
@@ -165,24 +168,24 @@ class RoverDataDisplay:
         
         self.print_header("ROVER SENSOR DATA")
         
-        url = f"{BASE_URL}/api/rover/sensor-data"
+        url = f"{self.base_url}/api/rover/sensor-data"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                self.sensor_data = response.json()
+                frame = self.sensor_data = SensorFrame.decode(response.content)
                 
                 # Extract data
-                timestamp = self.sensor_data.get("timestamp", 0)
-                position = self.sensor_data.get("position", {"x": 0, "y": 0})
-                accel = self.sensor_data.get("accelerometer", {"x": 0, "y": 0, "z": 0})
-                battery = self.sensor_data.get("battery_level", 0)
-                comm_status = self.sensor_data.get("communication_status", "Unknown")
-                recharging = self.sensor_data.get("recharging", False)
-                ultrasonic = self.sensor_data.get("ultrasonic", {"distance": None, "detection": False})
-                ir = self.sensor_data.get("ir", {"reflection": False})
-                rfid = self.sensor_data.get("rfid", {"tag_detected": False})
+                timestamp = frame.timestamp
+                position = frame.position
+                accel = frame.accelerometer
+                battery = frame.battery.level
+                comm_status = frame.comms.status
+                recharging = frame.battery.recharging
+                ultrasonic = frame.ultrasonic
+                ir = frame.ir
+                rfid = frame.rfid
                 
                 # Format timestamp
                 time_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
@@ -190,35 +193,35 @@ class RoverDataDisplay:
                 # Display data with formatting
                 self.print_section("Basic Information")
                 self.print_info(f"Timestamp: {time_str}")
-                self.print_info(f"Position: {Fore.MAGENTA}X={position['x']}, Y={position['y']}")
+                self.print_info(f"Position: {Fore.MAGENTA}X={position.x}, Y={position.y}")
                 
                 # Battery with color coding
                 battery_color = Fore.GREEN if battery > 70 else Fore.YELLOW if battery > 30 else Fore.RED
                 self.print_info(f"Battery: {battery_color}{battery}%{' (Recharging)' if recharging else ''}")
                 
                 # Communication status
-                comm_color = Fore.GREEN if comm_status.lower() == "active" else Fore.RED
+                comm_color = Fore.GREEN if frame.comms.active else Fore.RED
                 self.print_info(f"Communication: {comm_color}{comm_status}")
                 
                 # Accelerometer
                 self.print_section("Accelerometer")
-                self.print_info(f"X: {accel['x']:.2f}, Y: {accel['y']:.2f}, Z: {accel['z']:.2f}")
+                self.print_info(f"X: {accel.x:.2f}, Y: {accel.y:.2f}, Z: {accel.z:.2f}")
                 
                 # Sensors
                 self.print_section("Sensors")
                 
                 # Ultrasonic
-                ultrasonic_distance = ultrasonic['distance'] if ultrasonic['distance'] is not None else "N/A"
-                ultrasonic_color = Fore.YELLOW if ultrasonic['detection'] else Fore.GREEN
-                self.print_info(f"Ultrasonic: {ultrasonic_color}Distance={ultrasonic_distance}, Detection={ultrasonic['detection']}")
+                ultrasonic_distance = ultrasonic.distance if ultrasonic.distance is not None else "N/A"
+                ultrasonic_color = Fore.YELLOW if ultrasonic.detection else Fore.GREEN
+                self.print_info(f"Ultrasonic: {ultrasonic_color}Distance={ultrasonic_distance}, Detection={ultrasonic.detection}")
                 
                 # IR
-                ir_color = Fore.YELLOW if ir['reflection'] else Fore.GREEN
-                self.print_info(f"IR: {ir_color}Reflection={ir['reflection']}")
+                ir_color = Fore.YELLOW if ir.reflection else Fore.GREEN
+                self.print_info(f"IR: {ir_color}Reflection={ir.reflection}")
                 
                 # RFID
-                rfid_color = Fore.YELLOW if rfid['tag_detected'] else Fore.GREEN
-                self.print_info(f"RFID: {rfid_color}Tag Detected={rfid['tag_detected']}")
+                rfid_color = Fore.YELLOW if rfid.tag_detected else Fore.GREEN
+                self.print_info(f"RFID: {rfid_color}Tag Detected={rfid.tag_detected}")
                 
                 return True
             else:
@@ -236,11 +239,11 @@ class RoverDataDisplay:
         
         self.print_header("STOPPING ROVER")
         
-        url = f"{BASE_URL}/api/rover/stop"
+        url = f"{self.base_url}/api/rover/stop"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 data = response.json()
                 self.print_success(f"{data.get('message', 'Rover stopped successfully')}")
@@ -0,0 +1,219 @@
+import json
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard library decoder is used instead
+    orjson = None
+
+
+class FrameError(ValueError):
+    """A response body that is not a valid status or sensor frame"""
+
+
+def loads(body):
+    """Decode a JSON body (bytes or str), with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise FrameError(f"Invalid JSON: {e}") from None
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise FrameError(f"Invalid JSON: {e}") from None
+
+
+_NUMBER_TYPES = (int, float)
+_EMPTY = {}
+
+
+def _object(data, name):
+    if type(data) is not dict:
+        raise FrameError(f"{name}: expected a JSON object")
+    if "error" in data:
+        raise FrameError(str(data["error"]))
+    return data
+
+
+def _section(data, key):
+    value = data.get(key)
+    if type(value) is dict:
+        return value
+    if value is None:
+        return _EMPTY
+    raise FrameError(f"{key}: expected an object")
+
+
+def _numbers(name, *values):
+    # Only called once a fast type check has failed, to find the culprit
+    for value in values:
+        if type(value) is bool or not isinstance(value, _NUMBER_TYPES):
+            raise FrameError(f"{name}: expected a number")
+
+
+@dataclass(slots=True)
+class Position:
+    x: float = 0
+    y: float = 0
+
+    def as_dict(self):
+        return {"x": self.x, "y": self.y}
+
+    def as_list(self):
+        return [self.x, self.y]
+
+
+@dataclass(slots=True)
+class Accelerometer:
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+
+
+@dataclass(slots=True)
+class Ultrasonic:
+    distance: float = None  # None when nothing is in range
+    detection: bool = False
+
+
+@dataclass(slots=True)
+class IR:
+    reflection: bool = False
+
+
+@dataclass(slots=True)
+class RFID:
+    tag_detected: bool = False
+
+
+@dataclass(slots=True)
+class Battery:
+    level: float = 0  # Percent, capped at 100
+    recharging: bool = False
+
+
+@dataclass(slots=True)
+class Comms:
+    status: str = "Unknown"
+
+    @property
+    def active(self):
+        return self.status.lower() == "active"
+
+
+@dataclass(slots=True)
+class StatusFrame:
+    """A decoded /rover/status response
+
+    raw is the decoded JSON object, kept so it can be passed on (emitted,
+    recorded) without being rebuilt.
+    """
+    status: str
+    battery: float
+    position: Position
+    raw: dict
+
+    @property
+    def coordinates(self):
+        return self.position.as_list()
+
+    @classmethod
+    def from_dict(cls, data):
+        data = _object(data, "status")
+        coordinates = data.get("coordinates")
+        if coordinates is None:
+            x = y = 0
+        elif type(coordinates) is list and len(coordinates) >= 2:
+            x, y = coordinates[0], coordinates[1]
+        else:
+            raise FrameError("coordinates: expected [x, y]")
+        battery = data.get("battery", 0)
+        if type(x) not in _NUMBER_TYPES or type(y) not in _NUMBER_TYPES or type(battery) not in _NUMBER_TYPES:
+            _numbers("coordinates", x, y)
+            _numbers("battery", battery)
+        status = data.get("status", "Unknown")
+        if type(status) is not str:
+            raise FrameError("status: expected a string")
+        return cls(status, battery, Position(x, y), data)
+
+    @classmethod
+    def decode(cls, body):
+        return cls.from_dict(loads(body))
+
+
+@dataclass(slots=True)
+class SensorFrame:
+    """A decoded /rover/sensor-data response, one typed field per sensor
+
+    raw is the decoded JSON object (see StatusFrame).
+    """
+    timestamp: float
+    position: Position
+    accelerometer: Accelerometer
+    battery: Battery
+    comms: Comms
+    ultrasonic: Ultrasonic
+    ir: IR
+    rfid: RFID
+    raw: dict
+
+    @classmethod
+    def from_dict(cls, data):
+        data = _object(data, "sensor data")
+        get = data.get
+        position = _section(data, "position")
+        accel = _section(data, "accelerometer")
+        ultrasonic = _section(data, "ultrasonic")
+        x, y = position.get("x", 0), position.get("y", 0)
+        ax, ay, az = accel.get("x", 0.0), accel.get("y", 0.0), accel.get("z", 0.0)
+        timestamp, battery = get("timestamp", 0), get("battery_level", 0)
+        distance = ultrasonic.get("distance")
+        # One cheap check for the common case; _numbers() names the bad field
+        numbers = _NUMBER_TYPES
+        if (type(x) not in numbers or type(y) not in numbers or type(ax) not in numbers
+                or type(ay) not in numbers or type(az) not in numbers
+                or type(timestamp) not in numbers or type(battery) not in numbers
+                or (distance is not None and type(distance) not in numbers)):
+            _numbers("position", x, y)
+            _numbers("accelerometer", ax, ay, az)
+            _numbers("timestamp", timestamp)
+            _numbers("battery_level", battery)
+            if distance is not None:
+                _numbers("ultrasonic.distance", distance)
+        comms = get("communication_status", "Unknown")
+        if type(comms) is not str:
+            raise FrameError("communication_status: expected a string")
+        return cls(
+            timestamp,
+            Position(x, y),
+            Accelerometer(ax, ay, az),
+            Battery(battery if battery <= 100 else 100, bool(get("recharging", False))),
+            Comms(comms),
+            Ultrasonic(distance, bool(ultrasonic.get("detection", False))),
+            IR(bool(_section(data, "ir").get("reflection", False))),
+            RFID(bool(_section(data, "rfid").get("tag_detected", False))),
+            data
+        )
+
+    @classmethod
+    def decode(cls, body):
+        return cls.from_dict(loads(body))
+
+
+def rover_status(status, sensor):
+    """The combined dict RoverAPI.get_rover_status() returns, built from two frames"""
+    raw = sensor.raw
+    return {
+        'status': status.status,
+        'battery': status.battery,
+        'coordinates': status.raw.get('coordinates'),
+        'sensor_data': {
+            'timestamp': raw.get('timestamp'),
+            'accelerometer': raw.get('accelerometer'),
+            'communication_status': raw.get('communication_status'),
+            'ultrasonic': raw.get('ultrasonic'),
+            'ir': raw.get('ir'),
+            'rfid': raw.get('rfid')
+        }
+    }
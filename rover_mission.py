@@ -0,0 +1,834 @@
+import asyncio
+import itertools
+import os
+import threading
+import time
+import uuid
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
+from config import HISTORY_CAPACITY, SPILL_DIR, SURVIVOR_RADIUS, COVERAGE_CELL_SIZE, SITE_CELLS, PATH_TOLERANCE
+from coverage_grid import CoverageGrid
+from emission_stage import EmissionStage
+from path_simplifier import PathSimplifier, simplify
+from ring_buffer import RingBuffer, PointBuffer
+from mission_timers import MissionTimers
+from survivor_index import SurvivorIndex
+from tick_scheduler import TickScheduler
+
+# Battery thresholds
+RECHARGE_START = 5  # Start recharging at 5%
+RECHARGE_STOP = 80  # Stop recharging at 80%
+COMMS_LOSS = 10  # Communication lost below 10%
+
+AID_DELIVERY_TIME = 5  # Seconds spent delivering aid to a survivor
+AID_RESUME_DELAY = 1  # Pause after aid delivery before the rover moves on
+
+
+HISTORY_KEYS = ("movement_history", "log_entries", "path_history", "survivors_found")
+POINT_HISTORIES = ("path_history", "survivors_found")
+STATUS_FIELDS = ("status", "battery", "position", "session_id")  # What status_update carries
+API_FIELDS = STATUS_FIELDS + ("sensor_data",) + HISTORY_KEYS + ("coverage",)  # What /api/rover-data can return
+
+
+def new_rover_data(spill_prefix=None, capacity=None):
+    """Return an empty rover data structure with bounded histories
+
+    With a spill_prefix, entries pushed out of a history are appended to
+    <spill_prefix>-<history>.jsonl (.bin for point histories).
+    """
+    capacity = dict(HISTORY_CAPACITY, **(capacity or {}))
+    rover_data = {
+        "status": "idle",
+        "battery": 0,
+        "position": {"x": 0, "y": 0},
+        "sensor_data": None
+    }
+    for key in HISTORY_KEYS:
+        buffer_class = PointBuffer if key in POINT_HISTORIES else RingBuffer
+        spill_path = None
+        if spill_prefix:
+            spill_path = f"{spill_prefix}-{key}" + (".bin" if key in POINT_HISTORIES else ".jsonl")
+        rover_data[key] = buffer_class(capacity[key], spill_path)
+    return rover_data
+
+
+# Immutable view of a mission at one version; fields maps rover_data keys to
+# values with histories as tuples, path is the simplified path
+MissionSnapshot = namedtuple("MissionSnapshot", "version fields totals path coverage map_seq")
+
+
+def serialize_rover_data(rover_data, fields=None):
+    """Return a JSON-ready copy of rover_data (or just fields) with histories as plain lists"""
+    keys = rover_data.keys() if fields is None else [key for key in fields if key in rover_data]
+    data = {}
+    for key in keys:
+        value = rover_data[key]
+        data[key] = value.to_list() if isinstance(value, RingBuffer) else value
+    return data
+
+
+def close_rover_data(rover_data):
+    """Flush and close the spill files of rover_data's histories"""
+    for value in rover_data.values():
+        if isinstance(value, RingBuffer):
+            value.close()
+
+
+class RoverMission:
+    """Autonomous mission state and decision logic for one rover
+
+    Each mission owns its RoverSimulation, rover_data and aid-delivery state,
+    and emits its Socket.IO events on its own namespace.
+    """
+
+    def __init__(self, rover_simulation, socketio, namespace='/', rover_id=None, recorder=None):
+        self.rover_simulation = rover_simulation
+        self.socketio = socketio
+        self.namespace = namespace
+        self.rover_id = rover_id
+        self.mission_id = uuid.uuid4().hex[:12]
+        self.recorder = recorder  # TelemetryStore for the audit trail, or None
+        self.stage = EmissionStage(socketio, namespace)
+        self._versions = itertools.count(1)
+        self._updating = 0
+        self._publish_lock = threading.Lock()
+        self._snapshot_sources = {}
+        self.snapshot = None
+        self.rover_data = new_rover_data(self.spill_prefix())
+        self.survivor_index = SurvivorIndex(SURVIVOR_RADIUS)  # Every survivor, including ones spilled from survivors_found
+        self.coverage = CoverageGrid(COVERAGE_CELL_SIZE, area_cells=SITE_CELLS)
+        self.path_simplifier = PathSimplifier(PATH_TOLERANCE, max_points=HISTORY_CAPACITY["path_history"])
+        self.running = False
+        self._stop_event = threading.Event()  # Interrupts the wait between wakes
+        self._idle = threading.Event()  # Set by shutdown() once the mission has stopped
+        if rover_simulation is None:
+            self._idle.set()
+        self.stop_requested_at = None
+        self.stop_latency = None  # Seconds from request_stop() to idle
+        self.scheduler = TickScheduler(charge_target=RECHARGE_STOP)
+        self.timers = MissionTimers()  # Aid delivery and charge rechecks
+        self._next_poll = 0.0  # time.monotonic() of the next telemetry poll
+
+        # map_update deltas: seq increases by one per emit; epoch changes per mission
+        self.map_epoch = self.mission_id
+        self.map_seq = 0
+        self._map_sent = {"path_history": 0, "survivors_found": 0}
+        self._map_position = None
+        self._map_sent_position = None
+        self._map_direction = None
+        self._map_lock = threading.Lock()
+        self._movement_sent = 0
+        self.publish()
+
+    def spill_prefix(self):
+        """Path prefix for this mission's spilled history, or None if spilling is off"""
+        if not SPILL_DIR or self.rover_simulation is None:
+            return None
+        name = f"{self.rover_id or 'rover'}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        return os.path.join(SPILL_DIR, name)
+
+    def record(self, kind, payload):
+        """Append an event to the telemetry store, if one is attached"""
+        if self.recorder is not None:
+            self.recorder.record(self.mission_id, kind, payload, rover_id=self.rover_id)
+
+    def emit_status(self):
+        """Queue a status_update; the tick sends the final status once, if it changed"""
+        self.stage.publish('status_update', self.status_payload)
+        self.record("status", self.status_payload())
+
+    def status_payload(self):
+        rover_data = self.rover_data
+        payload = {key: rover_data[key] for key in STATUS_FIELDS if key in rover_data}
+        payload["coverage"] = round(self.coverage.coverage_percent(), 1)
+        return payload
+
+    def record_position(self, current_pos):
+        """Add a position to path_history and the coverage grid if the rover moved"""
+        if self.rover_data["path_history"].last() == current_pos:
+            return False
+        self.rover_data["path_history"].append(current_pos)
+        self.path_simplifier.append(current_pos)
+        self.coverage.visit(current_pos[0], current_pos[1])
+        return True
+
+    @property
+    def version(self):
+        return self.snapshot.version
+
+    def publish(self):
+        """Build an immutable snapshot of rover_data and swap it in
+
+        Only the mission's own thread mutates rover_data. Readers on other
+        threads take self.snapshot once, without locking, and never see a
+        half-built state. Histories unchanged since the last snapshot are
+        shared with it rather than copied.
+        """
+        with self._publish_lock:
+            previous = self.snapshot
+            fields = {}
+            totals = {}
+            for key, value in self.rover_data.items():
+                if not isinstance(value, RingBuffer):
+                    fields[key] = value
+                    continue
+                totals[key] = value.total
+                if previous is not None and self._snapshot_sources.get(key) == (value, value.total):
+                    fields[key] = previous.fields[key]
+                else:
+                    fields[key] = tuple(value.to_list())
+                    self._snapshot_sources[key] = (value, value.total)
+
+            path_changed = previous is None or fields.get("path_history") is not previous.fields.get("path_history")
+            self.snapshot = MissionSnapshot(
+                version=next(self._versions),
+                fields=MappingProxyType(fields),
+                totals=MappingProxyType(totals),
+                path=tuple(self.path_simplifier.points()) if path_changed else previous.path,
+                coverage=round(self.coverage.coverage_percent(), 1),
+                map_seq=self.map_seq
+            )
+        return self.snapshot
+
+    @contextmanager
+    def update(self):
+        """Group changes: events are sent, and a snapshot published, once at the end"""
+        self._updating += 1
+        try:
+            with self.stage.batch():
+                yield
+        finally:
+            self._updating -= 1
+            self.publish()
+
+    def serialize(self, full=False, tolerance=None, fields=None, snapshot=None):
+        """JSON-ready rover_data for the REST API, with path_history as map_path() returns it
+
+        Reads one published snapshot (the latest by default). fields limits
+        the result to those API_FIELDS.
+        """
+        snapshot = snapshot or self.snapshot
+        fields = API_FIELDS if fields is None else fields
+        data = serialize_rover_data(snapshot.fields, [key for key in fields if key != "path_history"])
+        if "path_history" in fields:
+            data["path_history"] = self.map_path(full, tolerance, snapshot)
+        if "coverage" in fields:
+            data["coverage"] = snapshot.coverage
+        return data
+
+    def map_path(self, full=False, tolerance=None, snapshot=None):
+        """Path for map consumers
+
+        By default this is the whole mission's path, simplified incrementally at
+        PATH_TOLERANCE. Another tolerance simplifies path_history on demand;
+        full=True returns path_history's raw points.
+        """
+        snapshot = snapshot or self.snapshot
+        if full:
+            return list(snapshot.fields["path_history"])
+        if tolerance is None or tolerance == self.path_simplifier.tolerance:
+            return list(snapshot.path)
+        return simplify(snapshot.fields["path_history"], tolerance)
+
+    def emit_map_update(self, position, direction=None):
+        """Queue a map_update with the path points and survivors added since the last one
+
+        Clients apply deltas in seq order and fetch map_state() when they
+        see a gap or a new epoch. path_total/survivors_total are the lifetime
+        counts after this delta, so a delta overlapping a resync is harmless.
+        """
+        with self._map_lock:
+            self._map_position = position
+            if direction:
+                self._map_direction = direction
+        self.stage.publish('map_update', self.build_map_update, dedupe=False)
+
+    def build_map_update(self):
+        """Build the pending map_update delta, or None if nothing changed"""
+        rover_data = self.rover_data
+        with self._map_lock:
+            path = rover_data["path_history"]
+            survivors = rover_data["survivors_found"]
+            new_path = path.since(self._map_sent["path_history"])
+            new_survivors = survivors.since(self._map_sent["survivors_found"])
+            direction, self._map_direction = self._map_direction, None
+            if not new_path and not new_survivors and not direction and self._map_position == self._map_sent_position:
+                return None
+
+            self.map_seq += 1
+            map_data = {
+                "epoch": self.map_epoch,
+                "seq": self.map_seq,
+                "position": self._map_position,
+                "path": new_path,
+                "survivors": new_survivors,
+                "path_total": path.total,
+                "survivors_total": survivors.total
+            }
+            if direction:
+                map_data["direction"] = direction
+            self._map_sent = {"path_history": path.total, "survivors_found": survivors.total}
+            self._map_sent_position = self._map_position
+        return map_data
+
+    def map_state(self, full=False, tolerance=None):
+        """Full map for clients resyncing after a gap in map_update seq"""
+        snapshot = self.snapshot
+        position = snapshot.fields["position"]
+        return {
+            "epoch": self.map_epoch,
+            "seq": snapshot.map_seq,
+            "position": [position["x"], position["y"]],
+            "path": self.map_path(full, tolerance, snapshot),
+            "survivors": list(snapshot.fields["survivors_found"]),
+            "path_total": snapshot.totals["path_history"],
+            "survivors_total": snapshot.totals["survivors_found"]
+        }
+
+    def add_log_entry(self, message, level="info"):
+        """Add a log entry with timestamp"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        entry = {
+            "timestamp": timestamp,
+            "message": message,
+            "level": level  # info, success, warning, error
+        }
+        self.rover_data["log_entries"].append(entry)
+        self.stage.append('log_update', entry)
+        self.record("log", entry)
+        if not self._updating:
+            self.publish()
+
+    def start(self):
+        """Start a backend session and take the first telemetry snapshot"""
+        if not self.session_started(self.rover_simulation.start_session()):
+            return False
+
+        # Initial status update
+        with self.update():
+            self.update_telemetry()
+        return True
+
+    def session_started(self, started):
+        """Record the result of start_session(); returns started"""
+        if not started:
+            self.add_log_entry("Failed to start session. Exiting.", "error")
+            self.running = False
+            return False
+
+        # Store session ID in rover_data
+        self.rover_data["session_id"] = self.rover_simulation.session_id
+        self.add_log_entry(f"Session started with ID: {self.rover_simulation.session_id}", "success")
+        return True
+
+    def shutdown(self):
+        """Stop the rover and mark the mission as finished"""
+        if self.rover_simulation:
+            # Sent on the outbox's priority lane; the mission needn't wait for the ack
+            self.rover_simulation.stop_rover(wait=False)
+        self.running = False
+        self.add_log_entry("Simulation stopped", "warning")
+        close_rover_data(self.rover_data)
+        self.mark_idle()
+        if self.rover_simulation:
+            # Sends the queued stop and ends the outbox threads; the mission is already idle
+            self.rover_simulation.close()
+
+    def request_stop(self):
+        """Stop the mission from another thread without waiting for its current tick
+
+        The wait between wakes is interrupted and in-flight telemetry and
+        moves are abandoned, so the loop reaches shutdown() (which still
+        sends the stop command) right away.
+        """
+        if self.stop_requested_at is None:
+            self.stop_requested_at = time.perf_counter()
+        self.running = False
+        self.interrupt()
+
+    @property
+    def stop_requested(self):
+        return self.stop_requested_at is not None
+
+    def interrupt(self):
+        self._stop_event.set()
+        if self.rover_simulation is not None:
+            self.rover_simulation.cancel()
+
+    def mark_idle(self):
+        if self.stop_requested_at is not None and self.stop_latency is None:
+            self.stop_latency = time.perf_counter() - self.stop_requested_at
+        self._idle.set()
+
+    def wait_idle(self, timeout=None):
+        """Block until the mission has shut down; returns False on timeout"""
+        return self._idle.wait(timeout)
+
+    def is_charging(self):
+        return self.rover_simulation is not None and self.rover_simulation.status.lower() == "charging"
+
+    def observe_snapshot(self, snapshot):
+        """Feed a telemetry snapshot to the tick scheduler"""
+        frame = snapshot["sensor_data"]
+        tag_detected = frame.rfid.tag_detected if frame is not None else False
+        self.scheduler.observe(self.rover_data["battery"], self.is_charging(), tag_detected)
+
+    @property
+    def is_delivering_aid(self):
+        return self.timers.pending("aid_delivery")
+
+    def poll_interval(self):
+        """Seconds until the next telemetry poll, chosen from the rover's state"""
+        moving = self.rover_simulation is not None and "moving" in self.rover_simulation.status.lower()
+        return self.scheduler.next_interval(self.rover_data["battery"], self.is_charging(), moving)
+
+    def next_interval(self):
+        """Seconds until the mission next has work: a poll or a due timer"""
+        wake_in = self.timers.next_due_in()
+        interval = max(0.0, self._next_poll - time.monotonic())
+        return interval if wake_in is None else min(interval, wake_in)
+
+    def poll_in(self, delay):
+        """Move the next telemetry poll to delay seconds from now"""
+        self._next_poll = time.monotonic() + delay
+
+    def finish_aid_delivery(self):
+        """Timer callback: aid delivered, resume exploring after a short pause"""
+        self.add_log_entry("Aid delivery complete. Resuming exploration.", "success")
+        self.rover_data["status"] = "Aid Delivered"
+        self.emit_status()
+        self.poll_in(AID_RESUME_DELAY)
+
+    def schedule_charge_recheck(self):
+        """Poll again when the charge is predicted to reach RECHARGE_STOP"""
+        eta = self.scheduler.charge_eta(self.rover_data["battery"])
+        if eta is not None:
+            self.timers.schedule(eta, "charge_recheck", lambda: self.poll_in(0))
+
+    def run(self):
+        """Autonomous rover simulation loop"""
+        try:
+            if not self.start():
+                return
+
+            while self.running:
+                self.wake()
+
+                # Wait until the next poll or timer is due, or a stop is requested
+                self._stop_event.wait(self.next_interval())
+
+        except Exception as e:
+            self.add_log_entry(f"Simulation error: {str(e)}", "error")
+        finally:
+            # Stop the rover before exiting
+            self.shutdown()
+
+    def wake(self):
+        """Do whatever is due now: fire due timers, and tick once the poll interval has passed
+
+        Returns True if it ticked.
+        """
+        if time.monotonic() >= self._next_poll:
+            self.tick()
+            return True
+        with self.update():
+            self.timers.run_due()
+        return False
+
+    def tick(self):
+        """Fire due timers, run one step and send the Socket.IO events, coalesced, at the end"""
+        with self.update():
+            self.timers.run_due()
+            self.step()
+        self.poll_in(self.poll_interval())
+
+    def step(self):
+        """Run one step of the simulation loop: fetch telemetry, then decide and act"""
+        # Update rover status and sensor data from one snapshot
+        self.update_telemetry()
+        if self.stop_requested:
+            return  # Stopped while fetching; don't act on a partial snapshot
+
+        for command in self.decide():
+            if self.stop_requested:
+                break  # Leave the rest of the plan to shutdown()
+            self.perform(command)
+
+    def perform(self, command):
+        """Carry out a command chosen by decide()"""
+        if command == "move":
+            self.move_rover()
+        elif command == "charge":
+            self.rover_simulation.charge_rover()
+        else:
+            self.rover_simulation.stop_rover()
+
+    def decide(self):
+        """Decide what to do with the latest telemetry
+
+        Yields the commands to send ("charge", "stop" or "move") in order,
+        updating rover_data and the log in between. It does no I/O itself, so
+        the sync and async missions share it and only perform() differs;
+        checks after a yield see that command's effect.
+        """
+        rover_data = self.rover_data
+        rover_simulation = self.rover_simulation
+
+        # Aid delivery completes on its own timer (finish_aid_delivery)
+
+        # Handle battery management
+        if rover_data["battery"] <= RECHARGE_START and rover_simulation.status.lower() != "charging":
+            # Battery critically low, start charging
+            self.add_log_entry(f"Battery critically low ({rover_data['battery']}%). Starting recharge...", "warning")
+            yield "charge"
+            yield "stop"  # Ensure the rover stops moving
+            rover_data["status"] = "Charging"  # Update status immediately
+            self.emit_status()  # Send immediate update to UI
+            self.add_log_entry("Rover stopped for charging. Will resume at 80%.", "info")
+
+        # Handle communication loss at low battery
+        elif rover_data["battery"] <= COMMS_LOSS and rover_data["battery"] > RECHARGE_START and rover_simulation.status.lower() != "charging":
+            # Battery low, communication degrading
+            self.add_log_entry(f"Warning: Battery at {rover_data['battery']}%. Connection lost.", "warning")
+            rover_data["status"] = "Connection Lost - Low Battery"
+            self.emit_status()
+
+            # Stop the rover
+            yield "stop"
+            self.add_log_entry("Rover stopped due to connection loss.", "warning")
+
+            # Start charging immediately
+            yield "charge"
+            rover_data["status"] = "Recharging"
+            self.emit_status()
+            self.add_log_entry("Emergency recharge initiated.", "info")
+
+        # If charging and battery is above threshold, stop charging by moving
+        if rover_simulation.status.lower() == "charging" and rover_data["battery"] >= RECHARGE_STOP:
+            # Set battery to exactly 80% when done charging
+            rover_data["battery"] = 80
+            self.add_log_entry(f"Battery charged to {rover_data['battery']}%. Resuming operation.", "success")
+            rover_data["status"] = "Fully Charged"
+            self.emit_status()
+            self.timers.cancel("charge_recheck")
+
+            # Move to indicate we're no longer charging
+            yield "move"
+
+        # If not charging and battery is above minimum, move randomly
+        if rover_simulation.status.lower() != "charging" and rover_data["battery"] > COMMS_LOSS and not self.is_delivering_aid:
+            # Move in a random direction
+            yield "move"
+        elif rover_simulation.status.lower() == "charging":
+            # If charging, emit a status update to show charging progress
+            if rover_data["status"] != "Charging" and rover_data["status"] != "Recharging":
+                rover_data["status"] = "Charging"
+            self.emit_status()
+            self.log_charging_progress()
+            self.schedule_charge_recheck()
+
+    def log_charging_progress(self):
+        """Log battery level and the predicted time to the charge target"""
+        battery = self.rover_data['battery']
+        eta = self.scheduler.charge_eta(battery)
+        if eta is None:
+            self.add_log_entry(f"Charging: Battery at {battery}%", "info")
+        else:
+            self.add_log_entry(f"Charging: Battery at {battery}%, about {eta:.0f}s to {RECHARGE_STOP}%", "info")
+
+    def update_telemetry(self):
+        """Fetch one telemetry snapshot and apply it to the simulation and rover_data"""
+        if not self.rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        # Each endpoint is fetched at most once per tick
+        ok, found_survivor = self.apply_snapshot(self.rover_simulation.fetch_telemetry())
+
+        # Stop the rover when a new survivor was found
+        if found_survivor:
+            self.rover_simulation.stop_rover()
+        return ok
+
+    def apply_snapshot(self, snapshot):
+        """Apply a telemetry snapshot; returns (ok, whether a new survivor was found)"""
+        if self.stop_requested or self.rover_simulation.cancelled:
+            # The stop abandoned the fetch, so missing data here is expected, not an error
+            return False, False
+        was_delivering_aid = self.is_delivering_aid
+        status_ok = self.update_rover_status(snapshot["status"])
+        sensor_ok = self.update_sensor_data(snapshot["sensor_data"])
+        self.observe_snapshot(snapshot)
+        return status_ok and sensor_ok, self.is_delivering_aid and not was_delivering_aid
+
+    def update_rover_status(self, status_data):
+        """Update rover status from a telemetry snapshot's StatusFrame"""
+        rover_data = self.rover_data
+        rover_simulation = self.rover_simulation
+
+        if not rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        if status_data is None:
+            self.add_log_entry("Failed to get rover status.", "error")
+            return False
+
+        try:
+            # Update the rover status in the simulation
+            rover_simulation.apply_status(status_data)
+
+            # Copy data from simulation to our data structure
+            rover_data["status"] = rover_simulation.status
+            rover_data["battery"] = rover_simulation.battery
+            rover_data["position"] = rover_simulation.position
+
+            # Update path history if position changed
+            current_pos = [rover_simulation.position["x"], rover_simulation.position["y"]]
+            self.record_position(current_pos)
+
+            # Emit the updated data
+            self.emit_status()
+            return True
+        except Exception as e:
+            self.add_log_entry(f"Error updating rover status: {str(e)}", "error")
+            return False
+
+    def update_sensor_data(self, frame):
+        """Update sensor data from a telemetry snapshot's SensorFrame"""
+        rover_data = self.rover_data
+
+        if not self.rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        if frame is None:
+            self.add_log_entry("Failed to get sensor data.", "error")
+            return False
+
+        try:
+            # Update the sensor data in the simulation
+            self.rover_simulation.apply_sensor_data(frame)
+
+            # The decoded JSON is passed on as is; the frame's fields are read below
+            data = frame.raw
+            rover_data["sensor_data"] = data
+
+            # Update position and battery from sensor data (the frame caps battery at 100%)
+            pos = frame.position
+            rover_data["position"] = pos.as_dict()
+            rover_data["battery"] = frame.battery.level
+
+            # Check for RFID tag detection (simulating survivor found)
+            if frame.rfid.tag_detected:
+                # Simulate finding a survivor at current position
+                current_pos = pos.as_list()
+                if not self.is_delivering_aid and self.survivor_index.add(current_pos):
+                    rover_data["survivors_found"].append(current_pos)
+                    self.record("survivor", {"position": current_pos})
+                    self.add_log_entry(f"Survivor found at position X={pos.x}, Y={pos.y}!", "success")
+
+                    # Start aid delivery process (the telemetry stage stops the rover)
+                    rover_data["status"] = "Delivering Aid"
+                    self.emit_status()
+                    self.add_log_entry("Rover stopped. Delivering aid to survivor...", "info")
+
+                    # Aid is delivered when this timer fires
+                    self.timers.schedule(AID_DELIVERY_TIME, "aid_delivery", self.finish_aid_delivery)
+
+            # Update path history if position changed
+            current_pos = pos.as_list()
+            if self.record_position(current_pos):
+                # For debugging
+                self.add_log_entry(f"Position updated: X={pos.x}, Y={pos.y}", "info")
+
+            # Emit the updated data
+            self.stage.publish('sensor_update', data)
+            self.record("sensor", data)
+
+            # Send map update with current position and new path points and survivors
+            self.emit_map_update(current_pos)
+
+            return True
+        except Exception as e:
+            self.add_log_entry(f"Error updating sensor data: {str(e)}", "error")
+            return False
+
+    def move_rover(self, direction=None):
+        """Move the rover in a specified or random direction"""
+        if not self.rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        try:
+            # Move the rover in the simulation
+            return self.moved(self.rover_simulation.move_rover(direction))
+        except Exception as e:
+            self.add_log_entry(f"Error moving rover: {str(e)}", "error")
+            return False
+
+    def moved(self, success):
+        """Record the result of a move command; returns success"""
+        if success:
+            self.record_movement()
+        return bool(success)
+
+    def record_movement(self):
+        """Record the last successful move and notify clients"""
+        rover_data = self.rover_data
+        last_direction = self.rover_simulation.last_direction
+
+        # Add to movement history
+        move = {
+            "direction": last_direction,
+            "timestamp": datetime.now().strftime("%H:%M:%S")
+        }
+        rover_data["movement_history"].append(move)
+        self.record("move", move)
+
+        # Emit movement update
+        self.stage.publish('movement_update', self.build_movement_update, dedupe=False)
+
+        # Update map with new direction
+        self.emit_map_update([rover_data["position"]["x"], rover_data["position"]["y"]], last_direction)
+
+
+    def build_movement_update(self):
+        """movement_update with the moves recorded since the last one"""
+        history = self.rover_data["movement_history"]
+        new_moves = history.since(self._movement_sent)
+        self._movement_sent = history.total
+        if not new_moves:
+            return None
+        return {"direction": new_moves[-1]["direction"], "history": new_moves}
+
+
+class AsyncRoverMission(RoverMission):
+    """RoverMission driven by an AsyncRoverSimulation on an event loop"""
+
+    _loop = None  # Set by run(); request_stop() reaches the loop through it
+    _current = None  # Task of the wake() in progress
+
+    async def start(self):
+        """Start a backend session and take the first telemetry snapshot"""
+        if not self.session_started(await self.rover_simulation.start_session()):
+            return False
+
+        # Initial status update
+        with self.update():
+            await self.update_telemetry()
+        return True
+
+    async def shutdown(self):
+        """Mark the mission as finished, then stop the rover and close its connections"""
+        self.running = False
+        self.add_log_entry("Simulation stopped", "warning")
+        close_rover_data(self.rover_data)
+        # As in RoverMission.shutdown, idle doesn't wait for the stop's round trip
+        self.mark_idle()
+        if self.rover_simulation:
+            await self.rover_simulation.stop_rover()
+            await self.rover_simulation.close()
+
+    def interrupt(self):
+        # Called from other threads: wake the loop and cancel the current wake()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._interrupt_loop)
+
+    def _interrupt_loop(self):
+        self._stop_event.set()
+        if self._current is not None:
+            self._current.cancel()  # Aborts in-flight aiohttp requests
+
+    async def run(self):
+        """Autonomous rover simulation loop"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        try:
+            if not await self.start():
+                return
+
+            while self.running:
+                self._current = asyncio.ensure_future(self.wake())
+                try:
+                    await self._current
+                except asyncio.CancelledError:
+                    if self.running:
+                        raise
+                    break
+                finally:
+                    self._current = None
+
+                # Wait until the next poll or timer is due, or a stop is requested
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), self.next_interval())
+                except asyncio.TimeoutError:
+                    pass
+
+        except Exception as e:
+            self.add_log_entry(f"Simulation error: {str(e)}", "error")
+        finally:
+            # Stop the rover before exiting
+            await self.shutdown()
+
+    async def wake(self):
+        """Async counterpart of RoverMission.wake"""
+        if time.monotonic() >= self._next_poll:
+            await self.tick()
+            return True
+        with self.update():
+            self.timers.run_due()
+        return False
+
+    async def tick(self):
+        """Fire due timers, run one step and send the Socket.IO events, coalesced, at the end"""
+        with self.update():
+            self.timers.run_due()
+            await self.step()
+        self.poll_in(self.poll_interval())
+
+    async def step(self):
+        """Run one step of the async simulation loop"""
+        await self.update_telemetry()
+        if self.stop_requested:
+            return
+
+        for command in self.decide():
+            if self.stop_requested:
+                break
+            await self.perform(command)
+
+    async def perform(self, command):
+        """Async counterpart of RoverMission.perform"""
+        if command == "move":
+            await self.move_rover()
+        elif command == "charge":
+            await self.rover_simulation.charge_rover()
+        else:
+            await self.rover_simulation.stop_rover()
+
+    async def update_telemetry(self):
+        """Async counterpart of RoverMission.update_telemetry"""
+        if not self.rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        ok, found_survivor = self.apply_snapshot(await self.rover_simulation.fetch_telemetry())
+        if found_survivor:
+            await self.rover_simulation.stop_rover()
+        return ok
+
+    async def move_rover(self, direction=None):
+        """Async counterpart of RoverMission.move_rover"""
+        if not self.rover_simulation:
+            self.add_log_entry("No active simulation.", "error")
+            return False
+
+        try:
+            return self.moved(await self.rover_simulation.move_rover(direction))
+        except Exception as e:
+            self.add_log_entry(f"Error moving rover: {str(e)}", "error")
+            return False
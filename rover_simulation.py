@@ -1,24 +1,29 @@
-import requests
 import json
 import time
 from datetime import datetime
 import random
 from colorama import init, Fore, Style
+from config import BASE_URL
+from rover_transport import get_transport, CancelToken, RequestCancelled
+from tick_scheduler import TickScheduler
+from command_outbox import CommandOutbox
+from rover_frames import StatusFrame, SensorFrame, FrameError
 
 # Initialize colorama for colored output
 init(autoreset=True)
 
-# Base URL for the API
-BASE_URL = "https://roverdata2-production.up.railway.app"
 
 class RoverSimulation:
-    def __init__(self):
+    def __init__(self, transport=None, base_url=None):
+        self.transport = transport if transport else get_transport()
+        self.base_url = base_url if base_url else BASE_URL
         self.session_id = None
         self.battery = 0
         self.position = {"x": 0, "y": 0}
         self.status = "idle"
         self.last_direction = None
         self.movement_count = 0
+        self.rfid_detected = False
         
         # Battery thresholds
         self.RECHARGE_START = 5  # Start recharging at 5%
@@ -27,6 +32,15 @@ class RoverSimulation:
         
         # Movement directions
         self.directions = ["forward", "backward", "left", "right"]
+        
+        # Picks the delay between polls from the rover's state
+        self.scheduler = TickScheduler(charge_target=self.RECHARGE_STOP)
+        
+        # Moves coalesce; stop and charge jump ahead of them
+        self.outbox = CommandOutbox()
+        
+        # Cancelled by cancel() when the simulation is being stopped
+        self.cancel_token = CancelToken()
     
     def print_status(self):
         """Print the current rover status with formatting"""
@@ -56,9 +70,9 @@ class RoverSimulation:
         """Start a new session and get session ID"""
         print(f"{Fore.CYAN}{Style.BRIGHT}Starting new rover session...{Style.RESET_ALL}")
         
-        url = f"{BASE_URL}/api/session/start"
+        url = f"{self.base_url}/api/session/start"
         try:
-            response = requests.post(url)
+            response = self.transport.post(url)
             if response.status_code == 200:
                 data = response.json()
                 self.session_id = data.get("session_id")
@@ -72,6 +86,46 @@ class RoverSimulation:
             print(f"{Fore.RED}Error starting session: {str(e)}{Style.RESET_ALL}")
             return False
     
+    def apply_status(self, frame):
+        """Apply a StatusFrame to the local rover state"""
+        self.status = frame.status
+        self.battery = frame.battery
+        self.position = frame.position.as_dict()
+    
+    def apply_sensor_data(self, frame):
+        """Apply a SensorFrame to the local rover state"""
+        # Update position and battery from sensor data
+        self.position = frame.position.as_dict()
+        self.battery = frame.battery.level
+        self.rfid_detected = frame.rfid.tag_detected
+    
+    def apply_charging(self):
+        """Record that the rover has started charging"""
+        self.status = "Charging"
+        self.last_direction = None
+    
+    def apply_move(self, direction):
+        """Record a successful move command"""
+        self.movement_count += 1
+        self.last_direction = direction
+        self.status = f"Moving {direction}"
+    
+    def apply_stop(self):
+        """Record a successful stop command"""
+        self.status = "Idle"
+        self.last_direction = None
+    
+    def choose_direction(self, direction=None):
+        """Return the direction to move in, or None if the rover may not move"""
+        # If charging and battery not high enough, don't move
+        if self.status.lower() == "charging" and self.battery < self.RECHARGE_STOP:
+            return None
+        
+        # Choose a random direction if none specified
+        if direction is None:
+            direction = random.choice(self.directions)
+        return direction
+    
     def update_status(self):
         """Update rover status from the API"""
         if not self.session_id:
@@ -79,17 +133,13 @@ class RoverSimulation:
             return False
         
         # Get rover status
-        url = f"{BASE_URL}/api/rover/status"
+        url = f"{self.base_url}/api/rover/status"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                data = response.json()
-                self.status = data.get("status", "Unknown")
-                self.battery = data.get("battery", 0)
-                coords = data.get("coordinates", [0, 0])
-                self.position = {"x": coords[0], "y": coords[1]}
+                self.apply_status(StatusFrame.decode(response.content))
                 return True
             else:
                 print(f"{Fore.RED}Failed to get rover status. Status code: {response.status_code}{Style.RESET_ALL}")
@@ -103,40 +153,96 @@ class RoverSimulation:
         if not self.session_id:
             return False
         
-        url = f"{BASE_URL}/api/rover/sensor-data"
+        url = f"{self.base_url}/api/rover/sensor-data"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.get(url, params=params)
+            response = self.transport.get(url, params=params)
             if response.status_code == 200:
-                data = response.json()
-                
-                # Update position and battery from sensor data
-                pos = data.get("position", {"x": 0, "y": 0})
-                self.position = {"x": pos["x"], "y": pos["y"]}
-                self.battery = data.get("battery_level", 0)
-                
+                self.apply_sensor_data(SensorFrame.decode(response.content))
                 return True
             else:
                 return False
         except Exception:
             return False
     
+    def cancel(self):
+        """Abandon in-flight telemetry and command waits; queued stops still go out"""
+        self.cancel_token.cancel()
+        self.outbox.cancel_moves()
+    
+    @property
+    def cancelled(self):
+        return self.cancel_token.cancelled
+    
+    def close(self):
+        """Send any commands still queued, then refuse new ones"""
+        self.outbox.close()
+    
+    def fetch_telemetry(self):
+        """Fetch status and sensor data once each, in parallel
+        
+        Returns a dict with the decoded "status" (StatusFrame) and
+        "sensor_data" (SensorFrame). Either value is None if that request
+        failed or its body was not a valid frame.
+        """
+        snapshot = {"status": None, "sensor_data": None}
+        if not self.session_id:
+            print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
+            return snapshot
+        
+        params = {"session_id": self.session_id}
+        
+        try:
+            status_response, sensor_response = self.transport.get_many([
+                (f"{self.base_url}/api/rover/status", params),
+                (f"{self.base_url}/api/rover/sensor-data", params)
+            ], cancel=self.cancel_token)
+            
+            if status_response.status_code == 200:
+                snapshot["status"] = self.decode_frame(StatusFrame, status_response, "rover status")
+            else:
+                print(f"{Fore.RED}Failed to get rover status. Status code: {status_response.status_code}{Style.RESET_ALL}")
+            
+            if sensor_response.status_code == 200:
+                snapshot["sensor_data"] = self.decode_frame(SensorFrame, sensor_response, "sensor data")
+            else:
+                print(f"{Fore.RED}Failed to get sensor data. Status code: {sensor_response.status_code}{Style.RESET_ALL}")
+        except RequestCancelled:
+            pass
+        except Exception as e:
+            print(f"{Fore.RED}Error fetching telemetry: {str(e)}{Style.RESET_ALL}")
+        
+        return snapshot
+    
+    def decode_frame(self, frame_type, response, name):
+        """Decode a response into frame_type, or print why not and return None"""
+        try:
+            return frame_type.decode(response.content)
+        except FrameError as e:
+            print(f"{Fore.RED}Invalid {name}: {str(e)}{Style.RESET_ALL}")
+            return None
+    
     def charge_rover(self):
         """Charge the rover"""
         if not self.session_id:
             print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
             return False
         
-        url = f"{BASE_URL}/api/rover/charge"
+        if self.cancelled:
+            return False
+        return bool(self.outbox.submit("charge", self.post_charge).wait(cancel=self.cancel_token))
+    
+    def post_charge(self):
+        """POST a charge command (runs on the outbox's priority lane)"""
+        url = f"{self.base_url}/api/rover/charge"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 print(f"{Fore.GREEN}Started charging rover{Style.RESET_ALL}")
-                self.status = "Charging"
-                self.last_direction = None
+                self.apply_charging()
                 return True
             else:
                 print(f"{Fore.RED}Failed to charge rover. Status code: {response.status_code}{Style.RESET_ALL}")
@@ -151,23 +257,22 @@ class RoverSimulation:
             print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
             return False
         
-        # If charging and battery not high enough, don't move
-        if self.status.lower() == "charging" and self.battery < self.RECHARGE_STOP:
+        direction = self.choose_direction(direction)
+        if direction is None or self.cancelled:
             return False
         
-        # Choose a random direction if none specified
-        if direction is None:
-            direction = random.choice(self.directions)
-        
-        url = f"{BASE_URL}/api/rover/move"
+        # False if the move failed or a newer command replaced it before it was sent
+        return bool(self.outbox.submit("move", self.post_move, direction).wait())
+    
+    def post_move(self, direction):
+        """POST a move command (runs on the outbox's move lane)"""
+        url = f"{self.base_url}/api/rover/move"
         params = {"session_id": self.session_id, "direction": direction}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
-                self.movement_count += 1
-                self.last_direction = direction
-                self.status = f"Moving {direction}"
+                self.apply_move(direction)
                 print(f"{Fore.BLUE}Moving rover {direction}{Style.RESET_ALL}")
                 return True
             else:
@@ -177,21 +282,30 @@ class RoverSimulation:
             print(f"{Fore.RED}Error moving rover: {str(e)}{Style.RESET_ALL}")
             return False
     
-    def stop_rover(self):
-        """Stop the rover"""
+    def stop_rover(self, wait=True):
+        """Stop the rover, ahead of any move still waiting to be sent
+        
+        With wait=False the stop is only queued (on the priority lane) and
+        True is returned right away. After cancel() the wait ends at once too,
+        returning False, but the stop is still sent.
+        """
         if not self.session_id:
             print(f"{Fore.RED}No active session.{Style.RESET_ALL}")
             return False
         
-        url = f"{BASE_URL}/api/rover/stop"
+        ticket = self.outbox.submit("stop", self.post_stop)
+        return True if not wait else bool(ticket.wait(cancel=self.cancel_token))
+    
+    def post_stop(self):
+        """POST a stop command (runs on the outbox's priority lane)"""
+        url = f"{self.base_url}/api/rover/stop"
         params = {"session_id": self.session_id}
         
         try:
-            response = requests.post(url, params=params)
+            response = self.transport.post(url, params=params)
             if response.status_code == 200:
                 print(f"{Fore.GREEN}Rover stopped{Style.RESET_ALL}")
-                self.status = "Idle"
-                self.last_direction = None
+                self.apply_stop()
                 return True
             else:
                 print(f"{Fore.RED}Failed to stop rover. Status code: {response.status_code}{Style.RESET_ALL}")
@@ -247,8 +361,10 @@ class RoverSimulation:
                     # Move in a random direction
                     self.move_rover()
                 
-                # Sleep to simulate real-time operation
-                time.sleep(2)
+                # Wait until the scheduler's next poll time
+                charging = self.status.lower() == "charging"
+                self.scheduler.observe(self.battery, charging, self.rfid_detected)
+                time.sleep(self.scheduler.next_interval(self.battery, charging, self.last_direction is not None))
                 
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}Simulation stopped by user.{Style.RESET_ALL}")
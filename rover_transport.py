@@ -0,0 +1,181 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Per-endpoint (connect, read) timeouts in seconds
+ENDPOINT_TIMEOUTS = {
+    'session/start': (3.05, 10),
+    'status': (3.05, 5),
+    'sensor-data': (3.05, 5),
+    'move': (3.05, 5),
+    'stop': (3.05, 3),
+    'charge': (3.05, 5)
+}
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class RequestCancelled(requests.exceptions.RequestException):
+    """The caller stopped waiting for a response because its CancelToken was cancelled"""
+
+
+class CancelToken:
+    """Lets another thread abandon the requests a worker is waiting on
+
+    cancel() wakes every wait registered with watch(). Requests already on
+    the wire finish in the pool and their responses are dropped.
+    """
+
+    def __init__(self):
+        self._cancelled = False
+        self._waiters = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            waiters = list(self._waiters)
+        for event in waiters:
+            event.set()
+
+    @contextmanager
+    def watch(self, event):
+        """Set event if the token is cancelled while the block runs"""
+        with self._lock:
+            self._waiters.add(event)
+            if self._cancelled:
+                event.set()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._waiters.discard(event)
+
+
+class RoverTransport:
+    """Keep-alive HTTP transport shared by every rover API client"""
+
+    def __init__(self, pool_connections=4, pool_maxsize=16, timeouts=None):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+
+        # One connection pool per host, reused across all calls
+        self.pool_maxsize = pool_maxsize
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+        self.timeouts = dict(ENDPOINT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self._executor = None
+
+    def timeout_for(self, url):
+        """Return the (connect, read) timeout for the endpoint behind a URL"""
+        path = urlparse(url).path.rstrip('/')
+        for endpoint, timeout in self.timeouts.items():
+            if path.endswith('/' + endpoint):
+                return timeout
+        return DEFAULT_TIMEOUT
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the pooled session"""
+        kwargs.setdefault('timeout', self.timeout_for(url))
+        with self._lock:
+            self.request_count += 1
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def get_many(self, calls, cancel=None):
+        """Send several GET requests at once and return responses in order
+
+        Each call is a (url, params) tuple. Exceptions are re-raised from the
+        first failing call. If cancel (a CancelToken) is cancelled before all
+        responses arrive, RequestCancelled is raised right away.
+        """
+        if cancel is not None and cancel.cancelled:
+            raise RequestCancelled("Request cancelled")
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_maxsize,
+                                                    thread_name_prefix='rover-transport')
+            executor = self._executor
+
+        futures = [executor.submit(self.get, url, params=params) for url, params in calls]
+        if cancel is not None:
+            done = threading.Event()
+            remaining = [len(futures)]
+            remaining_lock = threading.Lock()
+
+            def finished(_):
+                with remaining_lock:
+                    remaining[0] -= 1
+                    if not remaining[0]:
+                        done.set()
+
+            for future in futures:
+                future.add_done_callback(finished)
+            with cancel.watch(done):
+                done.wait()
+            if cancel.cancelled:
+                for future in futures:
+                    future.cancel()
+                raise RequestCancelled("Request cancelled")
+        return [future.result() for future in futures]
+
+    def connection_stats(self):
+        """Return counters for new vs. reused connections"""
+        new_connections = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                new_connections += pool.num_connections
+
+        with self._lock:
+            request_count = self.request_count
+
+        return {
+            'requests': request_count,
+            'new_connections': new_connections,
+            'reused_connections': max(0, request_count - new_connections)
+        }
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.session.close()
+
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+def get_transport():
+    """Return the process-wide shared transport"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = RoverTransport()
+        return _default_transport
@@ -8,6 +8,7 @@ const clearLogBtn = document.getElementById('clearLogBtn');
 const roverStatus = document.getElementById('roverStatus');
 const batteryLevel = document.getElementById('batteryLevel');
 const roverPosition = document.getElementById('roverPosition');
+const coverageLevel = document.getElementById('coverageLevel');
 const sessionId = document.getElementById('sessionId');
 const accelX = document.getElementById('accelX');
 const accelY = document.getElementById('accelY');
@@ -43,7 +44,14 @@ let roverState = {
     currentDirection: 'forward',
     path: [],
     survivors: [],
-    survivorsCount: 0
+    survivorsCount: 0,
+    // map_update delta tracking (see RoverMission.emit_map_update)
+    mapEpoch: null,
+    mapSeq: 0,
+    pathTotal: 0,
+    survivorsTotal: 0,
+    resyncing: false,
+    pendingMapUpdates: []
 };
 
 // Initialize the path visualization
@@ -231,6 +239,21 @@ function drawPathVisualization() {
     }
 }
 
+// Append path points received from the server
+function appendPathPoints(points) {
+    points.forEach(point => {
+        const last = roverState.path[roverState.path.length - 1];
+        if (!last || last[0] !== point[0] || last[1] !== point[1]) {
+            roverState.path.push([...point]);
+        }
+    });
+    
+    // Limit the path length to avoid performance issues
+    if (roverState.path.length > pathSettings.maxPositions) {
+        roverState.path.splice(0, roverState.path.length - pathSettings.maxPositions);
+    }
+}
+
 // Update path with new position
 function updatePath(position) {
     if (!position || position.length !== 2) return;
@@ -426,6 +449,11 @@ function updateStatus(data) {
         roverPosition.textContent = `X=${data.position.x}, Y=${data.position.y}`;
     }
     
+    // Update explored-area coverage
+    if (data.coverage !== undefined) {
+        coverageLevel.textContent = `${data.coverage}%`;
+    }
+    
     // Update session ID if available
     if (data.session_id) {
         sessionId.textContent = data.session_id;
@@ -469,24 +497,7 @@ function updateSurvivors(survivors) {
     
     // Check if we have new survivors
     if (survivors.length > roverState.survivors.length) {
-        // Get the new survivors
-        const newSurvivors = survivors.slice(roverState.survivors.length);
-        
-        // Update the count
-        roverState.survivorsCount = survivors.length;
-        survivorsCount.textContent = roverState.survivorsCount;
-        
-        // Add animation effect to the counter
-        survivorsCount.classList.add('survivor-found');
-        setTimeout(() => {
-            survivorsCount.classList.remove('survivor-found');
-        }, 1000);
-        
-        // Add each new survivor to the list
-        const timestamp = new Date().toLocaleTimeString();
-        newSurvivors.forEach(position => {
-            addSurvivor(position, timestamp);
-        });
+        appendSurvivors(survivors.slice(roverState.survivors.length));
     }
     
     // Update the survivors state
@@ -496,6 +507,120 @@ function updateSurvivors(survivors) {
     drawPathVisualization();
 }
 
+// Add newly found survivors to the state, counter and list
+function appendSurvivors(newSurvivors) {
+    if (newSurvivors.length === 0) return;
+    
+    roverState.survivors.push(...newSurvivors);
+    
+    // Update the count
+    roverState.survivorsCount += newSurvivors.length;
+    survivorsCount.textContent = roverState.survivorsCount;
+    
+    // Add animation effect to the counter
+    survivorsCount.classList.add('survivor-found');
+    setTimeout(() => {
+        survivorsCount.classList.remove('survivor-found');
+    }, 1000);
+    
+    // Add each new survivor to the list
+    const timestamp = new Date().toLocaleTimeString();
+    newSurvivors.forEach(position => {
+        addSurvivor(position, timestamp);
+    });
+}
+
+// Items of a delta not applied yet, using the server's lifetime totals
+function unseenItems(items, total, seenTotal) {
+    const count = total - seenTotal;
+    if (count <= 0) return [];
+    return items.slice(Math.max(0, items.length - count));
+}
+
+// Apply one in-order map_update delta
+function applyMapDelta(data) {
+    roverState.mapSeq = data.seq;
+    
+    appendPathPoints(unseenItems(data.path || [], data.path_total, roverState.pathTotal));
+    roverState.pathTotal = Math.max(roverState.pathTotal, data.path_total);
+    
+    appendSurvivors(unseenItems(data.survivors || [], data.survivors_total, roverState.survivorsTotal));
+    roverState.survivorsTotal = Math.max(roverState.survivorsTotal, data.survivors_total);
+    
+    // Update direction
+    if (data.direction) {
+        roverState.currentDirection = data.direction;
+    }
+    
+    // Update rover position (also redraws the path visualization)
+    if (data.position) {
+        updatePath(data.position);
+    } else {
+        drawPathVisualization();
+    }
+}
+
+// Apply a map_update, resyncing from the server when one was missed
+function handleMapUpdate(data) {
+    if (roverState.resyncing) {
+        roverState.pendingMapUpdates.push(data);
+        return;
+    }
+    
+    if (data.epoch === roverState.mapEpoch && data.seq <= roverState.mapSeq) {
+        return;  // Already covered by the last resync
+    }
+    
+    if (data.epoch !== roverState.mapEpoch || data.seq !== roverState.mapSeq + 1) {
+        console.log(`Map update gap (have ${roverState.mapSeq}, got ${data.seq}), resyncing`);
+        roverState.pendingMapUpdates.push(data);
+        resyncMap();
+        return;
+    }
+    
+    applyMapDelta(data);
+}
+
+// Replace the map state with the server's full map
+function resyncMap() {
+    roverState.resyncing = true;
+    
+    return fetch('/api/map-state')
+        .then(response => response.json())
+        .then(state => {
+            const newMission = state.epoch !== roverState.mapEpoch;
+            roverState.mapEpoch = state.epoch;
+            roverState.mapSeq = state.seq;
+            
+            roverState.path = [];
+            appendPathPoints(state.path);
+            roverState.pathTotal = state.path_total;
+            
+            if (newMission) {
+                roverState.survivors = [];
+                roverState.survivorsCount = 0;
+            }
+            updateSurvivors(state.survivors);
+            roverState.survivorsTotal = state.survivors_total;
+            
+            if (state.path.length > 0) {
+                updatePath(state.position);
+            }
+            
+            // Apply the deltas that arrived while fetching
+            const pending = roverState.pendingMapUpdates;
+            roverState.pendingMapUpdates = [];
+            roverState.resyncing = false;
+            pending.sort((a, b) => a.seq - b.seq).forEach(handleMapUpdate);
+        })
+        .catch(error => {
+            // Drop queued deltas; the next map_update triggers another resync
+            roverState.pendingMapUpdates = [];
+            roverState.resyncing = false;
+            console.error('Error resyncing map:', error);
+        });
+}
+
 // Socket.IO event handlers
 socket.on('connect', () => {
     console.log('Connected to server');
@@ -525,36 +650,24 @@ socket.on('sensor_update', (data) => {
     updateSensors(data);
 });
 
+// history holds the moves made since the previous movement_update
 socket.on('movement_update', (data) => {
     console.log('Movement update:', data);
-    if (data && data.direction && data.history && data.history.length > 0) {
-        addMovementItem(data.direction, data.history[data.history.length - 1].timestamp);
+    if (data && data.history) {
+        data.history.forEach(move => addMovementItem(move.direction, move.timestamp));
     }
 });
 
-socket.on('log_update', (entry) => {
-    console.log('Log update:', entry);
-    addLogEntry(entry);
+// Log entries arrive batched, one list per simulation tick
+socket.on('log_update', (entries) => {
+    console.log('Log update:', entries);
+    [].concat(entries).forEach(addLogEntry);
 });
 
 socket.on('map_update', (data) => {
     console.log('Map update received:', data);
     if (data) {
-        // Update rover position
-        if (data.position) {
-            updatePath(data.position);
-        }
-        
-        // Update survivors
-        if (data.survivors) {
-            updateSurvivors(data.survivors);
-        }
-        
-        // Update direction
-        if (data.direction) {
-            roverState.currentDirection = data.direction;
-            drawPathVisualization();
-        }
+        handleMapUpdate(data);
     }
 });
 
@@ -671,8 +784,11 @@ document.addEventListener('DOMContentLoaded', () => {
         level: 'info'
     });
     
-    // Fetch initial rover data
-    fetch('/api/rover-data')
+    // Fetch the initial map, then apply map_update deltas on top of it
+    resyncMap();
+    
+    // Fetch initial rover data (the map comes from resyncMap, so skip the histories)
+    fetch('/api/rover-data?fields=status,battery,position,session_id,sensor_data,coverage')
         .then(response => response.json())
         .then(data => {
             console.log('Initial data:', data);
@@ -680,9 +796,6 @@ document.addEventListener('DOMContentLoaded', () => {
             if (data.sensor_data) {
                 updateSensors(data.sensor_data);
             }
-            if (data.survivors_found && data.survivors_found.length > 0) {
-                updateSurvivors(data.survivors_found);
-            }
         })
         .catch(error => {
             console.error('Error fetching initial data:', error);
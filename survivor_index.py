@@ -0,0 +1,62 @@
+import math
+import threading
+
+
+class SurvivorIndex:
+    """Uniform-grid spatial index of survivor positions
+
+    Points are bucketed by grid cell, so a radius lookup only checks the
+    cells the circle overlaps. add() treats a tag within `radius` of a known
+    survivor as that same survivor.
+    """
+
+    def __init__(self, radius=0.5, cell_size=None):
+        self.radius = radius
+        self.cell_size = cell_size or max(radius, 1.0)
+        self.cells = {}
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _within(self, x, y, r):
+        """Yield (distance, point) for indexed points within r of (x, y)"""
+        span = int(math.ceil(r / self.cell_size))
+        if (2 * span + 1) ** 2 > len(self.cells):
+            # Wide query: visiting the occupied cells is cheaper than the grid
+            buckets = self.cells.values()
+        else:
+            cx, cy = self._cell(x, y)
+            buckets = (self.cells.get((i, j), ()) for i in range(cx - span, cx + span + 1)
+                       for j in range(cy - span, cy + span + 1))
+        for bucket in buckets:
+            for point in bucket:
+                distance = math.hypot(point[0] - x, point[1] - y)
+                if distance <= r:
+                    yield distance, point
+
+    def add(self, point):
+        """Index a survivor; return False if one is already within radius"""
+        x, y = point[0], point[1]
+        with self._lock:
+            for _ in self._within(x, y, self.radius):
+                return False
+            self.cells.setdefault(self._cell(x, y), []).append([x, y])
+            self.count += 1
+        return True
+
+    def near(self, x, y, r):
+        """Survivors within r of (x, y), nearest first"""
+        with self._lock:
+            found = sorted(self._within(x, y, r))
+        return [{"position": point, "distance": distance} for distance, point in found]
+
+    def __contains__(self, point):
+        with self._lock:
+            for _ in self._within(point[0], point[1], self.radius):
+                return True
+        return False
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,185 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    mission TEXT NOT NULL,
+    rover_id TEXT,
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_mission_ts ON events (mission, ts);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE TABLE IF NOT EXISTS missions (
+    mission TEXT PRIMARY KEY,
+    rover_id TEXT,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    events INTEGER NOT NULL
+);
+"""
+
+MISSION_UPSERT = """
+INSERT INTO missions (mission, rover_id, start, end, events) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (mission) DO UPDATE SET
+    rover_id = COALESCE(missions.rover_id, excluded.rover_id),
+    start = MIN(missions.start, excluded.start),
+    end = MAX(missions.end, excluded.end),
+    events = missions.events + excluded.events
+"""
+
+EVENT_KINDS = ("status", "sensor", "move", "log", "survivor")
+
+_STOP = object()
+
+
+class TelemetryStore:
+    """Append-only mission telemetry in SQLite (WAL mode)
+
+    record() only enqueues, so it adds no I/O to the tick. A writer thread
+    drains the queue and inserts in batches, one transaction per batch.
+    Reads use their own connection and the (mission, ts) / ts indexes.
+    """
+
+    def __init__(self, path, batch_size=256, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.write_errors = 0
+        self._queue = queue.Queue()
+
+        connection = self._connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        connection.close()
+
+        self._writer = threading.Thread(target=self._run_writer, name='telemetry-writer', daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, mission, kind, payload, rover_id=None, ts=None):
+        """Queue one event for writing"""
+        self._queue.put((mission, rover_id, time.time() if ts is None else ts, kind, payload))
+
+    def _run_writer(self):
+        connection = self._connect()
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            taken = 1
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                    taken += 1
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(connection, batch)
+            # Mark done only after the write, so flush() waits for it
+            for _ in range(taken):
+                self._queue.task_done()
+        connection.close()
+
+    def _write(self, connection, batch):
+        rows = [(mission, rover_id, ts, kind, json.dumps(payload)) for mission, rover_id, ts, kind, payload in batch]
+        spans = {}
+        for mission, rover_id, ts, _, _ in batch:
+            span = spans.setdefault(mission, [rover_id, ts, ts, 0])
+            span[1], span[2], span[3] = min(span[1], ts), max(span[2], ts), span[3] + 1
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO events (mission, rover_id, ts, kind, payload) VALUES (?, ?, ?, ?, ?)", rows)
+                connection.executemany(MISSION_UPSERT, [(mission, *span) for mission, span in spans.items()])
+            self.written += len(rows)
+        except sqlite3.Error as e:
+            self.write_errors += len(rows)
+            print(f"Telemetry write failed ({len(rows)} events): {e}")
+
+    def flush(self):
+        """Block until every queued event has been written"""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    def read(self, mission=None, start=None, end=None, kinds=None, limit=None):
+        """Events in time order, filtered by mission, [start, end) time range and kinds"""
+        clauses, params = [], []
+        if mission is not None:
+            clauses.append("mission = ?")
+            params.append(mission)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        if kinds:
+            clauses.append(f"kind IN ({', '.join('?' for _ in kinds)})")
+            params.extend(kinds)
+        sql = "SELECT id, mission, rover_id, ts, kind, payload FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+        return [
+            {"id": row[0], "mission": row[1], "rover_id": row[2], "ts": row[3], "kind": row[4],
+             "payload": json.loads(row[5])}
+            for row in rows
+        ]
+
+    def mission(self, mission):
+        """Time span and event count of one recorded mission, or None"""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT mission, rover_id, start, end, events FROM missions WHERE mission = ?", (mission,)).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        return {"mission": row[0], "rover_id": row[1], "start": row[2], "end": row[3], "events": row[4]}
+
+    def missions(self):
+        """Recorded missions with their time span and event count, newest first"""
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT mission, rover_id, start, end, events FROM missions ORDER BY start DESC").fetchall()
+        finally:
+            connection.close()
+        return [
+            {"mission": row[0], "rover_id": row[1], "start": row[2], "end": row[3], "events": row[4]}
+            for row in rows
+        ]
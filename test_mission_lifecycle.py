@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import rover_mission
+from async_rover_simulation import AsyncRoverSimulation
+from command_outbox import CommandOutbox
+from config import OUTBOX_WORKERS
+from fleet_manager import RoverFleet
+from local_rover_server import serve_in_thread
+from rover_mission import RoverMission, AsyncRoverMission
+from rover_simulation import RoverSimulation
+
+
+class NullSocketIO:
+    def emit(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    monkeypatch.setattr(rover_mission, "SPILL_DIR", "")  # Keep histories in memory
+    server, url = serve_in_thread()
+    yield url
+    server.shutdown()
+
+
+def mission_threads():
+    # Threads a fleet owns; the shared transport and outbox pools outlive them by design
+    return [thread for thread in threading.enumerate() if thread.name.startswith("rover-fleet")]
+
+
+def outbox_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("command-outbox")]
+
+
+def run_and_stop(mission, target):
+    mission.running = True
+    thread = threading.Thread(target=target)
+    thread.start()
+    # Let it tick (and send a move) before stopping it
+    while not mission.rover_data["movement_history"].total and thread.is_alive():
+        mission.wait_idle(0.05)
+    mission.request_stop()
+    assert mission.wait_idle(5)
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_mission_start_stop_leaves_no_threads(base_url):
+    for _ in range(3):
+        mission = RoverMission(RoverSimulation(base_url=base_url), NullSocketIO())
+        run_and_stop(mission, mission.run)
+        assert mission.rover_simulation.outbox.counts["stop"]["acked"] >= 1
+    assert mission_threads() == []
+
+
+def test_async_mission_start_stop_leaves_no_threads(base_url):
+    mission = AsyncRoverMission(AsyncRoverSimulation(base_url=base_url), NullSocketIO())
+    run_and_stop(mission, lambda: asyncio.run(mission.run()))
+    assert mission_threads() == []
+
+
+def test_fleet_rovers_leave_no_threads(base_url):
+    fleet = RoverFleet(NullSocketIO(), max_workers=2, base_url=base_url)
+    rovers = [fleet.start_rover() for _ in range(3)]
+    fleet.stop_rover(rovers[0].rover_id)  # Possibly before its first turn
+    fleet.shutdown()
+    for rover in rovers:
+        assert rover.mission.wait_idle(5)
+    assert fleet.rovers == {}
+    assert mission_threads() == []
+
+
+def test_fleet_rover_that_fails_to_start_is_shut_down():
+    fleet = RoverFleet(NullSocketIO(), max_workers=1, base_url="http://127.0.0.1:9")
+    rover = fleet.start_rover()
+    assert rover.mission.wait_idle(10)
+    fleet.shutdown()
+    assert not rover.mission.running
+    assert fleet.rovers == {}
+
+
+def test_cancel_releases_charge_and_stop_waits():
+    server, url = serve_in_thread(latency_ms=1000)
+    try:
+        simulation = RoverSimulation(base_url=url)
+        simulation.start_session()
+        results = []
+        thread = threading.Thread(target=lambda: results.extend([simulation.charge_rover(), simulation.stop_rover()]))
+        thread.start()
+        thread.join(0.2)  # The charge is now waiting on the 1 s backend
+        simulation.cancel()
+        thread.join(0.5)
+        assert not thread.is_alive()
+        assert results == [False, False]
+        simulation.close()  # The stop is still sent
+        assert simulation.outbox.counts["stop"]["acked"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_outboxes_share_lane_threads():
+    outboxes = [CommandOutbox() for _ in range(3 * OUTBOX_WORKERS)]
+    for outbox in outboxes:
+        outbox.submit("move", lambda: time.sleep(0.01) or True)
+        outbox.submit("stop", lambda: time.sleep(0.01) or True)
+    for outbox in outboxes:
+        outbox.close()
+        assert outbox.counts["stop"]["acked"] >= 1  # Reasserted if it beat the move
+    assert len(outbox_threads()) <= 2 * OUTBOX_WORKERS
@@ -1,9 +1,10 @@
-import requests
 import time
 import json
+from config import BASE_URL
+from rover_transport import get_transport
 
-# Base URL for the API
-BASE_URL = "https://roverdata2-production.up.railway.app"
+# Shared keep-alive transport for all calls
+transport = get_transport()
 
 def print_response(response):
     """Print the response in a formatted way"""
@@ -18,7 +19,7 @@ def print_response(response):
 def start_session():
     url = f"{BASE_URL}/api/session/start"
     print(f"\nStarting a new session: POST {url}")
-    response = requests.post(url)
+    response = transport.post(url)
     print_response(response)
     
     if response.status_code == 200:
@@ -31,7 +32,7 @@ def charge_rover(session_id):
     params = {"session_id": session_id}
     print(f"\nCharging rover: POST {url}")
     print(f"Parameters: {params}")
-    response = requests.post(url, params=params)
+    response = transport.post(url, params=params)
     print_response(response)
 
 # 3. Get rover status
@@ -40,7 +41,7 @@ def get_rover_status(session_id):
     params = {"session_id": session_id}
     print(f"\nGetting rover status: GET {url}")
     print(f"Parameters: {params}")
-    response = requests.get(url, params=params)
+    response = transport.get(url, params=params)
     print_response(response)
 
 # 4. Move rover
@@ -49,7 +50,7 @@ def move_rover(session_id, direction):
     params = {"session_id": session_id, "direction": direction}
     print(f"\nMoving rover {direction}: POST {url}")
     print(f"Parameters: {params}")
-    response = requests.post(url, params=params)
+    response = transport.post(url, params=params)
     print_response(response)
 
 # 5. Get sensor data
@@ -58,7 +59,7 @@ def get_sensor_data(session_id):
     params = {"session_id": session_id}
     print(f"\nGetting sensor data: GET {url}")
     print(f"Parameters: {params}")
-    response = requests.get(url, params=params)
+    response = transport.get(url, params=params)
     print_response(response)
 
 # 6. Stop rover
@@ -67,7 +68,7 @@ def stop_rover(session_id):
     params = {"session_id": session_id}
     print(f"\nStopping rover: POST {url}")
     print(f"Parameters: {params}")
-    response = requests.post(url, params=params)
+    response = transport.post(url, params=params)
     print_response(response)
 
 def main():
@@ -110,6 +111,10 @@ def main():
     
     # Final status check
     get_rover_status(session_id)
+    
+    # Connection reuse summary
+    stats = transport.connection_stats()
+    print(f"\nRequests: {stats['requests']}, new connections: {stats['new_connections']}, reused: {stats['reused_connections']}")
 
 if __name__ == "__main__":
     main()
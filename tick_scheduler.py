@@ -0,0 +1,66 @@
+import time
+
+
+class TickScheduler:
+    """Chooses the delay until the next telemetry poll from the rover's state
+
+    - fast polling shortly after an RFID hit, so survivors are handled quickly
+    - normal polling while moving
+    - slow polling while idle
+    - while charging, one wake-up at the predicted time to reach the charge
+      target, using the charge rate observed so far
+    """
+
+    def __init__(self, fast_interval=0.5, moving_interval=1.0, idle_interval=5.0, default_interval=2.0,
+                 charge_target=80, min_charge_wait=2.0, max_charge_wait=30.0, rfid_window=10.0):
+        self.fast_interval = fast_interval
+        self.moving_interval = moving_interval
+        self.idle_interval = idle_interval
+        self.default_interval = default_interval
+        self.charge_target = charge_target
+        self.min_charge_wait = min_charge_wait
+        self.max_charge_wait = max_charge_wait
+        self.rfid_window = rfid_window
+
+        self.charge_rate = None  # % per second, kept across charge cycles
+        self.last_rfid_time = None
+        self._charge_sample = None
+
+    def observe(self, battery, charging, rfid_detected=False, now=None):
+        """Record one telemetry sample"""
+        now = time.monotonic() if now is None else now
+        if rfid_detected:
+            self.last_rfid_time = now
+
+        if charging:
+            if self._charge_sample is None:
+                self._charge_sample = (now, battery)
+            else:
+                start_time, start_battery = self._charge_sample
+                if battery > start_battery and now > start_time:
+                    self.charge_rate = (battery - start_battery) / (now - start_time)
+        else:
+            self._charge_sample = None
+
+    def charge_eta(self, battery):
+        """Predicted seconds until the charge target, or None if unknown"""
+        if not self.charge_rate:
+            return None
+        return max(0.0, (self.charge_target - battery) / self.charge_rate)
+
+    def next_interval(self, battery, charging, moving, now=None):
+        """Seconds to wait before the next poll"""
+        now = time.monotonic() if now is None else now
+        if charging:
+            eta = self.charge_eta(battery)
+            if eta is None:
+                interval = self.default_interval
+            else:
+                interval = min(max(eta, self.min_charge_wait), self.max_charge_wait)
+        elif self.last_rfid_time is not None and now - self.last_rfid_time < self.rfid_window:
+            interval = self.fast_interval
+        elif moving:
+            interval = self.moving_interval
+        else:
+            interval = self.idle_interval
+        return interval